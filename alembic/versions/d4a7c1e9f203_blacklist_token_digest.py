@@ -0,0 +1,45 @@
+"""blacklist token digest
+
+Revision ID: d4a7c1e9f203
+Revises: b7d41e9c0a62
+Create Date: 2026-10-18 16:05:41.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c1e9f203'
+down_revision: Union[str, None] = 'b7d41e9c0a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DELETE FROM blacklisted_tokens WHERE expires_at <= now() AT TIME ZONE 'utc'")
+    op.add_column('blacklisted_tokens', sa.Column('token_digest', sa.LargeBinary(length=32), nullable=True))
+    op.execute("UPDATE blacklisted_tokens SET token_digest = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column('blacklisted_tokens', 'token_digest', nullable=False)
+    op.drop_index(op.f('ix_blacklisted_tokens_token'), table_name='blacklisted_tokens')
+    op.drop_constraint('blacklisted_tokens_pkey', 'blacklisted_tokens', type_='primary')
+    op.drop_column('blacklisted_tokens', 'token')
+    op.drop_column('blacklisted_tokens', 'id')
+    op.create_primary_key('blacklisted_tokens_pkey', 'blacklisted_tokens', ['token_digest'])
+    op.create_index('ix_blacklisted_tokens_expires_at', 'blacklisted_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Токены по дайджесту не восстановить, поэтому черный список очищается
+    op.execute("DELETE FROM blacklisted_tokens")
+    op.drop_index('ix_blacklisted_tokens_expires_at', table_name='blacklisted_tokens')
+    op.drop_constraint('blacklisted_tokens_pkey', 'blacklisted_tokens', type_='primary')
+    op.drop_column('blacklisted_tokens', 'token_digest')
+    op.add_column('blacklisted_tokens', sa.Column('id', sa.UUID(), nullable=False))
+    op.add_column('blacklisted_tokens', sa.Column('token', sa.String(), nullable=False))
+    op.create_primary_key('blacklisted_tokens_pkey', 'blacklisted_tokens', ['id'])
+    op.create_index(op.f('ix_blacklisted_tokens_token'), 'blacklisted_tokens', ['token'], unique=True)
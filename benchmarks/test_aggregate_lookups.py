@@ -0,0 +1,47 @@
+import time
+from uuid import uuid4
+
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+
+SUBPROJECTS = 50
+STAGES = 50
+MESSAGES = 50
+
+
+def make_project() -> Project:
+    author_id = uuid4()
+    subprojects = []
+    for i in range(SUBPROJECTS):
+        stages = [Stage.create(f"stage-{j}") for j in range(STAGES)]
+        for stage in stages:
+            stage.messages.extend(Message.create(author_id, f"message-{k}") for k in range(MESSAGES))
+        subprojects.append(Subproject.create(f"sub-{i}", stages=stages))
+    return Project.create("bench", subprojects=subprojects)
+
+
+def test_bulk_stage_creation_and_status_changes():
+    project = make_project()
+    subproject_ids = [subproject.id for subproject in project.subprojects]
+
+    started = time.perf_counter()
+    for subproject_id in subproject_ids:
+        for j in range(STAGES):
+            project.add_stage(subproject_id, Stage.create(f"new-stage-{j}"))
+    creation_seconds = time.perf_counter() - started
+
+    stage_ids = [stage.id for subproject in project.subprojects for stage in subproject.stages]
+    started = time.perf_counter()
+    for stage_id in stage_ids:
+        project.change_stage_status(stage_id, StageStatus.COMPLETED)
+    status_seconds = time.perf_counter() - started
+
+    print(
+        f"\n{SUBPROJECTS}x{STAGES}x{MESSAGES}: "
+        f"{len(subproject_ids) * STAGES} stage creations {creation_seconds:.4f}s, "
+        f"{len(stage_ids)} status changes {status_seconds:.4f}s"
+    )
+    assert project.progress == 1.0
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import random
+import time
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy import text
+
+from src.user_service.infrastructure.blacklist_filter import TokenBlacklistFilter
+from src.user_service.infrastructure.db.postgres.repositories.blacklist import BlacklistRepository
+
+ROWS = int(os.getenv("BLACKLIST_BENCHMARK_ROWS", 10_000_000))
+LOOKUPS = 1000
+SWEEP_BATCH = 5000
+# Длина refresh токена того же порядка, что у настоящего JWT
+TOKEN_SQL = "repeat(md5(i::text), 8)"
+
+
+def token(i: int) -> str:
+    return hashlib.md5(str(i).encode()).hexdigest() * 8
+
+
+async def fill(session) -> None:
+    await session.execute(text("DROP TABLE IF EXISTS blacklisted_tokens_legacy"))
+    await session.execute(text("TRUNCATE blacklisted_tokens"))
+    # Прежняя схема: полный JWT в уникальном индексе и UUID первичный ключ
+    await session.execute(
+        text(
+            "CREATE TABLE blacklisted_tokens_legacy (id uuid PRIMARY KEY, token varchar NOT NULL, "
+            "expires_at timestamp NOT NULL, created_at timestamp NOT NULL DEFAULT now(), reason varchar)"
+        )
+    )
+    # Срок жизни размазан на 30 дней назад и вперед: половина строк уже истекла и ждет очистки
+    expires_at = "now() AT TIME ZONE 'utc' + (i % 60 - 30) * interval '1 day'"
+    await session.execute(
+        text(
+            f"INSERT INTO blacklisted_tokens_legacy (id, token, expires_at) "
+            f"SELECT gen_random_uuid(), {TOKEN_SQL}, {expires_at} FROM generate_series(1, :rows) i"
+        ),
+        {"rows": ROWS},
+    )
+    await session.execute(
+        text("CREATE UNIQUE INDEX ix_blacklisted_tokens_legacy_token ON blacklisted_tokens_legacy (token)")
+    )
+    await session.execute(
+        text(
+            f"INSERT INTO blacklisted_tokens (token_digest, expires_at, created_at) "
+            f"SELECT sha256(convert_to({TOKEN_SQL}, 'UTF8')), {expires_at}, now() FROM generate_series(1, :rows) i"
+        ),
+        {"rows": ROWS},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE blacklisted_tokens_legacy"))
+    await session.execute(text("ANALYZE blacklisted_tokens"))
+
+
+async def index_size(session, table: str) -> int:
+    return (await session.execute(text(f"SELECT pg_indexes_size('{table}')"))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_digest_keys_vs_full_token_index(sessionmaker):
+    tokens = [token(random.randint(1, ROWS)) for _ in range(LOOKUPS)] + [f"missing-{i}" for i in range(LOOKUPS)]
+    async with sessionmaker() as session:
+        await fill(session)
+        legacy_size = await index_size(session, "blacklisted_tokens_legacy")
+        digest_size = await index_size(session, "blacklisted_tokens")
+
+        started = time.perf_counter()
+        for value in tokens:
+            stmt = text("SELECT 1 FROM blacklisted_tokens_legacy WHERE token = :token LIMIT 1")
+            await session.execute(stmt, {"token": value})
+        legacy_lookup = (time.perf_counter() - started) / len(tokens)
+
+        # Не построенный фильтр пропускает все проверки в БД: замеряется сам поиск по индексу
+        repository = BlacklistRepository(session, TokenBlacklistFilter())
+        started = time.perf_counter()
+        found = [await repository.exists(value) for value in tokens]
+        digest_lookup = (time.perf_counter() - started) / len(tokens)
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        started = time.perf_counter()
+        swept = 0
+        while deleted := await repository.delete_expired(now, SWEEP_BATCH):
+            await session.commit()
+            swept += deleted
+        sweep_seconds = time.perf_counter() - started
+        swept_size = await index_size(session, "blacklisted_tokens")
+
+        await session.execute(text("DROP TABLE blacklisted_tokens_legacy"))
+        await session.execute(text("TRUNCATE blacklisted_tokens"))
+        await session.commit()
+
+    mib = 1024 * 1024
+    print(
+        f"\n{ROWS:,} rows: full token index {legacy_size / mib:.0f} MiB, {legacy_lookup * 1000:.3f} ms/lookup; "
+        f"digest index {digest_size / mib:.0f} MiB, {digest_lookup * 1000:.3f} ms/lookup; "
+        f"swept {swept:,} expired rows in {sweep_seconds:.1f}s ({swept_size / mib:.0f} MiB of index before vacuum)"
+    )
+    assert all(found[:LOOKUPS]) and not any(found[LOOKUPS:])
+    assert digest_size < legacy_size
+    assert swept > 0
@@ -0,0 +1,85 @@
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+from src.project_service.domain.value_objects.enums import ProjectStatus, SubprojectStatus, StageStatus
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    SubprojectModel,
+    StageModel,
+    MessageModel,
+)
+from src.project_service.infrastructure.mappers.project import project_to_domain
+
+SUBPROJECTS = 50
+STAGES = 50
+MESSAGES = 50
+
+
+def make_orm_project() -> ProjectModel:
+    now = datetime.now()
+    author_id = uuid4()
+    return ProjectModel(
+        id=uuid4(),
+        name="bench",
+        description=None,
+        created_at=now,
+        updated_at=now,
+        status=ProjectStatus.IN_PROGRESS,
+        progress=0.0,
+        files=[],
+        template=None,
+        subprojects=[
+            SubprojectModel(
+                id=uuid4(),
+                name=f"sub-{i}",
+                description=None,
+                created_at=now,
+                updated_at=now,
+                status=SubprojectStatus.IN_PROGRESS,
+                progress=0.0,
+                files=[],
+                stages=[
+                    StageModel(
+                        id=uuid4(),
+                        name=f"stage-{j}",
+                        description=None,
+                        created_at=now,
+                        updated_at=now,
+                        status=StageStatus.CREATED,
+                        files=[],
+                        messages=[
+                            MessageModel(id=uuid4(), created_at=now, author_id=author_id, text=f"message-{k}")
+                            for k in range(MESSAGES)
+                        ],
+                    )
+                    for j in range(STAGES)
+                ],
+            )
+            for i in range(SUBPROJECTS)
+        ],
+    )
+
+
+def test_project_to_domain_memory_and_time():
+    orm_project = make_orm_project()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    project = project_to_domain(orm_project)
+    allocated = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    rounds = 5
+    started = time.perf_counter()
+    for _ in range(rounds):
+        project_to_domain(orm_project)
+    seconds = (time.perf_counter() - started) / rounds
+
+    stages = SUBPROJECTS * STAGES
+    print(
+        f"\n{SUBPROJECTS}x{STAGES}x{MESSAGES}: aggregate {allocated / 2**20:.1f} MiB, "
+        f"{allocated // stages} bytes per stage with messages, project_to_domain {seconds:.4f}s"
+    )
+    assert len(project.subprojects) == SUBPROJECTS
@@ -0,0 +1,89 @@
+import time
+from uuid import UUID, uuid4
+
+import pytest
+from litestar import Litestar, get, MediaType
+from litestar.dto import DataclassDTO, DTOConfig
+from litestar.testing import AsyncTestClient
+from loguru import logger
+
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.infrastructure.db.postgres.repositories.project import (
+    ProjectRepository,
+    ProjectReadRepository,
+)
+
+SUBPROJECTS = 20
+STAGES = 25
+MESSAGES = 10
+FILES = 2
+REQUESTS = 20
+
+
+class ProjectTreeDTO(DataclassDTO[Project]):
+    config = DTOConfig(max_nested_depth=3, exclude={"unloaded_subprojects"})
+
+
+def make_app(sessionmaker) -> Litestar:
+    @get("/orm/{project_id: uuid}", return_dto=ProjectTreeDTO)
+    async def orm_chain(project_id: UUID) -> Project:
+        # Прежний путь: selectinload всего дерева -> доменный агрегат -> DataclassDTO
+        async with sessionmaker() as session:
+            return await ProjectRepository(session).get(project_id)
+
+    @get("/json/{project_id: uuid}", media_type=MediaType.JSON)
+    async def json_tree(project_id: UUID) -> bytes:
+        async with sessionmaker() as session:
+            return await ProjectReadRepository(session).get_project_tree_json(project_id)
+
+    return Litestar(route_handlers=[orm_chain, json_tree])
+
+
+def make_project() -> Project:
+    author_id = uuid4()
+    subprojects = []
+    for i in range(SUBPROJECTS):
+        stages = [Stage.create(f"stage-{j}") for j in range(STAGES)]
+        for stage in stages:
+            stage.messages.extend(Message.create(author_id, f"message-{k}") for k in range(MESSAGES))
+            for k in range(FILES):
+                stage.add_file(f"file-{k}.txt", "text/plain", 128, f"stages/{stage.id}/file-{k}.txt")
+        subprojects.append(Subproject.create(f"sub-{i}", stages=stages))
+    return Project.create("bench", subprojects=subprojects)
+
+
+async def seconds_per_request(client: AsyncTestClient, path: str) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = await client.get(path)
+        assert response.status_code == 200
+        assert len(response.json()["subprojects"]) == SUBPROJECTS
+    return (time.perf_counter() - started) / REQUESTS
+
+
+@pytest.mark.asyncio
+async def test_postgres_json_tree_vs_aggregate_load(sessionmaker):
+    project = make_project()
+    async with sessionmaker() as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+
+    logger.disable("src")
+    try:
+        async with AsyncTestClient(app=make_app(sessionmaker)) as client:
+            # Прогрев: компиляция запросов и построение DTO-кодеков
+            await client.get(f"/orm/{project.id}")
+            await client.get(f"/json/{project.id}")
+            orm = await seconds_per_request(client, f"/orm/{project.id}")
+            tree = await seconds_per_request(client, f"/json/{project.id}")
+    finally:
+        logger.enable("src")
+
+    print(
+        f"\n{SUBPROJECTS}x{STAGES}x{MESSAGES}: aggregate -> DTO {orm * 1000:.1f} ms, "
+        f"postgres json {tree * 1000:.1f} ms ({orm / tree:.1f}x)"
+    )
+    assert tree < orm
@@ -0,0 +1,101 @@
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from litestar import Litestar, get
+from litestar.testing import AsyncTestClient
+from loguru import logger
+from sqlalchemy import select, desc, insert, delete
+from sqlalchemy.orm import noload
+
+from src.common.litestar_.pagination import OffsetPage
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.value_objects.enums import ProjectStatus
+from src.project_service.infrastructure.db.postgres.models import ProjectModel, ProjectSummaryModel
+from src.project_service.infrastructure.db.postgres.repositories.project import ProjectReadRepository
+from src.project_service.infrastructure.mappers.project import project_to_domain
+from src.project_service.infrastructure.read_models.project import ProjectSummaryRead
+from src.project_service.presentation.dto.project import ProjectShortResponseDTO
+
+PROJECTS = 5000
+PAGE = 100
+
+
+def make_app(sessionmaker) -> Litestar:
+    @get("/orm", return_dto=ProjectShortResponseDTO)
+    async def orm_chain(offset: int) -> OffsetPage[Project]:
+        # Прежний путь: ORM-объекты -> доменные сущности -> DataclassDTO
+        async with sessionmaker() as session:
+            stmt = (
+                select(ProjectModel)
+                .options(noload(ProjectModel.template), noload(ProjectModel.subprojects), noload(ProjectModel.files))
+                .order_by(desc(ProjectModel.created_at))
+                .limit(PAGE)
+                .offset(offset)
+            )
+            orm_projects = (await session.execute(stmt)).scalars().all()
+            items = [project_to_domain(orm_project) for orm_project in orm_projects]
+        return OffsetPage(items=items, limit=PAGE, offset=offset, total=None)
+
+    @get("/rows")
+    async def row_path(offset: int) -> OffsetPage[ProjectSummaryRead]:
+        async with sessionmaker() as session:
+            items, _ = await ProjectReadRepository(session).get_projects(PAGE, offset)
+        return OffsetPage(items=items, limit=PAGE, offset=offset, total=None)
+
+    return Litestar(route_handlers=[orm_chain, row_path])
+
+
+async def seed(sessionmaker) -> None:
+    started = datetime(2025, 1, 1)
+    rows = [
+        {
+            "id": uuid4(),
+            "name": f"project-{i}",
+            "description": "description",
+            "created_at": started + timedelta(seconds=i),
+            "updated_at": started + timedelta(seconds=i),
+            "status": ProjectStatus.CREATED,
+            "progress": 0.0,
+        }
+        for i in range(PROJECTS)
+    ]
+    summary_rows = [
+        {**row, "subprojects_count": 0, "completed_subprojects_count": 0, "files_count": 0} for row in rows
+    ]
+    async with sessionmaker() as session:
+        await session.execute(delete(ProjectSummaryModel))
+        await session.execute(delete(ProjectModel))
+        await session.execute(insert(ProjectModel), rows)
+        await session.execute(insert(ProjectSummaryModel), summary_rows)
+        await session.commit()
+
+
+async def rows_per_second(client: AsyncTestClient, path: str) -> float:
+    started = time.perf_counter()
+    fetched = 0
+    for offset in range(0, PROJECTS, PAGE):
+        response = await client.get(path, params={"offset": offset})
+        assert response.status_code == 200
+        fetched += len(response.json()["items"])
+    assert fetched == PROJECTS
+    return fetched / (time.perf_counter() - started)
+
+
+@pytest.mark.asyncio
+async def test_column_rows_vs_orm_domain_dto(sessionmaker):
+    await seed(sessionmaker)
+    logger.disable("src")
+    try:
+        async with AsyncTestClient(app=make_app(sessionmaker)) as client:
+            # Прогрев: компиляция запросов и построение DTO-кодеков
+            await client.get("/orm", params={"offset": 0})
+            await client.get("/rows", params={"offset": 0})
+            orm = await rows_per_second(client, "/orm")
+            rows = await rows_per_second(client, "/rows")
+    finally:
+        logger.enable("src")
+
+    print(f"\nORM -> domain -> DTO: {orm:,.0f} rows/s; column rows: {rows:,.0f} rows/s ({rows / orm:.1f}x)")
+    assert rows > orm
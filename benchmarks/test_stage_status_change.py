@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import joinedload, selectinload
+
+from benchmarks.conftest import measure
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+from src.project_service.infrastructure.db.postgres.models import ProjectModel, SubprojectModel, StageModel
+from src.project_service.infrastructure.db.postgres.models import SubprojectTemplateModel
+from src.project_service.infrastructure.db.postgres.repositories.project import ProjectRepository
+from src.project_service.infrastructure.mappers.project import project_to_orm
+
+SUBPROJECTS = 50
+STAGES = 50
+MESSAGES = 5
+
+
+def make_project() -> Project:
+    author_id = uuid4()
+    subprojects = []
+    for i in range(SUBPROJECTS):
+        stages = [Stage.create(f"stage-{j}") for j in range(STAGES)]
+        for stage in stages:
+            stage.messages.extend(Message.create(author_id, f"message-{k}") for k in range(MESSAGES))
+        subprojects.append(Subproject.create(f"sub-{i}", stages=stages))
+    return Project.create(f"bench-{uuid4()}", subprojects=subprojects)
+
+
+async def merge_update(repository: ProjectRepository, project: Project) -> None:
+    """Прежняя запись агрегата: merge полностью пересобранного ORM-дерева"""
+    await repository.session.merge(
+        project_to_orm(project),
+        options=[
+            joinedload(ProjectModel.template).selectinload(SubprojectTemplateModel.stages),
+            selectinload(ProjectModel.files),
+            selectinload(ProjectModel.subprojects).selectinload(SubprojectModel.stages).selectinload(StageModel.messages),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["merge", "change_set"])
+async def test_one_stage_status_change(sessionmaker, strategy):
+    project = make_project()
+    stage_id = project.subprojects[SUBPROJECTS // 2].stages[STAGES // 2].id
+    async with sessionmaker() as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+
+    async with sessionmaker() as session:
+        repository = ProjectRepository(session)
+        project = await repository.get_by_stage(stage_id)
+        project.change_stage_status(stage_id, StageStatus.CONFIRMED, Message.create(uuid4(), "ok"))
+        async with measure(session) as measurement:
+            if strategy == "merge":
+                await merge_update(repository, project)
+            else:
+                await repository.update(project)
+            await session.commit()
+
+    print(f"\n[{strategy}] statements: {measurement.statements}, seconds: {measurement.seconds:.4f}")
+    if strategy == "change_set":
+        # INSERT сообщения + UPDATE этапа, подпроекта, проекта
+        assert measurement.statements == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("loader", ["tree", "slice"])
+async def test_two_stage_batch(sessionmaker, loader):
+    project = make_project()
+    stage_ids = [project.subprojects[i].stages[STAGES // 2].id for i in (0, SUBPROJECTS - 1)]
+    async with sessionmaker() as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+
+    async with sessionmaker() as session:
+        repository = ProjectRepository(session)
+        async with measure(session) as measurement:
+            if loader == "tree":
+                project = await repository.get_by_stage(stage_ids[0])
+            else:
+                project = await repository.get_slice_by_stages(stage_ids)
+            project.change_stage_statuses([(stage_id, StageStatus.CONFIRMED, None) for stage_id in stage_ids])
+            await repository.update(project)
+            await session.commit()
+
+    print(f"\n[{loader}] subprojects loaded: {len(project.subprojects)}, seconds: {measurement.seconds:.4f}")
+    if loader == "slice":
+        assert len(project.subprojects) == 2
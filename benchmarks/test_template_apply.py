@@ -0,0 +1,60 @@
+import pytest
+
+from benchmarks.conftest import measure
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.infrastructure.db.postgres.repositories.project import ProjectRepository
+
+SUBPROJECTS = 100
+STAGES = 50
+
+
+async def make_project_with_template(sessionmaker) -> Project:
+    source = Subproject.create("source", stages=[Stage.create(f"stage-{i}") for i in range(STAGES)])
+    project = Project.create("bench", subprojects=[source])
+    project.make_template_from_subproject(source.id)
+    async with sessionmaker() as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+    return project
+
+
+@pytest.mark.asyncio
+async def test_apply_template_vs_one_subproject_at_a_time(sessionmaker):
+    one_by_one = await make_project_with_template(sessionmaker)
+    bulk = await make_project_with_template(sessionmaker)
+    names = [f"sub-{i}" for i in range(SUBPROJECTS)]
+
+    # Прежний путь CreateSubprojectUseCase(from_template=True): полный агрегат на каждый подпроект
+    async with sessionmaker() as session:
+        async with measure(session) as single:
+            for name in names:
+                repository = ProjectRepository(session)
+                project = await repository.get(one_by_one.id)
+                subproject = Subproject.create(name)
+                for stage in project.template.stages:
+                    subproject.add_stage(Stage.create(stage.name, stage.description))
+                project.add_subproject(subproject)
+                await repository.update(project)
+                await session.commit()
+
+    async with sessionmaker() as session:
+        async with measure(session) as batch:
+            repository = ProjectRepository(session)
+            project = await repository.get_for_template(bulk.id, names)
+            project.instantiate_template(names)
+            await repository.update(project)
+            await session.commit()
+
+    async with sessionmaker() as session:
+        single_result = await ProjectRepository(session).get(one_by_one.id)
+        bulk_result = await ProjectRepository(session).get(bulk.id)
+
+    print(
+        f"\n{SUBPROJECTS}x{STAGES}: one by one {single.seconds:.2f}s / {single.statements} statements, "
+        f"bulk {batch.seconds:.2f}s / {batch.statements} statements"
+    )
+    assert len(bulk_result.subprojects) == len(single_result.subprojects) == SUBPROJECTS + 1
+    assert (bulk_result.status, bulk_result.progress) == (single_result.status, single_result.progress)
+    assert batch.seconds < single.seconds
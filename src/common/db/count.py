@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+from aiocache import SimpleMemoryCache
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Общий для процесса кэш: значения живут TTL секунд и не сбрасываются при записи
+_totals_cache = SimpleMemoryCache()
+
+
+@dataclass(frozen=True, slots=True)
+class TotalCount:
+    value: int
+    is_approximate: bool = False
+
+
+class CountProvider:
+    """Общее количество строк для постраничных списков.
+
+    Точные значения кэшируются на короткий TTL. Для нефильтрованных списков по таблицам, в которых
+    по статистике больше `estimate_threshold` строк, возвращается оценка из pg_class.reltuples.
+    """
+
+    def __init__(self, session: AsyncSession, ttl: int = 10, estimate_threshold: int = 100_000):
+        self.session = session
+        self.ttl = ttl
+        self.estimate_threshold = estimate_threshold
+
+    async def get(self, table: str, **filters) -> TotalCount | None:
+        filters = {name: value for name, value in filters.items() if value}
+        key = self._key(table, filters)
+        if (total := await _totals_cache.get(key)) is not None:
+            return total
+        if filters:
+            return None
+        estimate = await self._estimate(table)
+        if estimate < self.estimate_threshold:
+            return None
+        total = TotalCount(estimate, is_approximate=True)
+        await _totals_cache.set(key, total, ttl=self.ttl)
+        return total
+
+    async def remember(self, table: str, value: int, **filters) -> TotalCount:
+        total = TotalCount(value)
+        await _totals_cache.set(self._key(table, filters), total, ttl=self.ttl)
+        return total
+
+    async def _estimate(self, table: str) -> int:
+        # reltuples = -1, пока таблица ни разу не анализировалась
+        stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+        result = await self.session.execute(stmt, {"table": table})
+        estimate = result.scalar()
+        return -1 if estimate is None else estimate
+
+    @staticmethod
+    def _key(table: str, filters: dict) -> str:
+        filters_key = ",".join(f"{name}={value}" for name, value in sorted(filters.items()) if value)
+        return f"totals:{table}:{filters_key}"
@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from src.common.db.count import TotalCount
+
+
+class ICountProvider(Protocol):
+    async def get(self, table: str, **filters) -> TotalCount | None: ...
+    async def remember(self, table: str, value: int, **filters) -> TotalCount: ...
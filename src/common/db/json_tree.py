@@ -0,0 +1,18 @@
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import func, literal_column, select, ScalarSelect
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+
+def json_object(*columns: Any, **nested: Any) -> Any:
+    """json_build_object: колонки попадают в документ под своими именами, nested - под именами аргументов"""
+    pairs = [(column.key, column) for column in columns] + list(nested.items())
+    # Ключи подставляются литералами: у json_build_object аргументы типа "any", и asyncpg не выводит тип параметра
+    return func.json_build_object(*chain.from_iterable((literal_column(f"'{key}'"), value) for key, value in pairs))
+
+
+def json_list(document: Any, *where: Any, order_by: Any) -> ScalarSelect:
+    """Коррелированный подзапрос, собирающий документы дочерних строк в JSON-массив (пустой, если строк нет)"""
+    aggregated = func.json_agg(aggregate_order_by(document, order_by))
+    return select(func.coalesce(aggregated, literal_column("'[]'::json"))).where(*where).scalar_subquery()
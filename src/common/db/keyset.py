@@ -0,0 +1,45 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_, desc
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.common.exceptions.application import ApplicationError
+
+
+@dataclass(frozen=True, slots=True)
+class Keyset:
+    """Позиция в выборке, отсортированной по убыванию (timestamp, id)"""
+
+    timestamp: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.timestamp.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            timestamp, id_ = raw.split("|")
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ApplicationError(f"Некорректный курсор `{cursor}`")
+
+
+def seek(
+    stmt: Select,
+    timestamp_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    after: Keyset | None,
+    limit: int,
+) -> Select:
+    """Страница после `after`; выбирается limit + 1 строка, чтобы определить наличие следующей страницы"""
+    if after is not None:
+        stmt = stmt.where(tuple_(timestamp_column, id_column) < tuple_(after.timestamp, after.id))
+    return stmt.order_by(desc(timestamp_column), desc(id_column)).limit(limit + 1)
@@ -0,0 +1,32 @@
+from dataclasses import fields
+from typing import Any, Sequence
+
+from sqlalchemy import Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def columns_for(model: type, row_type: type) -> list[Any]:
+    """Колонки модели в порядке полей dataclass, чтобы строку результата можно было передать в row_type(*row)"""
+    return [getattr(model, field.name) for field in fields(row_type)]
+
+
+async def fetch_page(
+    session: AsyncSession, stmt: Select, with_total: bool, row_type: type | None = None
+) -> tuple[Sequence[Any], int | None]:
+    """Строки страницы и общее количество строк, посчитанное тем же запросом через COUNT(*) OVER().
+
+    Без row_type возвращаются ORM-объекты, иначе каждая строка из колонок собирается в row_type(*row).
+    Для пустой страницы количество неизвестно и возвращается None.
+    """
+    if not with_total:
+        result = await session.execute(stmt)
+        if row_type is None:
+            return result.unique().scalars().all(), None
+        return [row_type(*row) for row in result], None
+
+    result = await session.execute(stmt.add_columns(func.count().over().label("total")))
+    if row_type is None:
+        rows = result.unique().all()
+        return [row[0] for row in rows], rows[0].total if rows else None
+    rows = result.all()
+    return [row_type(*row[:-1]) for row in rows], rows[0].total if rows else None
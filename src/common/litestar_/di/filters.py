@@ -3,15 +3,32 @@ from typing import Annotated
 
 from litestar.params import Parameter
 
+from src.common.db.keyset import Keyset
+
 
 @dataclass
 class LimitOffsetFilterRequest:
     limit: int
     offset: int
+    with_total: bool
 
 
 async def get_limit_offset_filters(
     limit: Annotated[int, Parameter(ge=1, le=100, default=100)],
     offset: Annotated[int, Parameter(ge=0, default=0)],
+    with_total: Annotated[bool, Parameter(default=True)],
 ) -> LimitOffsetFilterRequest:
-    return LimitOffsetFilterRequest(limit, offset)
+    return LimitOffsetFilterRequest(limit, offset, with_total)
+
+
+@dataclass
+class CursorFilterRequest:
+    limit: int
+    cursor: Keyset | None
+
+
+async def get_cursor_filters(
+    limit: Annotated[int, Parameter(ge=1, le=100, default=100)],
+    cursor: Annotated[str | None, Parameter(default=None)],
+) -> CursorFilterRequest:
+    return CursorFilterRequest(limit, Keyset.decode(cursor) if cursor else None)
@@ -9,14 +9,14 @@ from loguru import logger
 class PermissionGuard:
     def __init__(self, codes: str | Sequence[str]):
         if isinstance(codes, str):
-            self.codes: set = {codes}
+            self.codes: frozenset = frozenset({codes})
         else:
-            self.codes: set = set(codes)
+            self.codes: frozenset = frozenset(codes)
 
     async def __call__(self, connection: ASGIConnection, _: BaseRouteHandler) -> None:
         permissions = connection.auth.permissions
         if not self.has_permission(permissions):
             raise PermissionDeniedException("В доступе отказано")
 
-    def has_permission(self, permissions: list[str]) -> bool:
-        return any(code in permissions for code in self.codes)
+    def has_permission(self, permissions: frozenset[str]) -> bool:
+        return not self.codes.isdisjoint(permissions)
@@ -1,21 +1,82 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TypeVar, Generic
 
-from litestar.pagination import OffsetPagination, AbstractAsyncOffsetPaginator
+from litestar.pagination import CursorPagination, AbstractAsyncCursorPaginator
+
+from src.common.db.count import TotalCount
+from src.common.db.interfaces import ICountProvider
+from src.common.db.keyset import Keyset
 
 T = TypeVar("T")
 
 
-class FilteredAbstractAsyncOffsetPaginator(AbstractAsyncOffsetPaginator[T]):
+@dataclass
+class OffsetPage(Generic[T]):
+    """Аналог OffsetPagination, в котором total не заполняется, если клиент его не запросил"""
+
+    items: list[T]
+    limit: int
+    offset: int
+    total: int | None
+    total_is_approximate: bool = False
+
+
+class FilteredAbstractAsyncOffsetPaginator(ABC, Generic[T]):
+    # Если заданы, общее количество берётся из кэша или оценки по статистике таблицы
+    table: str | None = None
+    totals: ICountProvider | None = None
+
     @abstractmethod
     async def get_total(self, **filters) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_items(self, limit: int, offset: int, **filters) -> list[T]:
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[T], int | None]:
+        """Должен вернуть элементы страницы и общее количество, посчитанное тем же запросом"""
+        raise NotImplementedError
+
+    async def __call__(self, limit: int, offset: int, with_total: bool = True, **filters) -> OffsetPage[T]:
+        total = await self._known_total(**filters) if with_total else None
+        items, exact = await self.get_items(limit, offset, with_total and total is None, **filters)
+        if with_total and total is None:
+            if exact is None:
+                # Страница пуста, и оконной функции не из чего было вернуть количество
+                exact = await self.get_total(**filters) if offset else 0
+            total = await self._remember_total(exact, **filters)
+        return OffsetPage(
+            items=items,
+            limit=limit,
+            offset=offset,
+            total=total.value if total else None,
+            total_is_approximate=total.is_approximate if total else False,
+        )
+
+    async def _known_total(self, **filters) -> TotalCount | None:
+        if self.totals is None or self.table is None:
+            return None
+        return await self.totals.get(self.table, **filters)
+
+    async def _remember_total(self, value: int, **filters) -> TotalCount:
+        if self.totals is None or self.table is None:
+            return TotalCount(value)
+        return await self.totals.remember(self.table, value, **filters)
+
+
+class FilteredAbstractAsyncCursorPaginator(AbstractAsyncCursorPaginator[str, T]):
+    @abstractmethod
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[T]:
+        """Должен вернуть до results_per_page + 1 элементов после курсора"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_keyset(self, item: T) -> Keyset:
         raise NotImplementedError
 
-    async def __call__(self, limit: int, offset: int, **filters) -> OffsetPagination[T]:
-        total = await self.get_total(**filters)
-        items = await self.get_items(limit=limit, offset=offset, **filters)
-        return OffsetPagination(items=items, total=total, offset=offset, limit=limit)
+    async def __call__(self, cursor: Keyset | None, results_per_page: int, **filters) -> CursorPagination[str, T]:
+        items = await self.get_items(cursor, results_per_page, **filters)
+        next_cursor = None
+        if len(items) > results_per_page:
+            items = items[:results_per_page]
+            next_cursor = self.get_keyset(items[-1]).encode()
+        return CursorPagination(items=items, results_per_page=results_per_page, cursor=next_cursor)
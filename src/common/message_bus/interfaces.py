@@ -8,4 +8,5 @@ T = TypeVar("T", bound=BaseModel)
 
 class IMessageBus(Protocol):
     async def publish(self, event: Event) -> None: ...
+    async def broadcast(self, event: Event) -> None: ...
     async def query(self, query: Query, response_model: Type[T]) -> T: ...
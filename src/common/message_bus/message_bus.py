@@ -1,7 +1,7 @@
 import json
 from typing import TypeVar, Type
 
-from faststream.rabbit import RabbitBroker
+from faststream.rabbit import RabbitBroker, RabbitExchange, ExchangeType
 from loguru import logger
 from pydantic import BaseModel
 
@@ -10,6 +10,10 @@ from src.common.message_bus.schemas import Query, Event
 T = TypeVar("T", bound=BaseModel)
 
 
+def fanout_exchange(topic: str) -> RabbitExchange:
+    return RabbitExchange(topic, type=ExchangeType.FANOUT)
+
+
 class FastStreamMessageBus:
     def __init__(self, broker: RabbitBroker):
         self._broker = broker
@@ -18,6 +22,11 @@ class FastStreamMessageBus:
         topic = self._resolve_topic(event)
         await self._broker.publish(event, topic)
 
+    async def broadcast(self, event: Event) -> None:
+        """Доставляет событие каждому процессу, подписанному на fanout_exchange, а не одному из них"""
+        topic = self._resolve_topic(event)
+        await self._broker.publish(event, exchange=fanout_exchange(topic))
+
     async def query(self, query: Query, response_model: Type[T]) -> T:
         topic = self._resolve_topic(query)
         msg = await self._broker.request(query, queue=topic, timeout=10)
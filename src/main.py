@@ -1,3 +1,5 @@
+import asyncio
+
 from dishka.integrations.litestar import setup_dishka as ls_setup_dishka, LitestarProvider, DishkaRouter
 from dishka.integrations.faststream import setup_dishka as fs_setup_dishka
 from dishka import make_async_container, Scope
@@ -15,6 +17,7 @@ from litestar.openapi.plugins import (
     ScalarRenderPlugin,
 )
 from litestar.openapi.spec import Components, SecurityScheme
+from loguru import logger
 
 from src.common.litestar_.controllers.download import DownloadController
 from src.common.litestar_.di.message_bus import MessagingProvider
@@ -34,7 +37,10 @@ from src.project_service.presentation.controllers.projects import ProjectsContro
 from src.project_service.presentation.controllers.stages import StagesController
 from src.project_service.presentation.controllers.subprojects import SubProjectsController
 from src.user_service.application import IUserServiceUoW
+from src.user_service.application.use_cases.auth import SweepExpiredTokensUseCase
 from src.user_service.application.use_cases.write.permission import GetOrCreateDefaultPermissionsUseCase
+from src.user_service.config import settings
+from src.user_service.di.hasher import PasswordHasherProvider
 from src.user_service.di.uow import UoWUserServiceProvider
 from src.user_service.domain.aggregates.role import Role
 from src.user_service.domain.aggregates.user import User
@@ -45,11 +51,15 @@ from src.user_service.presentation.controllers.auth import AuthController
 from src.user_service.presentation.controllers.permissions import PermissionController
 from src.user_service.presentation.controllers.roles import RoleController
 from src.user_service.presentation.controllers.users import UserController
+from src.user_service.infrastructure.blacklist_filter import blacklist_filter
+from src.user_service.infrastructure.user_directory import user_directory
 from src.user_service.presentation.middlewares.auth import AuthMiddleware
+from src.user_service.presentation.services.permission_registry import permission_registry
 
 container = make_async_container(
     LitestarProvider(),
     UoWUserServiceProvider(),
+    PasswordHasherProvider(),
     UoWProjectServiceProvider(),
     S3ClientProvider(),
     MessagingProvider(),
@@ -92,6 +102,52 @@ async def update_admin_role_permissions():
             await uow.roles.update(role)
 
 
+async def load_permission_registry():
+    async with container(scope=Scope.REQUEST) as cont:
+        uow = await cont.get(IUserServiceUoW)
+        async with uow:
+            codes = await uow.permissions_read.get_codes()
+    permission_registry.load(codes)
+
+
+async def load_blacklist_filter():
+    async with container(scope=Scope.REQUEST) as cont:
+        uow = await cont.get(IUserServiceUoW)
+        async with uow:
+            await blacklist_filter.rebuild(uow.blacklist.iter_active_digests(), await uow.blacklist.count_active())
+
+
+async def warm_user_directory():
+    async with container(scope=Scope.REQUEST) as cont:
+        await user_directory.warm(await cont.get(IUserServiceUoW))
+
+
+async def sweep_blacklisted_tokens():
+    while True:
+        await asyncio.sleep(settings.BLACKLIST_SWEEP_INTERVAL_SECONDS)
+        try:
+            async with container(scope=Scope.REQUEST) as cont:
+                deleted = await SweepExpiredTokensUseCase(await cont.get(IUserServiceUoW)).execute()
+            if deleted:
+                logger.info(f"Из черного списка удалено {deleted} истекших токенов")
+        except Exception:
+            logger.exception("Не удалось очистить черный список токенов")
+        # Фильтр перестраивается каждый интервал: пропущенное событие о блокировке (сбой публикации,
+        # обрыв соединения с брокером) перестает действовать не позже чем через один интервал
+        try:
+            await load_blacklist_filter()
+        except Exception:
+            logger.exception("Не удалось перестроить фильтр черного списка токенов")
+
+
+async def start_blacklist_sweeper(app: Litestar):
+    app.state.blacklist_sweeper = asyncio.create_task(sweep_blacklisted_tokens())
+
+
+async def stop_blacklist_sweeper(app: Litestar):
+    app.state.blacklist_sweeper.cancel()
+
+
 async def create_test_data():
     async with container(scope=Scope.REQUEST) as cont:
         uow = await cont.get(IUserServiceUoW)
@@ -110,8 +166,7 @@ async def create_test_data():
                 )
         uow = await cont.get(IProjectServiceUoW)
         async with uow:
-            pr = await uow.projects_read.get_projects(limit=1, offset=0)
-            if not pr:
+            if not await uow.projects.count():
                 for idx in range(50):
                     project = Project.create(name=f"Проект-{idx}")
                     for jdx in range(50):
@@ -119,8 +174,9 @@ async def create_test_data():
                         project.add_subproject(subproject)
                         for kdx in range(50):
                             stage = Stage.create(name=f"stage-{kdx}")
-                            subproject.add_stage(stage)
+                            project.add_stage(subproject.id, stage)
                     await uow.projects.add(project)
+                    await uow.projections.refresh_project_tree(project.id)
 
 
 app = Litestar(
@@ -134,9 +190,13 @@ app = Litestar(
     on_startup=[
         broker.start,
         update_admin_role_permissions,
+        load_permission_registry,
+        load_blacklist_filter,
+        start_blacklist_sweeper,
+        warm_user_directory,
         # create_test_data
     ],
-    on_shutdown=[broker.close],
+    on_shutdown=[stop_blacklist_sweeper, broker.close],
     cors_config=CORSConfig(
         allow_origins=["http://localhost:3000", "http://127.0.0.1:3001"],
         allow_methods=["*"],
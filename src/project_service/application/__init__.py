@@ -1 +1,3 @@
+from src.project_service.application.handlers.project import *
+from src.project_service.application.handlers.subproject import *
 from src.project_service.application.handlers.stage import *
@@ -11,3 +11,11 @@ class ProjectCreatedEvent(Event):
     description: str | None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectUpdatedEvent(Event):
+    id: UUID
+
+
+class ProjectDeletedEvent(Event):
+    id: UUID
@@ -13,3 +13,31 @@ class StageStatusChangedEvent(Event):
     changed_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class StageStatusesChangedEvent(Event):
+    project_id: UUID
+    changed_by: UUID
+    changes: list[StageStatusChangedEvent]
+    has_messages: bool = False
+
+
+class StageCreatedEvent(Event):
+    id: UUID
+    subproject_id: UUID
+    project_id: UUID
+
+
+class StageUpdatedEvent(Event):
+    id: UUID
+
+
+class StageDeletedEvent(Event):
+    id: UUID
+    subproject_id: UUID
+    project_id: UUID
+
+
+class MessageAddedToStageEvent(Event):
+    stage_id: UUID
+    author_id: UUID
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from src.common.message_bus.schemas import Event
+
+
+class SubprojectCreatedEvent(Event):
+    id: UUID
+    project_id: UUID
+
+
+class SubprojectsCreatedEvent(Event):
+    ids: list[UUID]
+    project_id: UUID
+
+
+class SubprojectUpdatedEvent(Event):
+    id: UUID
+
+
+class SubprojectDeletedEvent(Event):
+    id: UUID
+    project_id: UUID
@@ -0,0 +1,31 @@
+from dishka import FromDishka
+from dishka.integrations.faststream import inject
+
+from src.common.message_bus.broker import broker
+from src.project_service.application.events.project import (
+    ProjectCreatedEvent,
+    ProjectUpdatedEvent,
+    ProjectDeletedEvent,
+)
+from src.project_service.application.protocols import IProjectServiceUoW
+
+
+@broker.subscriber("projectcreatedevent")
+@inject
+async def on_project_created(event: ProjectCreatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.refresh_project_tree(event.id)
+
+
+@broker.subscriber("projectupdatedevent")
+@inject
+async def on_project_updated(event: ProjectUpdatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.refresh_project(event.id)
+
+
+@broker.subscriber("projectdeletedevent")
+@inject
+async def on_project_deleted(event: ProjectDeletedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.remove_project(event.id)
@@ -5,7 +5,16 @@ from dishka.integrations.faststream import inject
 from loguru import logger
 
 from src.common.message_bus.broker import broker
-from src.project_service.application.events.stage import StageStatusChangedEvent
+from src.common.message_bus.interfaces import IMessageBus
+from src.common.message_bus.schemas import GetUserInfoQuery, GetUserInfoResponse
+from src.project_service.application.events.stage import (
+    StageStatusChangedEvent,
+    StageStatusesChangedEvent,
+    StageCreatedEvent,
+    StageUpdatedEvent,
+    StageDeletedEvent,
+    MessageAddedToStageEvent,
+)
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 
@@ -15,3 +24,61 @@ from src.project_service.domain.entities.stage_status_history import StageStatus
 async def on_stage_status_changed(event: StageStatusChangedEvent, uow: FromDishka[IProjectServiceUoW]):
     async with uow:
         await uow.stage_status_history.add(StageStatusHistory.create(**event.model_dump()))
+        await uow.projections.refresh_stage_lineage(event.stage_id)
+
+
+@broker.subscriber("stagestatuseschangedevent")
+@inject
+async def on_stage_statuses_changed(
+    event: StageStatusesChangedEvent,
+    uow: FromDishka[IProjectServiceUoW],
+    mb: FromDishka[IMessageBus],
+):
+    author = None
+    if event.has_messages:
+        author = await mb.query(GetUserInfoQuery(id=event.changed_by), response_model=GetUserInfoResponse)
+    async with uow:
+        for change in event.changes:
+            await uow.stage_status_history.add(StageStatusHistory.create(**change.model_dump()))
+        # Пересчитываются только этапы пакета, их подпроекты и проект, а не все дерево проекта
+        await uow.projections.refresh_stages_lineage([change.stage_id for change in event.changes], event.project_id)
+        if author is not None:
+            await uow.projections.set_author_name(author.id, author.username)
+
+
+@broker.subscriber("stagecreatedevent")
+@inject
+async def on_stage_created(event: StageCreatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.refresh_stages(stage_id=event.id)
+        await uow.projections.refresh_subprojects(subproject_id=event.subproject_id)
+        await uow.projections.refresh_project(event.project_id)
+
+
+@broker.subscriber("stageupdatedevent")
+@inject
+async def on_stage_updated(event: StageUpdatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.refresh_stages(stage_id=event.id)
+
+
+@broker.subscriber("stagedeletedevent")
+@inject
+async def on_stage_deleted(event: StageDeletedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.remove_stage(event.id)
+        await uow.projections.refresh_subprojects(subproject_id=event.subproject_id)
+        await uow.projections.refresh_project(event.project_id)
+
+
+@broker.subscriber("messageaddedtostageevent")
+@inject
+async def on_message_added_to_stage(
+    event: MessageAddedToStageEvent,
+    uow: FromDishka[IProjectServiceUoW],
+    mb: FromDishka[IMessageBus],
+):
+    author = await mb.query(GetUserInfoQuery(id=event.author_id), response_model=GetUserInfoResponse)
+    async with uow:
+        await uow.projections.refresh_stages(stage_id=event.stage_id)
+        await uow.projections.set_author_name(author.id, author.username)
@@ -0,0 +1,42 @@
+from dishka import FromDishka
+from dishka.integrations.faststream import inject
+
+from src.common.message_bus.broker import broker
+from src.project_service.application.events.subproject import (
+    SubprojectCreatedEvent,
+    SubprojectsCreatedEvent,
+    SubprojectUpdatedEvent,
+    SubprojectDeletedEvent,
+)
+from src.project_service.application.protocols import IProjectServiceUoW
+
+
+@broker.subscriber("subprojectcreatedevent")
+@inject
+async def on_subproject_created(event: SubprojectCreatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        # Подпроект может быть создан по шаблону сразу с этапами
+        await uow.projections.refresh_subproject_tree(event.id, event.project_id)
+
+
+@broker.subscriber("subprojectscreatedevent")
+@inject
+async def on_subprojects_created(event: SubprojectsCreatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        # Подпроекты пакета создаются в одном проекте: пересчитываем его дерево одним проходом
+        await uow.projections.refresh_project_tree(event.project_id)
+
+
+@broker.subscriber("subprojectupdatedevent")
+@inject
+async def on_subproject_updated(event: SubprojectUpdatedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.refresh_subprojects(subproject_id=event.id)
+
+
+@broker.subscriber("subprojectdeletedevent")
+@inject
+async def on_subproject_deleted(event: SubprojectDeletedEvent, uow: FromDishka[IProjectServiceUoW]):
+    async with uow:
+        await uow.projections.remove_subproject(event.id)
+        await uow.projections.refresh_project(event.project_id)
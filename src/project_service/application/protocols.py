@@ -3,11 +3,18 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.db.interfaces import ICountProvider
+from src.common.db.keyset import Keyset
+
 from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.aggregates.stage_message import StageMessage
 from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.domain.entities.subproject import Subproject
-from src.project_service.infrastructure.read_models.subproject import SubprojectRead
+from src.project_service.infrastructure.read_models.message import StageMessageRead
+from src.project_service.infrastructure.read_models.project import ProjectRead, ProjectSummaryRead
+from src.project_service.infrastructure.read_models.stage import StageCardRead
+from src.project_service.infrastructure.read_models.subproject import SubprojectRead, SubprojectSummaryRead
 
 
 class IProjectRepository(Protocol):
@@ -18,24 +25,71 @@ class IProjectRepository(Protocol):
     async def update(self, project: Project) -> Project: ...
     async def get_by_subproject(self, subproject_id: UUID) -> Project: ...
     async def get_by_stage(self, stage_id: UUID) -> Project: ...
+    async def get_slice_by_subproject(self, subproject_id: UUID) -> Project: ...
+    async def get_slice_by_stage(self, stage_id: UUID) -> Project: ...
+    async def get_slice_by_stages(self, stage_ids: list[UUID]) -> Project: ...
+    async def get_for_template(self, project_id: UUID, subproject_names: list[str]) -> Project: ...
     async def delete(self, project_id: UUID) -> None: ...
 
 
 class IProjectReadRepository(Protocol):
+    async def projects_count(self) -> int: ...
     async def subprojects_count(self, **filters) -> int: ...
-    async def get_subprojects(self, limit: int, offset: int, **filters) -> list[SubprojectRead]: ...
+    async def get_subprojects(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[SubprojectSummaryRead], int | None]: ...
+    async def get_subprojects_after(
+        self, limit: int, after: Keyset | None, **filters
+    ) -> list[SubprojectSummaryRead]: ...
     async def get_subproject(self, subproject_id: UUID) -> SubprojectRead: ...
     async def stages_count(self, **filters) -> int: ...
-    async def get_stages(self, limit: int, offset: int, **filters) -> list[Stage]: ...
+    async def get_stages(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[StageCardRead], int | None]: ...
+    async def get_stages_after(self, limit: int, after: Keyset | None, **filters) -> list[StageCardRead]: ...
+    async def get_messages_after(self, limit: int, after: Keyset | None, **filters) -> list[StageMessageRead]: ...
     async def get_stage(self, stage_id: UUID) -> Stage: ...
-    async def get_projects(self, limit: int, offset: int, **filters) -> list[Project]: ...
-    async def get_project(self, project_id: UUID) -> Project: ...
+    async def get_projects(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[ProjectSummaryRead], int | None]: ...
+    async def get_projects_after(self, limit: int, after: Keyset | None, **filters) -> list[ProjectSummaryRead]: ...
+    async def get_project(self, project_id: UUID) -> ProjectRead: ...
+    async def get_project_tree_json(self, project_id: UUID) -> bytes: ...
 
 
 class IStageStatusHistoryRepository(Protocol):
     async def add(self, obj: StageStatusHistory) -> None: ...
     async def count(self, **filters) -> int: ...
-    async def get_many(self, limit: int, offset: int, **filters) -> list[StageStatusHistory]: ...
+    async def get_many(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[StageStatusHistory], int | None]: ...
+    async def get_many_after(self, limit: int, after: Keyset | None, **filters) -> list[StageStatusHistory]: ...
+
+
+class IStageMessageRepository(Protocol):
+    async def add(self, message: StageMessage) -> None: ...
+
+
+class IProjectionRepository(Protocol):
+    async def refresh_project(self, project_id: UUID) -> None: ...
+    async def refresh_subprojects(
+        self, subproject_id: UUID | None = None, project_id: UUID | None = None
+    ) -> None: ...
+    async def refresh_stages(
+        self,
+        stage_id: UUID | None = None,
+        subproject_id: UUID | None = None,
+        project_id: UUID | None = None,
+        stage_ids: list[UUID] | None = None,
+    ) -> None: ...
+    async def refresh_project_tree(self, project_id: UUID) -> None: ...
+    async def refresh_subproject_tree(self, subproject_id: UUID, project_id: UUID) -> None: ...
+    async def refresh_stage_lineage(self, stage_id: UUID) -> None: ...
+    async def refresh_stages_lineage(self, stage_ids: list[UUID], project_id: UUID) -> None: ...
+    async def remove_project(self, project_id: UUID) -> None: ...
+    async def remove_subproject(self, subproject_id: UUID) -> None: ...
+    async def remove_stage(self, stage_id: UUID) -> None: ...
+    async def set_author_name(self, author_id: UUID, name: str) -> None: ...
 
 
 class IProjectServiceUoW(Protocol):
@@ -45,6 +99,9 @@ class IProjectServiceUoW(Protocol):
     projects: IProjectRepository
     projects_read: IProjectReadRepository
     stage_status_history: IStageStatusHistoryRepository
+    stage_messages: IStageMessageRepository
+    projections: IProjectionRepository
+    totals: ICountProvider
 
     async def __aenter__(self) -> Self: ...
     async def __aexit__(self, exc_type, exc_val, exc_tb): ...
@@ -1,28 +1,47 @@
 from uuid import UUID
 
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 from loguru import logger
 
+from src.common.db.keyset import Keyset
+from src.common.litestar_.pagination import OffsetPage
 from src.project_service.application.protocols import IProjectServiceUoW
-from src.project_service.domain.aggregates.project import Project
-from src.project_service.infrastructure.read_models.project import ProjectRead
-from src.project_service.presentation.pagination import ProjectOffsetPagination
+from src.project_service.infrastructure.read_models.project import ProjectRead, ProjectSummaryRead
+from src.project_service.presentation.pagination import ProjectOffsetPagination, ProjectCursorPagination
 
 
 class GetProjectUseCase:
     def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
 
-    async def execute(self, project_id: UUID) -> Project:
+    async def execute(self, project_id: UUID) -> ProjectRead:
         async with self.uow:
             project = await self.uow.projects_read.get_project(project_id)
             return project
 
 
+class GetProjectTreeUseCase:
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def execute(self, project_id: UUID) -> bytes:
+        async with self.uow:
+            return await self.uow.projects_read.get_project_tree_json(project_id)
+
+
 class GetProjectsUseCase:
     def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
 
-    async def execute(self, limit: int, offset: int) -> OffsetPagination[Project]:
+    async def execute(self, limit: int, offset: int, with_total: bool = True) -> OffsetPage[ProjectSummaryRead]:
+        async with self.uow:
+            return await ProjectOffsetPagination(uow=self.uow)(limit, offset, with_total)
+
+
+class GetProjectsByCursorUseCase:
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def execute(self, limit: int, cursor: Keyset | None) -> CursorPagination[str, ProjectSummaryRead]:
         async with self.uow:
-            return await ProjectOffsetPagination(uow=self.uow)(limit, offset)
+            return await ProjectCursorPagination(uow=self.uow)(cursor, limit)
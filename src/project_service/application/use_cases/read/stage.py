@@ -1,7 +1,9 @@
 from uuid import UUID
 
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 
+from src.common.db.keyset import Keyset
+from src.common.litestar_.pagination import OffsetPage
 from src.common.message_bus.interfaces import IMessageBus
 from src.common.message_bus.schemas import GetUserInfoResponse, GetUserInfoListResponse, GetUserInfoListQuery
 from src.project_service.application.protocols import IProjectServiceUoW
@@ -9,8 +11,14 @@ from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.infrastructure.read_models.file_attachment import FileAttachmentRead
 from src.project_service.infrastructure.read_models.message import MessageRead
-from src.project_service.infrastructure.read_models.stage import StageRead
-from src.project_service.presentation.pagination import StageOffsetPagination, StageStatusHistoryOffsetPagination
+from src.project_service.infrastructure.read_models.stage import StageRead, StageCardRead
+from src.project_service.presentation.pagination import (
+    StageOffsetPagination,
+    StageStatusHistoryOffsetPagination,
+    StageCursorPagination,
+    StageStatusHistoryCursorPagination,
+    StageMessageCursorPagination,
+)
 
 
 class GetStageUseCase:
@@ -56,13 +64,12 @@ class GetStageUseCase:
 
 
 class GetStagesUseCase:
-    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+    def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
-        self.mb = mb
 
-    async def execute(self, limit: int, offset: int, **filters) -> OffsetPagination[StageRead]:
+    async def execute(self, limit: int, offset: int, with_total: bool = True, **filters) -> OffsetPage[StageCardRead]:
         async with self.uow:
-            return await StageOffsetPagination(self.uow, self.mb)(limit, offset, **filters)
+            return await StageOffsetPagination(self.uow)(limit, offset, with_total, **filters)
 
 
 class GetStageStatusHistoryUseCase:
@@ -70,10 +77,43 @@ class GetStageStatusHistoryUseCase:
         self.uow = uow
         self.mb = mb
 
-    async def execute(self, stage_id: UUID, limit: int, offset: int) -> OffsetPagination[StageStatusHistory]:
+    async def execute(
+        self, stage_id: UUID, limit: int, offset: int, with_total: bool = True
+    ) -> OffsetPage[StageStatusHistory]:
         async with self.uow:
             return await StageStatusHistoryOffsetPagination(self.uow, self.mb)(
                 limit,
                 offset,
-                filters={"stage_id": stage_id},
+                with_total,
+                stage_id=stage_id,
             )
+
+
+class GetStagesByCursorUseCase:
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def execute(self, limit: int, cursor: Keyset | None, **filters) -> CursorPagination[str, StageCardRead]:
+        async with self.uow:
+            return await StageCursorPagination(self.uow)(cursor, limit, **filters)
+
+
+class GetStageStatusHistoryByCursorUseCase:
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def execute(
+        self, stage_id: UUID, limit: int, cursor: Keyset | None
+    ) -> CursorPagination[str, StageStatusHistory]:
+        async with self.uow:
+            return await StageStatusHistoryCursorPagination(self.uow)(cursor, limit, stage_id=stage_id)
+
+
+class GetStageMessagesByCursorUseCase:
+    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+        self.uow = uow
+        self.mb = mb
+
+    async def execute(self, stage_id: UUID, limit: int, cursor: Keyset | None) -> CursorPagination[str, MessageRead]:
+        async with self.uow:
+            return await StageMessageCursorPagination(self.uow, self.mb)(cursor, limit, stage_id=stage_id)
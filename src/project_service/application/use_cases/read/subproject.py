@@ -1,11 +1,13 @@
 from uuid import UUID
 
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 
+from src.common.db.keyset import Keyset
+from src.common.litestar_.pagination import OffsetPage
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.domain.entities.subproject import Subproject
-from src.project_service.infrastructure.read_models.subproject import SubprojectRead
-from src.project_service.presentation.pagination import SubprojectOffsetPagination
+from src.project_service.infrastructure.read_models.subproject import SubprojectRead, SubprojectSummaryRead
+from src.project_service.presentation.pagination import SubprojectOffsetPagination, SubprojectCursorPagination
 
 
 class GetSubprojectUseCase:
@@ -22,8 +24,19 @@ class GetSubprojectsUseCase:
     def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
 
-    async def execute(self, limit: int, offset: int, **filters) -> OffsetPagination[SubprojectRead]:
+    async def execute(
+        self, limit: int, offset: int, with_total: bool = True, **filters
+    ) -> OffsetPage[SubprojectSummaryRead]:
         async with self.uow:
-            subprojects = await self.uow.projects_read.get_subprojects(limit=limit, offset=offset, **filters)
-            total = await self.uow.projects_read.subprojects_count(**filters)
-            return SubprojectOffsetPagination.create(subprojects, total, limit, offset)
+            return await SubprojectOffsetPagination(self.uow)(limit, offset, with_total, **filters)
+
+
+class GetSubprojectsByCursorUseCase:
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def execute(
+        self, limit: int, cursor: Keyset | None, **filters
+    ) -> CursorPagination[str, SubprojectSummaryRead]:
+        async with self.uow:
+            return await SubprojectCursorPagination(self.uow)(cursor, limit, **filters)
@@ -3,7 +3,11 @@ from uuid import UUID
 from loguru import logger
 
 from src.common.message_bus.interfaces import IMessageBus
-from src.project_service.application.events.project import ProjectCreatedEvent
+from src.project_service.application.events.project import (
+    ProjectCreatedEvent,
+    ProjectUpdatedEvent,
+    ProjectDeletedEvent,
+)
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.domain.aggregates.project import Project
 
@@ -29,6 +33,7 @@ class DeleteProjectUseCase:
     async def execute(self, project_id: UUID) -> None:
         async with self.uow:
             await self.uow.projects.delete(project_id)
+        await self.mb.publish(ProjectDeletedEvent(id=project_id))
 
 
 class UpdateProjectUseCase:
@@ -41,7 +46,8 @@ class UpdateProjectUseCase:
             project = await self.uow.projects.get(project_id)
             project.update(name, description)
             await self.uow.projects.update(project)
-            return project
+        await self.mb.publish(ProjectUpdatedEvent(id=project.id))
+        return project
 
 
 class CreateTemplateForProjectUseCase:
@@ -1,14 +1,23 @@
 from uuid import UUID
 
-from src.common.exceptions.application import ApplicationPermissionDeniedError
+from src.common.exceptions.application import ApplicationError, ApplicationPermissionDeniedError
 from src.common.message_bus.interfaces import IMessageBus
 from src.common.message_bus.schemas import (
+    GetUserInfoQuery,
     GetUserInfoResponse,
     GetUserInfoListQuery,
     GetUserInfoListResponse,
 )
-from src.project_service.application.events.stage import StageStatusChangedEvent
+from src.project_service.application.events.stage import (
+    StageStatusChangedEvent,
+    StageStatusesChangedEvent,
+    StageCreatedEvent,
+    StageUpdatedEvent,
+    StageDeletedEvent,
+    MessageAddedToStageEvent,
+)
 from src.project_service.application.protocols import IProjectServiceUoW
+from src.project_service.domain.aggregates.stage_message import StageMessage
 from src.project_service.domain.entities.message import Message
 from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.value_objects.enums import StageStatus
@@ -24,13 +33,13 @@ class CreateStageUseCase:
 
     async def execute(self, subproject_id: UUID, name: str, description: str):
         async with self.uow:
-            project = await self.uow.projects.get_by_subproject(subproject_id)
+            project = await self.uow.projects.get_slice_by_subproject(subproject_id)
 
             stage = Stage.create(name=name, description=description)
-            subproject = project.get_subproject_by_id(subproject_id)
-            subproject.add_stage(stage)
+            project.add_stage(subproject_id, stage)
             await self.uow.projects.update(project)
-            return stage
+        await self.mb.publish(StageCreatedEvent(id=stage.id, subproject_id=subproject_id, project_id=project.id))
+        return stage
 
 
 class UpdateStageUseCase:
@@ -40,10 +49,11 @@ class UpdateStageUseCase:
 
     async def execute(self, stage_id: UUID, name: str, description: str | None) -> Stage:
         async with self.uow:
-            project = await self.uow.projects.get_by_stage(stage_id)
+            project = await self.uow.projects.get_slice_by_stage(stage_id)
             stage = project.update_stage(stage_id, name, description)
             await self.uow.projects.update(project)
-            return stage
+        await self.mb.publish(StageUpdatedEvent(id=stage_id))
+        return stage
 
 
 class DeleteStageUseCase:
@@ -53,9 +63,11 @@ class DeleteStageUseCase:
 
     async def execute(self, stage_id: UUID) -> None:
         async with self.uow:
-            project = await self.uow.projects.get_by_stage(stage_id)
+            project = await self.uow.projects.get_slice_by_stage(stage_id)
+            subproject = project.get_subproject_by_stage_id(stage_id)
             project.remove_stage(stage_id)
             await self.uow.projects.update(project)
+        await self.mb.publish(StageDeletedEvent(id=stage_id, subproject_id=subproject.id, project_id=project.id))
 
 
 class ChangeStageStatusUseCase:
@@ -68,7 +80,7 @@ class ChangeStageStatusUseCase:
         stage_id: UUID,
         status: str,
         user_id: UUID,
-        permissions: list[str],
+        permissions: frozenset[str],
         message: str | None = None,
     ) -> StageRead:
         async with self.uow:
@@ -78,7 +90,7 @@ class ChangeStageStatusUseCase:
                 )
             if message is not None:
                 message = Message.create(user_id, message)
-            project = await self.uow.projects.get_by_stage(stage_id)
+            project = await self.uow.projects.get_slice_by_stage(stage_id)
             new_stage = project.change_stage_status(stage_id, status, message)
             await self.uow.projects.update(project)
 
@@ -90,6 +102,8 @@ class ChangeStageStatusUseCase:
                 changed_at=new_stage.updated_at,
             )
         )
+        if message is not None:
+            await self.mb.publish(MessageAddedToStageEvent(stage_id=new_stage.id, author_id=user_id))
         author_ids = {msg.author_id for msg in new_stage.messages}
         user_map: dict[UUID, GetUserInfoResponse] = {}
         query_result = await self.mb.query(
@@ -125,48 +139,71 @@ class ChangeStageStatusUseCase:
         )
 
 
-class AddMessageToStageUseCase:
+class ChangeStageStatusesUseCase:
     def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
         self.uow = uow
         self.mb = mb
 
-    async def execute(self, stage_id: UUID, user_id: UUID, message: str) -> StageRead:
+    async def execute(
+        self,
+        changes: list[tuple[UUID, str, str | None]],
+        user_id: UUID,
+        permissions: frozenset[str],
+    ) -> list[Stage]:
+        if not changes:
+            raise ApplicationError("Не передано ни одного изменения статуса")
+        if (
+            any(status == StageStatus.COMPLETED for _, status, _ in changes)
+            and "stages:change_status_to_completed" not in permissions
+        ):
+            raise ApplicationPermissionDeniedError(
+                f"У вас недостаточно прав для изменения статуса этапа на `{StageStatus.COMPLETED}`"
+            )
+        domain_changes = [
+            (stage_id, status, Message.create(user_id, message) if message is not None else None)
+            for stage_id, status, message in changes
+        ]
+        # Загружаются только подпроекты с этапами пакета; остальные подпроекты проекта учитываются сводкой
         async with self.uow:
-            if message is not None:
-                message = Message.create(user_id, message)
-            project = await self.uow.projects.get_by_stage(stage_id)
-            new_stage = project.add_message_to_stage(stage_id, message)
+            project = await self.uow.projects.get_slice_by_stages([stage_id for stage_id, _, _ in changes])
+            stages = project.change_stage_statuses(domain_changes)
             await self.uow.projects.update(project)
 
-            author_ids = {msg.author_id for msg in new_stage.messages}
-            user_map: dict[UUID, GetUserInfoResponse] = {}
-            query_result = await self.mb.query(
-                GetUserInfoListQuery(ids=list(author_ids)), response_model=GetUserInfoListResponse
-            )
-            for user in query_result.users:
-                user_map[user.id] = user
-            return StageRead(
-                id=new_stage.id,
-                name=new_stage.name,
-                description=new_stage.description,
-                created_at=new_stage.created_at,
-                updated_at=new_stage.updated_at,
-                status=new_stage.status,
-                messages=[
-                    MessageRead(
-                        id=msg.id,
-                        created_at=msg.created_at,
-                        text=msg.text,
-                        author=user_map.get(msg.author_id, None).model_dump(),
+        await self.mb.publish(
+            StageStatusesChangedEvent(
+                project_id=project.id,
+                changed_by=user_id,
+                changes=[
+                    StageStatusChangedEvent(
+                        stage_id=stage.id,
+                        to_status=stage.status,
+                        changed_by=user_id,
+                        changed_at=stage.updated_at,
                     )
-                    for msg in new_stage.messages
+                    for stage in stages
                 ],
-                files=[FileAttachmentRead(
-                    id=file.id,
-                    filename=file.filename,
-                    content_type=file.content_type,
-                    size=file.size,
-                    uploaded_at=file.uploaded_at,
-                    path=file.path,
-                ) for file in new_stage.files],
+                has_messages=any(message is not None for _, _, message in domain_changes),
             )
+        )
+        return stages
+
+
+class AddMessageToStageUseCase:
+    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+        self.uow = uow
+        self.mb = mb
+
+    async def execute(self, stage_id: UUID, user_id: UUID, message: str) -> MessageRead:
+        # Сообщение пишется отдельным INSERT без загрузки проекта, поэтому стоимость не зависит от размера дерева
+        async with self.uow:
+            stage_message = StageMessage.create(stage_id, user_id, message)
+            await self.uow.stage_messages.add(stage_message)
+        await self.mb.publish(MessageAddedToStageEvent(stage_id=stage_id, author_id=user_id))
+
+        author = await self.mb.query(GetUserInfoQuery(id=user_id), response_model=GetUserInfoResponse)
+        return MessageRead(
+            id=stage_message.id,
+            created_at=stage_message.created_at,
+            text=stage_message.text,
+            author=author.model_dump(),
+        )
@@ -2,6 +2,12 @@ from uuid import UUID
 
 from src.common.exceptions.application import ApplicationError
 from src.common.message_bus.interfaces import IMessageBus
+from src.project_service.application.events.subproject import (
+    SubprojectCreatedEvent,
+    SubprojectsCreatedEvent,
+    SubprojectUpdatedEvent,
+    SubprojectDeletedEvent,
+)
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.entities.subproject import Subproject
@@ -24,7 +30,29 @@ class CreateSubprojectUseCase:
                     subproject.add_stage(Stage.create(stage.name, stage.description))
             project.add_subproject(subproject)
             await self.uow.projects.update(project)
-            return subproject
+        await self.mb.publish(SubprojectCreatedEvent(id=subproject.id, project_id=project_id))
+        return subproject
+
+
+class ApplyTemplateUseCase:
+    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+        self.uow = uow
+        self.mb = mb
+
+    async def execute(self, project_id: UUID, names: list[str]) -> list[Subproject]:
+        if not names:
+            raise ApplicationError("Не передано ни одного имени подпроекта")
+        if len(set(names)) != len(names):
+            raise ApplicationError("Имена подпроектов в запросе не должны повторяться")
+        async with self.uow:
+            # Загружается только шаблон и подпроекты с такими же именами; новые строки пишутся пакетными INSERT
+            project = await self.uow.projects.get_for_template(project_id, names)
+            subprojects = project.instantiate_template(names)
+            await self.uow.projects.update(project)
+        await self.mb.publish(
+            SubprojectsCreatedEvent(ids=[subproject.id for subproject in subprojects], project_id=project_id)
+        )
+        return subprojects
 
 
 class DeleteSubprojectUseCase:
@@ -37,6 +65,7 @@ class DeleteSubprojectUseCase:
             project = await self.uow.projects.get_by_subproject(subproject_id)
             project.remove_subproject(subproject_id)
             await self.uow.projects.update(project)
+        await self.mb.publish(SubprojectDeletedEvent(id=subproject_id, project_id=project.id))
 
 
 class UpdateSubprojectUseCase:
@@ -49,4 +78,5 @@ class UpdateSubprojectUseCase:
             project = await self.uow.projects.get_by_subproject(subproject_id)
             subproject = project.update_subproject(subproject_id, name, description)
             await self.uow.projects.update(project)
-            return subproject
+        await self.mb.publish(SubprojectUpdatedEvent(id=subproject_id))
+        return subproject
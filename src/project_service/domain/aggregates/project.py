@@ -1,3 +1,4 @@
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from typing import Self
@@ -12,9 +13,10 @@ from src.project_service.domain.entities.subproject_template import SubprojectTe
 from src.project_service.domain.value_objects.enums import ProjectStatus
 from src.project_service.domain.value_objects.project_description import ProjectDescription
 from src.project_service.domain.value_objects.project_name import ProjectName
+from src.project_service.domain.value_objects.subprojects_rollup import SubprojectsRollup
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: UUID
     name: ProjectName
@@ -27,6 +29,27 @@ class Project:
     files: list[FileAttachment]
 
     template: SubprojectTemplate | None = field(default=None)
+    unloaded_subprojects: SubprojectsRollup | None = field(default=None)
+
+    _subprojects_by_id: dict[UUID, Subproject] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _subproject_names: dict[str, int] = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _subprojects_by_stage_id: dict[UUID, Subproject] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _completed_subprojects: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._reindex_subprojects()
+
+    def _reindex_subprojects(self) -> None:
+        self._subprojects_by_id = {subproject.id: subproject for subproject in self.subprojects}
+        self._subproject_names = Counter(subproject.name for subproject in self.subprojects)
+        self._subprojects_by_stage_id = {
+            stage.id: subproject for subproject in self.subprojects for stage in subproject.stages
+        }
+        self._completed_subprojects = sum(
+            subproject.status == SubprojectStatus.COMPLETED for subproject in self.subprojects
+        )
 
     @classmethod
     def create(cls, name: str, description: str | None = None, subprojects: list[Subproject] | None = None) -> Self:
@@ -45,7 +68,16 @@ class Project:
             files=[],
         )
 
+    @property
+    def is_partial(self) -> bool:
+        return self.unloaded_subprojects is not None
+
+    def _ensure_fully_loaded(self) -> None:
+        if self.is_partial:
+            raise DomainError(f"Операция недоступна для частично загруженного проекта {self.id}")
+
     def add_file(self, filename: str, content_type: str, size: int, path: str) -> None:
+        self._ensure_fully_loaded()
         file = FileAttachment.create(
             filename=filename,
             content_type=content_type,
@@ -64,6 +96,7 @@ class Project:
 
 
     def make_template_from_subproject(self, subproject_id: UUID):
+        self._ensure_fully_loaded()
         subproject = self.get_subproject_by_id(subproject_id)
         if self.template is not None:
             self.template.stages = [
@@ -85,55 +118,118 @@ class Project:
             )
             self.template = template
 
-    def _update_status(self):
-        if len(self.subprojects) == 0:
-            self.status = ProjectStatus.CREATED
+    def instantiate_template(self, names: list[str]) -> list[Subproject]:
+        """
+        Создаёт подпроекты по шаблону проекта; статус и прогресс проекта пересчитываются один раз в конце.
 
+        Уникальность имён проверяется по загруженным подпроектам, поэтому частично загруженный проект
+        должен содержать все подпроекты с совпадающими именами.
+        """
+        if self.template is None:
+            raise DomainError(f"У проекта {self.id} отсутствует шаблон")
+        subprojects = [Subproject.from_template(name, self.template) for name in names]
+        # Все имена проверяются до изменения агрегата, чтобы ошибка не оставила его частично изменённым
+        new_names = Counter(subproject.name for subproject in subprojects)
+        for name, count in new_names.items():
+            if self._subproject_names[name]:
+                raise DomainError(f"Подпроект с названием {name} уже существует у данного проекта")
+            if count > 1:
+                raise DomainError(f"Подпроект с названием {name} указан несколько раз")
+        for subproject in subprojects:
+            self.subprojects.append(subproject)
+            self._subprojects_by_id[subproject.id] = subproject
+            self._subproject_names[subproject.name] += 1
+            self._completed_subprojects += subproject.status == SubprojectStatus.COMPLETED
+            for stage in subproject.stages:
+                self._subprojects_by_stage_id[stage.id] = subproject
+        self._update_status()
+        self.updated_at = datetime.now(UTC).replace(tzinfo=None)
+        return subprojects
+
+    def _subprojects_rollup(self) -> tuple[int, int]:
+        completed, total = self._completed_subprojects, len(self.subprojects)
+        if self.unloaded_subprojects is not None:
+            completed += self.unloaded_subprojects.completed
+            total += self.unloaded_subprojects.total
+        return completed, total
+
+    def _recount_subprojects(self) -> tuple[int, int]:
+        """Полный пересчёт по подпроектам, используется для проверки счётчиков"""
         child_statuses = tuple(subproject.status for subproject in self.subprojects)
+        total = len(child_statuses)
+        completed = child_statuses.count(SubprojectStatus.COMPLETED)
+        if self.unloaded_subprojects is not None:
+            total += self.unloaded_subprojects.total
+            completed += self.unloaded_subprojects.completed
+        return completed, total
 
-        if len(child_statuses) == 0:
+    def _update_status(self, subproject: Subproject | None = None, was_completed: bool = False):
+        if subproject is not None:
+            self._completed_subprojects += (subproject.status == SubprojectStatus.COMPLETED) - was_completed
+        completed, total = self._subprojects_rollup()
+
+        if total == 0:
             self.progress = 0
         else:
-            self.progress = child_statuses.count(SubprojectStatus.COMPLETED) / len(child_statuses)
+            self.progress = completed / total
 
-        if all(child_status == SubprojectStatus.COMPLETED for child_status in child_statuses):
+        if completed == total:
             self.status = ProjectStatus.COMPLETED
-
         else:
             self.status = ProjectStatus.IN_PROGRESS
 
     def add_subproject(self, subproject: Subproject) -> None:
-        if next(filter(lambda current_subproject: current_subproject.name == subproject.name, self.subprojects), None):
+        self._ensure_fully_loaded()
+        if self._subproject_names[subproject.name]:
             raise DomainError(f"Подпроект с названием {subproject.name} уже существует у данного проекта")
         self.subprojects.append(subproject)
-        self._update_status()
+        self._subprojects_by_id[subproject.id] = subproject
+        self._subproject_names[subproject.name] += 1
+        for stage in subproject.stages:
+            self._subprojects_by_stage_id[stage.id] = subproject
+        self._update_status(subproject)
         self.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
     def remove_subproject(self, subproject_id: UUID) -> None:
-        subproject_to_remove = next(
-            filter(lambda current_subproject: current_subproject.id == subproject_id, self.subprojects), None
-        )
+        self._ensure_fully_loaded()
+        subproject_to_remove = self._subprojects_by_id.get(subproject_id)
         if subproject_to_remove is None:
             raise DomainError(f"Подпроект с идентификатором {subproject_id} не найден у данного проекта")
 
         self.subprojects.remove(subproject_to_remove)
+        del self._subprojects_by_id[subproject_id]
+        self._subproject_names[subproject_to_remove.name] -= 1
+        for stage in subproject_to_remove.stages:
+            self._subprojects_by_stage_id.pop(stage.id, None)
+        self._completed_subprojects -= subproject_to_remove.status == SubprojectStatus.COMPLETED
         self._update_status()
         self.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
     def get_subproject_by_id(self, subproject_id: UUID) -> Subproject:
-        subproject =  next(filter(lambda sp: sp.id == subproject_id, self.subprojects), None)
+        subproject = self._subprojects_by_id.get(subproject_id)
         if subproject is None:
             raise DomainError(f"Подпроект с id `{subproject_id}` не найден")
         return subproject
 
     def get_stage_by_id(self, stage_id: UUID) -> Stage | None:
-        for subproject in self.subprojects:
-            stage = next((stage for stage in subproject.stages if stage.id == stage_id), None)
-            if stage is not None:
-                return stage
+        subproject = self.get_subproject_by_stage_id(stage_id)
+        if subproject is not None:
+            return subproject.get_stage_by_id(stage_id)
 
     def get_subproject_by_stage_id(self, stage_id: UUID) -> Subproject | None:
-        return next(filter(lambda sp: any(stage.id == stage_id for stage in sp.stages), self.subprojects), None)
+        subproject = self._subprojects_by_stage_id.get(stage_id)
+        if subproject is None or not subproject.has_stage(stage_id):
+            # Этапы могли быть добавлены или перенесены в обход агрегата
+            self._reindex_subprojects()
+            subproject = self._subprojects_by_stage_id.get(stage_id)
+        return subproject
+
+    def add_stage(self, subproject_id: UUID, stage: Stage) -> None:
+        subproject = self.get_subproject_by_id(subproject_id)
+        was_completed = subproject.status == SubprojectStatus.COMPLETED
+        subproject.add_stage(stage)
+        self._subprojects_by_stage_id[stage.id] = subproject
+        self._update_status(subproject, was_completed)
 
     def update(self, name: str, description: str | None = None) -> None:
         self.name = ProjectName.create(name)
@@ -157,21 +253,43 @@ class Project:
         subproject_with_stage = self.get_subproject_by_stage_id(stage_id)
         if subproject_with_stage is None:
             raise DomainError(f"Подпроект с этапом {stage_id} не найден")
+        was_completed = subproject_with_stage.status == SubprojectStatus.COMPLETED
         stage = subproject_with_stage.change_stage_status(stage_id, status, message)
-        self._update_status()
+        self._update_status(subproject_with_stage, was_completed)
         return stage
 
-    def add_message_to_stage(self, stage_id: UUID, message: Message) -> Stage:
-        subproject_with_stage = self.get_subproject_by_stage_id(stage_id)
-        if subproject_with_stage is None:
-            raise DomainError(f"Подпроект с этапом {stage_id} не найден")
-        stage = subproject_with_stage.add_message_to_stage(stage_id, message)
-        return stage
+    def change_stage_statuses(self, changes: list[tuple[UUID, str, Message | None]]) -> list[Stage]:
+        """Пакетная смена статусов этапов; статусы подпроектов и прогресс проекта пересчитываются один раз"""
+        changes_by_subproject: dict[UUID, tuple[Subproject, list[tuple[UUID, str, Message | None]]]] = {}
+        seen_stage_ids = set()
+        for stage_id, status, message in changes:
+            if stage_id in seen_stage_ids:
+                raise DomainError(f"Этап {stage_id} указан в пакете несколько раз")
+            seen_stage_ids.add(stage_id)
+            subproject_with_stage = self.get_subproject_by_stage_id(stage_id)
+            if subproject_with_stage is None:
+                raise DomainError(f"Подпроект с этапом {stage_id} не найден")
+            changes_by_subproject.setdefault(subproject_with_stage.id, (subproject_with_stage, []))[1].append(
+                (stage_id, status, message)
+            )
+
+        stages_by_id: dict[UUID, Stage] = {}
+        for subproject, subproject_changes in changes_by_subproject.values():
+            was_completed = subproject.status == SubprojectStatus.COMPLETED
+            for stage in subproject.change_stage_statuses(subproject_changes):
+                stages_by_id[stage.id] = stage
+            self._completed_subprojects += (subproject.status == SubprojectStatus.COMPLETED) - was_completed
+        self._update_status()
+        return [stages_by_id[stage_id] for stage_id, _, _ in changes]
 
     def remove_stage(self, stage_id: UUID) -> None:
         subproject_with_stage = self.get_subproject_by_stage_id(stage_id)
+        if subproject_with_stage is None:
+            raise DomainError(f"Подпроект с этапом {stage_id} не найден")
+        was_completed = subproject_with_stage.status == SubprojectStatus.COMPLETED
         subproject_with_stage.remove_stage(stage_id)
-        self._update_status()
+        del self._subprojects_by_stage_id[stage_id]
+        self._update_status(subproject_with_stage, was_completed)
         self.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
     def update_subproject(
@@ -180,6 +298,8 @@ class Project:
         name: str,
         description: str | None = None,
     ) -> Subproject:
-        subproject: Subproject = next(filter(lambda sp: sp.id == subproject_id, self.subprojects), None)
+        subproject = self.get_subproject_by_id(subproject_id)
+        self._subproject_names[subproject.name] -= 1
         subproject.update(name, description)
+        self._subproject_names[subproject.name] += 1
         return subproject
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Self
+from uuid import UUID, uuid4
+
+from src.project_service.domain.value_objects.message_text import MessageText
+
+
+@dataclass(slots=True)
+class StageMessage:
+    """
+    Сообщение этапа как отдельный агрегат.
+
+    Кроме существования этапа у сообщения нет инвариантов, связанных с проектом, поэтому для его добавления
+    не нужно загружать агрегат проекта.
+    """
+
+    id: UUID
+    stage_id: UUID
+    created_at: datetime
+    author_id: UUID
+    text: MessageText
+
+    @classmethod
+    def create(cls, stage_id: UUID, author_id: UUID, text: str) -> Self:
+        return cls(
+            id=uuid4(),
+            stage_id=stage_id,
+            created_at=datetime.now(UTC).replace(tzinfo=None),
+            author_id=author_id,
+            text=MessageText.create(text),
+        )
@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 from src.project_service.domain.value_objects.filename import FileName
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAttachment:
     id: UUID
     filename: FileName
@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 from src.project_service.domain.value_objects.message_text import MessageText
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     id: UUID
     created_at: datetime
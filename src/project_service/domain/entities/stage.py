@@ -11,7 +11,7 @@ from src.project_service.domain.value_objects.stage_description import StageDesc
 from src.project_service.domain.value_objects.stage_name import StageName
 
 
-@dataclass
+@dataclass(slots=True)
 class Stage:
     id: UUID
     name: StageName
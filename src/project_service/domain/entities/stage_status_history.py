@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 from src.project_service.domain.value_objects.enums import StageStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class StageStatusHistory:
     id: UUID
     stage_id: UUID
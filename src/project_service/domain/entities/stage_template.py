@@ -6,7 +6,7 @@ from src.project_service.domain.value_objects.stage_description import StageDesc
 from src.project_service.domain.value_objects.stage_name import StageName
 
 
-@dataclass
+@dataclass(slots=True)
 class StageTemplate:
     id: UUID
     name: str
@@ -1,3 +1,4 @@
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from typing import Self
@@ -9,12 +10,13 @@ from src.common.exceptions.domain import DomainError
 from src.project_service.domain.entities.file_attachment import FileAttachment
 from src.project_service.domain.entities.message import Message
 from src.project_service.domain.entities.stage import Stage, StageStatus
+from src.project_service.domain.entities.subproject_template import SubprojectTemplate
 from src.project_service.domain.value_objects.enums import SubprojectStatus
 from src.project_service.domain.value_objects.subproject_description import SubprojectDescription
 from src.project_service.domain.value_objects.subproject_name import SubprojectName
 
 
-@dataclass
+@dataclass(slots=True)
 class Subproject:
     id: UUID
     name: SubprojectName
@@ -26,6 +28,18 @@ class Subproject:
     stages: list[Stage]
     files: list[FileAttachment]
 
+    _stages_by_id: dict[UUID, Stage] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _stage_names: dict[str, int] = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _completed_stages: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._reindex_stages()
+
+    def _reindex_stages(self) -> None:
+        self._stages_by_id = {stage.id: stage for stage in self.stages}
+        self._stage_names = Counter(stage.name for stage in self.stages)
+        self._completed_stages = self._recount_stages()[0]
+
     @classmethod
     def create(cls, name: str, description: str | None = None, stages: list[Stage] | None = None) -> Self:
         if stages is None:
@@ -42,17 +56,33 @@ class Subproject:
             files=[]
         )
 
-    def _update_status(self):
-        if len(self.stages) == 0:
-            self.status = SubprojectStatus.CREATED
+    @classmethod
+    def from_template(cls, name: str, template: SubprojectTemplate) -> Self:
+        """Подпроект с этапами шаблона в том же состоянии, что и после поэтапного add_stage"""
+        subproject = cls.create(
+            name=name,
+            stages=[Stage.create(stage.name, stage.description) for stage in template.stages],
+        )
+        if subproject.stages:
+            subproject._update_status()
+        return subproject
+
+    def _stages_rollup(self) -> tuple[int, int]:
+        return self._completed_stages, len(self.stages)
 
+    def _recount_stages(self) -> tuple[int, int]:
+        """Полный пересчёт по этапам, используется для проверки счётчиков"""
         child_statuses = tuple(stage.status for stage in self.stages)
-        if len(child_statuses) == 0:
+        return child_statuses.count(StageStatus.COMPLETED), len(child_statuses)
+
+    def _update_status(self):
+        completed, total = self._stages_rollup()
+        if total == 0:
             self.progress = 0
         else:
-            self.progress = child_statuses.count(StageStatus.COMPLETED) / len(child_statuses)
+            self.progress = completed / total
 
-        if all(child_status == StageStatus.COMPLETED for child_status in child_statuses):
+        if completed == total:
             self.status = SubprojectStatus.COMPLETED
         else:
             self.status = SubprojectStatus.IN_PROGRESS
@@ -71,15 +101,21 @@ class Subproject:
         stage.add_file(filename, content_type, size, path)
 
     def add_stage(self, stage: Stage) -> None:
-        if next(filter(lambda current_stages: current_stages.name == stage.name, self.stages), None):
+        if self._stage_names[stage.name]:
             raise DomainError(f"Этап с названием {stage.name} уже существует у данного подпроекта")
         self.stages.append(stage)
+        self._stages_by_id[stage.id] = stage
+        self._stage_names[stage.name] += 1
+        self._completed_stages += stage.status == StageStatus.COMPLETED
         self._update_status()
         self.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
     def remove_stage(self, stage_id: UUID) -> None:
         stage_to_remove = self.get_stage_by_id(stage_id)
         self.stages.remove(stage_to_remove)
+        del self._stages_by_id[stage_id]
+        self._stage_names[stage_to_remove.name] -= 1
+        self._completed_stages -= stage_to_remove.status == StageStatus.COMPLETED
         self._update_status()
         self.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
@@ -90,25 +126,40 @@ class Subproject:
         description: str | None = None,
     ) -> Stage:
         stage = self.get_stage_by_id(stage_id)
+        self._stage_names[stage.name] -= 1
         stage.update(name, description)
+        self._stage_names[stage.name] += 1
         return stage
 
+    def has_stage(self, stage_id: UUID) -> bool:
+        if stage_id not in self._stages_by_id:
+            # Этапы могли быть добавлены в список напрямую, минуя add_stage
+            self._reindex_stages()
+        return stage_id in self._stages_by_id
+
     def get_stage_by_id(self, stage_id: UUID) -> Stage:
-        stage = next(filter(lambda current_stages: current_stages.id == stage_id, self.stages), None)
-        if stage is None:
+        if not self.has_stage(stage_id):
             raise DomainError(f"Этап с ID {stage_id} не найден")
-        return stage
+        return self._stages_by_id[stage_id]
 
     def change_stage_status(self, stage_id: UUID, status: str, message: Message | None) -> Stage:
         stage = self.get_stage_by_id(stage_id)
+        was_completed = stage.status == StageStatus.COMPLETED
         stage.change_status(status, message)
+        self._completed_stages += (stage.status == StageStatus.COMPLETED) - was_completed
         self._update_status()
         return stage
 
-    def add_message_to_stage(self, stage_id: UUID, message: Message) -> Stage:
-        stage = self.get_stage_by_id(stage_id)
-        stage.add_message(message)
-        return stage
+    def change_stage_statuses(self, changes: list[tuple[UUID, str, Message | None]]) -> list[Stage]:
+        stages = []
+        for stage_id, status, message in changes:
+            stage = self.get_stage_by_id(stage_id)
+            was_completed = stage.status == StageStatus.COMPLETED
+            stage.change_status(status, message)
+            self._completed_stages += (stage.status == StageStatus.COMPLETED) - was_completed
+            stages.append(stage)
+        self._update_status()
+        return stages
 
     def update(self, name: str, description: str | None = None) -> None:
         self.name = SubprojectName.create(name)
@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 from src.project_service.domain.entities.stage_template import StageTemplate
 
 
-@dataclass
+@dataclass(slots=True)
 class SubprojectTemplate:
     id: UUID
     stages: list[StageTemplate]
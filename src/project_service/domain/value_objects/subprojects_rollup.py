@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Self
+
+from src.common.exceptions.domain import DomainError
+
+
+@dataclass(frozen=True)
+class SubprojectsRollup:
+    """Сводка по подпроектам, не загруженным в агрегат"""
+
+    total: int
+    completed: int
+
+    @classmethod
+    def create(cls, total: int, completed: int) -> Self:
+        if total < 0 or completed < 0 or completed > total:
+            raise DomainError(f"Некорректная сводка по подпроектам: {completed}/{total}")
+        return cls(total=total, completed=completed)
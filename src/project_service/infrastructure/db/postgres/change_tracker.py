@@ -0,0 +1,183 @@
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from src.common.db.base_models import IdBase
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.file_attachment import FileAttachment
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    ProjectFileAttachmentModel,
+    SubprojectTemplateModel,
+    StageTemplateModel,
+    SubprojectModel,
+    SubprojectFileAttachmentModel,
+    StageModel,
+    StageFileAttachmentModel,
+    MessageModel,
+)
+
+Row = dict[str, Any]
+Rows = dict[type[IdBase], dict[UUID, Row]]
+
+# Порядок вставки: родительские таблицы раньше дочерних. Удаление выполняется в обратном порядке.
+MODELS_ORDER: tuple[type[IdBase], ...] = (
+    ProjectModel,
+    ProjectFileAttachmentModel,
+    SubprojectTemplateModel,
+    StageTemplateModel,
+    SubprojectModel,
+    SubprojectFileAttachmentModel,
+    StageModel,
+    StageFileAttachmentModel,
+    MessageModel,
+)
+
+# Дочерняя таблица -> (внешний ключ, родительская таблица) для каскадного удаления на стороне БД.
+CASCADE_PARENTS: dict[type[IdBase], tuple[str, type[IdBase]]] = {
+    ProjectFileAttachmentModel: ("project_id", ProjectModel),
+    StageTemplateModel: ("subproject_template_id", SubprojectTemplateModel),
+    SubprojectModel: ("project_id", ProjectModel),
+    SubprojectFileAttachmentModel: ("subproject_id", SubprojectModel),
+    StageModel: ("subproject_id", SubprojectModel),
+    StageFileAttachmentModel: ("stage_id", StageModel),
+    MessageModel: ("stage_id", StageModel),
+}
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    inserts: dict[type[IdBase], list[Row]] = field(default_factory=dict)
+    updates: dict[type[IdBase], list[Row]] = field(default_factory=dict)
+    deletes: dict[type[IdBase], list[UUID]] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.inserts or self.updates or self.deletes)
+
+
+def _file_row(file: FileAttachment, owner_key: str, owner_id: UUID) -> Row:
+    return {
+        "id": file.id,
+        owner_key: owner_id,
+        "filename": file.filename,
+        "content_type": file.content_type,
+        "size": file.size,
+        "uploaded_at": file.uploaded_at,
+        "path": file.path,
+    }
+
+
+def project_rows(project: Project) -> Rows:
+    rows: Rows = {model: {} for model in MODELS_ORDER}
+    rows[ProjectModel][project.id] = {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+        "status": project.status,
+        "progress": project.progress,
+    }
+    for file in project.files:
+        rows[ProjectFileAttachmentModel][file.id] = _file_row(file, "project_id", project.id)
+
+    if project.template is not None:
+        rows[SubprojectTemplateModel][project.template.id] = {"id": project.template.id, "project_id": project.id}
+        for stage_template in project.template.stages:
+            rows[StageTemplateModel][stage_template.id] = {
+                "id": stage_template.id,
+                "subproject_template_id": project.template.id,
+                "name": stage_template.name,
+                "description": stage_template.description,
+            }
+
+    for subproject in project.subprojects:
+        rows[SubprojectModel][subproject.id] = {
+            "id": subproject.id,
+            "project_id": project.id,
+            "name": subproject.name,
+            "description": subproject.description,
+            "created_at": subproject.created_at,
+            "updated_at": subproject.updated_at,
+            "status": subproject.status,
+            "progress": subproject.progress,
+        }
+        for file in subproject.files:
+            rows[SubprojectFileAttachmentModel][file.id] = _file_row(file, "subproject_id", subproject.id)
+
+        for stage in subproject.stages:
+            rows[StageModel][stage.id] = {
+                "id": stage.id,
+                "subproject_id": subproject.id,
+                "name": stage.name,
+                "description": stage.description,
+                "created_at": stage.created_at,
+                "updated_at": stage.updated_at,
+                "status": stage.status,
+            }
+            for file in stage.files:
+                rows[StageFileAttachmentModel][file.id] = _file_row(file, "stage_id", stage.id)
+            for message in stage.messages:
+                rows[MessageModel][message.id] = {
+                    "id": message.id,
+                    "stage_id": stage.id,
+                    "created_at": message.created_at,
+                    "author_id": message.author_id,
+                    "text": message.text,
+                }
+    return rows
+
+
+def diff_rows(before: Rows, after: Rows) -> ChangeSet:
+    change_set = ChangeSet()
+    deleted: dict[type[IdBase], set[UUID]] = {}
+    for model in MODELS_ORDER:
+        old_rows = before.get(model, {})
+        new_rows = after.get(model, {})
+
+        inserts = [row for row_id, row in new_rows.items() if row_id not in old_rows]
+        if inserts:
+            change_set.inserts[model] = inserts
+
+        updates = []
+        for row_id, row in new_rows.items():
+            old_row = old_rows.get(row_id)
+            if old_row is None:
+                continue
+            changed = {key: value for key, value in row.items() if old_row.get(key) != value}
+            if changed:
+                changed["id"] = row_id
+                updates.append(changed)
+        if updates:
+            change_set.updates[model] = updates
+
+        deleted[model] = {row_id for row_id in old_rows if row_id not in new_rows}
+        parent_key, parent_model = CASCADE_PARENTS.get(model, (None, None))
+        explicit_deletes = [
+            row_id
+            for row_id in deleted[model]
+            if parent_model is None or old_rows[row_id][parent_key] not in deleted[parent_model]
+        ]
+        if explicit_deletes:
+            change_set.deletes[model] = explicit_deletes
+    return change_set
+
+
+class ProjectChangeTracker:
+    """Хранит снимки загруженных агрегатов и вычисляет изменения относительно них"""
+
+    def __init__(self):
+        self._snapshots: dict[UUID, Rows] = {}
+
+    def track(self, project: Project) -> None:
+        self._snapshots[project.id] = project_rows(project)
+
+    def is_tracked(self, project_id: UUID) -> bool:
+        return project_id in self._snapshots
+
+    def forget(self, project_id: UUID) -> None:
+        self._snapshots.pop(project_id, None)
+
+    def changes(self, project: Project) -> ChangeSet:
+        return diff_rows(self._snapshots.get(project.id, {}), project_rows(project))
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import UUID as DBUUID, String, ForeignKey, DateTime, func, Float, Integer
+from sqlalchemy import UUID as DBUUID, String, ForeignKey, DateTime, func, Float, Integer, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 
@@ -11,6 +11,9 @@ from src.common.db.base_models import IdBase
 
 class ProjectModel(IdBase):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -38,6 +41,9 @@ class ProjectModel(IdBase):
 
 class ProjectFileAttachmentModel(IdBase):
     __tablename__ = "project_files"
+    __table_args__ = (
+        Index("ix_project_files_project_id", "project_id"),
+    )
 
     project_id: Mapped[UUID] = mapped_column(DBUUID, ForeignKey("projects.id", ondelete="CASCADE"))
     project: Mapped[ProjectModel] = relationship(back_populates="files")
@@ -51,6 +57,10 @@ class ProjectFileAttachmentModel(IdBase):
 
 class SubprojectModel(IdBase):
     __tablename__ = "subprojects"
+    __table_args__ = (
+        Index("ix_subprojects_project_id_updated_at_id", "project_id", "updated_at", "id"),
+        Index("ix_subprojects_updated_at_id", "updated_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -78,6 +88,9 @@ class SubprojectModel(IdBase):
 
 class SubprojectFileAttachmentModel(IdBase):
     __tablename__ = "subproject_files"
+    __table_args__ = (
+        Index("ix_subproject_files_subproject_id", "subproject_id"),
+    )
 
     subproject_id: Mapped[UUID] = mapped_column(DBUUID, ForeignKey("subprojects.id", ondelete="CASCADE"))
     subproject: Mapped[SubprojectModel] = relationship(back_populates="files")
@@ -90,6 +103,10 @@ class SubprojectFileAttachmentModel(IdBase):
 
 class StageModel(IdBase):
     __tablename__ = "stages"
+    __table_args__ = (
+        Index("ix_stages_subproject_id_updated_at_id", "subproject_id", "updated_at", "id"),
+        Index("ix_stages_updated_at_id", "updated_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -122,6 +139,9 @@ class StageModel(IdBase):
 
 class StageFileAttachmentModel(IdBase):
     __tablename__ = "stage_files"
+    __table_args__ = (
+        Index("ix_stage_files_stage_id", "stage_id"),
+    )
 
     stage_id: Mapped[UUID] = mapped_column(DBUUID, ForeignKey("stages.id", ondelete="CASCADE"))
     stage: Mapped[StageModel] = relationship(back_populates="files")
@@ -134,6 +154,9 @@ class StageFileAttachmentModel(IdBase):
 
 class MessageModel(IdBase):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_stage_id_created_at", "stage_id", "created_at"),
+    )
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     author_id: Mapped[UUID] = mapped_column(DBUUID, nullable=False)
@@ -152,6 +175,9 @@ class MessageModel(IdBase):
 
 class SubprojectTemplateModel(IdBase):
     __tablename__ = "subproject_templates"
+    __table_args__ = (
+        Index("ix_subproject_templates_project_id", "project_id"),
+    )
 
     project_id: Mapped[UUID] = mapped_column(
         DBUUID(as_uuid=True),
@@ -172,6 +198,9 @@ class SubprojectTemplateModel(IdBase):
 
 class StageTemplateModel(IdBase):
     __tablename__ = "stage_templates"
+    __table_args__ = (
+        Index("ix_stage_templates_subproject_template_id", "subproject_template_id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -190,8 +219,75 @@ class StageTemplateModel(IdBase):
 
 class StageStatusHistoryModel(IdBase):
     __tablename__ = "stage_status_history"
+    __table_args__ = (
+        Index("ix_stage_status_history_stage_id_changed_at_id", "stage_id", "changed_at", "id"),
+    )
 
     stage_id: Mapped[UUID] = mapped_column(DBUUID(as_uuid=True))
     to_status: Mapped[str] = mapped_column(String(16), nullable=False)
     changed_by: Mapped[UUID] = mapped_column(DBUUID(as_uuid=True))
     changed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
+# Проекции для чтения. Заполняются обработчиками событий и не имеют внешних ключей на таблицы записи,
+# чтобы списки читались одной таблицей без соединений.
+
+
+class ProjectSummaryModel(IdBase):
+    __tablename__ = "project_summary"
+    __table_args__ = (
+        Index("ix_project_summary_created_at_id", "created_at", "id"),
+    )
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    progress: Mapped[float] = mapped_column(Float, nullable=False)
+    subprojects_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_subprojects_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    files_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SubprojectSummaryModel(IdBase):
+    __tablename__ = "subproject_summary"
+    __table_args__ = (
+        Index("ix_subproject_summary_project_id_updated_at_id", "project_id", "updated_at", "id"),
+        Index("ix_subproject_summary_updated_at_id", "updated_at", "id"),
+    )
+
+    project_id: Mapped[UUID] = mapped_column(DBUUID(as_uuid=True), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    progress: Mapped[float] = mapped_column(Float, nullable=False)
+    stages_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_stages_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    files_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class StageCardModel(IdBase):
+    __tablename__ = "stage_card"
+    __table_args__ = (
+        Index("ix_stage_card_subproject_id_updated_at_id", "subproject_id", "updated_at", "id"),
+        Index("ix_stage_card_updated_at_id", "updated_at", "id"),
+        Index("ix_stage_card_project_id", "project_id"),
+        Index("ix_stage_card_last_message_author_id", "last_message_author_id"),
+    )
+
+    project_id: Mapped[UUID] = mapped_column(DBUUID(as_uuid=True), nullable=False)
+    subproject_id: Mapped[UUID] = mapped_column(DBUUID(as_uuid=True), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    files_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    messages_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_message_text: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_message_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_message_author_id: Mapped[Optional[UUID]] = mapped_column(DBUUID(as_uuid=True), nullable=True)
+    last_message_author_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -1,31 +1,59 @@
 from uuid import UUID
 
-from sqlalchemy import select, func, delete, desc
+from sqlalchemy import select, func, delete, desc, insert, update, cast, Text
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload, selectinload, joinedload
 
 from src.common.db.counter import count_queries
+from src.common.db.json_tree import json_object, json_list
+from src.common.db.keyset import Keyset, seek
+from src.common.db.page import fetch_page, columns_for
 from src.common.exceptions.domain import DomainError
 from src.common.exceptions.infrastructure import InfrastructureError
 from src.project_service.domain.aggregates.project import Project
 from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import SubprojectStatus
+from src.project_service.domain.value_objects.subprojects_rollup import SubprojectsRollup
+from src.project_service.infrastructure.db.postgres.change_tracker import (
+    MODELS_ORDER,
+    ChangeSet,
+    ProjectChangeTracker,
+)
 from src.project_service.infrastructure.db.postgres.models import (
     ProjectModel,
     SubprojectModel,
     StageModel,
     SubprojectTemplateModel,
+    StageTemplateModel,
+    ProjectFileAttachmentModel,
+    SubprojectFileAttachmentModel,
+    StageFileAttachmentModel,
+    MessageModel,
+    ProjectSummaryModel,
+    SubprojectSummaryModel,
+    StageCardModel,
 )
-from src.project_service.infrastructure.mappers.project import project_to_orm, project_to_domain
+from src.project_service.infrastructure.mappers.project import project_to_domain, project_slice_to_domain
 from src.project_service.infrastructure.mappers.stage import stage_to_domain
 from src.project_service.infrastructure.mappers.subproject import subproject_to_domain
-from src.project_service.infrastructure.read_models.subproject import SubprojectRead
+from src.project_service.infrastructure.mappers.template import subproject_template_to_domain
+from src.project_service.infrastructure.read_models.file_attachment import FileAttachmentRead
+from src.project_service.infrastructure.read_models.message import StageMessageRead
+from src.project_service.infrastructure.read_models.project import ProjectRead, ProjectSummaryRead
+from src.project_service.infrastructure.read_models.stage import StageCardRead
+from src.project_service.infrastructure.read_models.subproject import SubprojectRead, SubprojectSummaryRead
+from src.project_service.infrastructure.read_models.template import SubprojectTemplateRead, StageTemplateRead
+
+# Изменения агрегата пишутся в обход identity map, поэтому при повторной загрузке ORM-объекты перечитываются
+AGGREGATE_LOAD_OPTIONS = {"populate_existing": True}
 
 
 class ProjectRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.tracker = ProjectChangeTracker()
 
     @count_queries
     async def count(self) -> int:
@@ -35,33 +63,13 @@ class ProjectRepository:
 
     @count_queries
     async def add(self, project: Project) -> None:
-        orm_project = project_to_orm(project)
-        self.session.add(orm_project)
+        await self._apply(self.tracker.changes(project))
+        self.tracker.track(project)
 
     @count_queries
     async def get(self, project_id: UUID) -> Project:
-        stmt = (
-            select(ProjectModel)
-            .where(ProjectModel.id == project_id)
-            .options(
-                joinedload(ProjectModel.template).joinedload(SubprojectTemplateModel.stages),
-                selectinload(ProjectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.messages),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.files)
-            )
-        )
-        result = await self.session.execute(stmt)
-        try:
-            orm_project = result.unique().scalar_one()
-        except NoResultFound:
-            raise InfrastructureError(f"Проект с ID {project_id} не найден")
-        return project_to_domain(orm_project)
+        stmt = self._aggregate_query().where(ProjectModel.id == project_id)
+        return await self._load_aggregate(stmt, f"Проект с ID {project_id} не найден")
 
     @count_queries
     async def get_many(self, limit: int, offset: int) -> list[Project]:
@@ -83,172 +91,285 @@ class ProjectRepository:
 
     @count_queries
     async def update(self, project: Project) -> Project:
-        orm_project = project_to_orm(project)
-        new_project = await self.session.merge(
-            orm_project,
-            options=[
-                joinedload(ProjectModel.template).selectinload(SubprojectTemplateModel.stages),
-                selectinload(ProjectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.messages),
-            ],
-        )
-        return project_to_domain(new_project)
+        if not self.tracker.is_tracked(project.id):
+            raise InfrastructureError(f"Проект с ID {project.id} не был загружен в текущей единице работы")
+        await self._apply(self.tracker.changes(project))
+        self.tracker.track(project)
+        return project
 
     @count_queries
     async def get_by_subproject(self, subproject_id: UUID) -> Project:
-        stmt = (
-            select(SubprojectModel)
+        project_id = (
+            select(SubprojectModel.project_id)
             .where(SubprojectModel.id == subproject_id)
-            .options(joinedload(SubprojectModel.project))
+            .scalar_subquery()
         )
-        result_subproject = await self.session.execute(stmt)
-        subproject = result_subproject.scalar_one_or_none()
+        stmt = self._aggregate_query().where(ProjectModel.id == project_id)
+        return await self._load_aggregate(stmt, f"Проект, содержащий подпроект с ID {subproject_id}, не найден")
 
-        if subproject is None or subproject.project is None:
-            raise InfrastructureError(f"Проект, содержащий подпроект с ID {subproject_id}, не найден")
+    @count_queries
+    async def get_by_stage(self, stage_id: UUID) -> Project:
+        project_id = (
+            select(SubprojectModel.project_id)
+            .join(StageModel, StageModel.subproject_id == SubprojectModel.id)
+            .where(StageModel.id == stage_id)
+            .scalar_subquery()
+        )
+        stmt = self._aggregate_query().where(ProjectModel.id == project_id)
+        return await self._load_aggregate(stmt, f"Проект, содержащий этап с ID {stage_id}, не найден")
 
-        stmt_project = (
-            select(ProjectModel)
-            .where(ProjectModel.id == subproject.project.id)
-            .options(
-                joinedload(ProjectModel.template).selectinload(SubprojectTemplateModel.stages),
-                selectinload(ProjectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.messages),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.files),
-            )
+    @staticmethod
+    def _aggregate_query():
+        return select(ProjectModel).options(
+            joinedload(ProjectModel.template).joinedload(SubprojectTemplateModel.stages),
+            selectinload(ProjectModel.files),
+            selectinload(ProjectModel.subprojects).selectinload(SubprojectModel.files),
+            selectinload(ProjectModel.subprojects)
+            .selectinload(SubprojectModel.stages)
+            .selectinload(StageModel.messages),
+            selectinload(ProjectModel.subprojects)
+            .selectinload(SubprojectModel.stages)
+            .selectinload(StageModel.files),
         )
-        result_project = await self.session.execute(stmt_project)
-        orm_project = result_project.unique().scalar_one_or_none()
 
+    async def _load_aggregate(self, stmt, not_found_message: str) -> Project:
+        result = await self.session.execute(stmt, execution_options=AGGREGATE_LOAD_OPTIONS)
+        orm_project = result.unique().scalar_one_or_none()
         if orm_project is None:
-            raise InfrastructureError(f"Проект, содержащий подпроект с ID {subproject_id}, не найден")
-        return project_to_domain(orm_project)
+            raise InfrastructureError(not_found_message)
+        return self._track(project_to_domain(orm_project))
 
     @count_queries
-    async def get_by_stage(self, stage_id: UUID) -> Project:
+    async def get_slice_by_stage(self, stage_id: UUID) -> Project:
         stmt = (
-            select(StageModel)
+            self._slice_query()
+            .join(StageModel, StageModel.subproject_id == SubprojectModel.id)
             .where(StageModel.id == stage_id)
-            .options(joinedload(StageModel.subproject).joinedload(SubprojectModel.project))
         )
+        return await self._load_slice(stmt, f"Проект, содержащий этап с ID {stage_id}, не найден")
 
-        result_stage = await self.session.execute(stmt)
-        stage = result_stage.scalar_one_or_none()
+    @count_queries
+    async def get_slice_by_subproject(self, subproject_id: UUID) -> Project:
+        stmt = self._slice_query().where(SubprojectModel.id == subproject_id)
+        return await self._load_slice(stmt, f"Проект, содержащий подпроект с ID {subproject_id}, не найден")
 
-        if stage is None or stage.subproject is None or stage.subproject.project is None:
-            raise InfrastructureError(f"Проект, содержащий этап с ID {stage_id}, не найден")
+    @count_queries
+    async def get_slice_by_stages(self, stage_ids: list[UUID]) -> Project:
+        """Срез проекта с подпроектами, которым принадлежат этапы пакета; этапы должны быть из одного проекта"""
+        subproject_ids = select(StageModel.subproject_id).where(StageModel.id.in_(stage_ids))
+        stmt = self._slice_query().where(SubprojectModel.id.in_(subproject_ids))
+        return await self._load_slice(stmt, "Проект, содержащий этапы пакета, не найден")
 
+    @staticmethod
+    def _slice_query():
+        return select(SubprojectModel).options(
+            joinedload(SubprojectModel.project).options(
+                noload(ProjectModel.subprojects),
+                noload(ProjectModel.files),
+                noload(ProjectModel.template),
+            ),
+            selectinload(SubprojectModel.files),
+            selectinload(SubprojectModel.stages).selectinload(StageModel.messages),
+            selectinload(SubprojectModel.stages).selectinload(StageModel.files),
+        )
+
+    async def _load_slice(self, stmt, not_found_message: str) -> Project:
+        result = await self.session.execute(stmt, execution_options=AGGREGATE_LOAD_OPTIONS)
+        orm_subprojects = result.unique().scalars().all()
+        if not orm_subprojects or orm_subprojects[0].project is None:
+            raise InfrastructureError(not_found_message)
+        project_id = orm_subprojects[0].project_id
+        if any(orm_subproject.project_id != project_id for orm_subproject in orm_subprojects):
+            raise DomainError("Этапы пакета должны принадлежать одному проекту")
+
+        rollup_stmt = select(
+            func.count(),
+            func.count().filter(SubprojectModel.status == SubprojectStatus.COMPLETED),
+        ).where(
+            SubprojectModel.project_id == project_id,
+            SubprojectModel.id.not_in([orm_subproject.id for orm_subproject in orm_subprojects]),
+        )
+        total, completed = (await self.session.execute(rollup_stmt)).one()
+        return self._track(
+            project_slice_to_domain(
+                orm_subprojects[0].project,
+                orm_subprojects,
+                SubprojectsRollup.create(total=total, completed=completed),
+            )
+        )
+
+    @count_queries
+    async def get_for_template(self, project_id: UUID, subproject_names: list[str]) -> Project:
+        """
+        Срез проекта для создания подпроектов по шаблону: шаблон и только подпроекты с указанными именами,
+        чтобы агрегат мог проверить уникальность имён. Остальные подпроекты учитываются сводкой.
+        """
         stmt = (
             select(ProjectModel)
-            .where(ProjectModel.id == stage.subproject.project.id)
+            .where(ProjectModel.id == project_id)
             .options(
                 joinedload(ProjectModel.template).joinedload(SubprojectTemplateModel.stages),
-                selectinload(ProjectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.files),
-                selectinload(ProjectModel.subprojects)
-                .selectinload(SubprojectModel.stages)
-                .selectinload(StageModel.messages),
+                noload(ProjectModel.subprojects),
+                noload(ProjectModel.files),
             )
         )
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(stmt, execution_options=AGGREGATE_LOAD_OPTIONS)
         orm_project = result.unique().scalar_one_or_none()
         if orm_project is None:
-            raise InfrastructureError(f"Проект, содержащий этап с ID {stage_id}, не найден")
-        return project_to_domain(orm_project)
+            raise InfrastructureError(f"Проект с ID {project_id} не найден")
+
+        subprojects_stmt = (
+            select(SubprojectModel)
+            .where(SubprojectModel.project_id == project_id, SubprojectModel.name.in_(subproject_names))
+            .options(
+                selectinload(SubprojectModel.files),
+                selectinload(SubprojectModel.stages).selectinload(StageModel.messages),
+                selectinload(SubprojectModel.stages).selectinload(StageModel.files),
+            )
+        )
+        result = await self.session.execute(subprojects_stmt, execution_options=AGGREGATE_LOAD_OPTIONS)
+        orm_subprojects = result.scalars().all()
+
+        rollup_stmt = select(
+            func.count(),
+            func.count().filter(SubprojectModel.status == SubprojectStatus.COMPLETED),
+        ).where(
+            SubprojectModel.project_id == project_id,
+            SubprojectModel.id.not_in([orm_subproject.id for orm_subproject in orm_subprojects]),
+        )
+        total, completed = (await self.session.execute(rollup_stmt)).one()
+        project = project_slice_to_domain(
+            orm_project, orm_subprojects, SubprojectsRollup.create(total=total, completed=completed)
+        )
+        project.template = subproject_template_to_domain(orm_project.template) if orm_project.template else None
+        return self._track(project)
+
+    def _track(self, project: Project) -> Project:
+        self.tracker.track(project)
+        return project
+
+    async def _apply(self, change_set: ChangeSet) -> None:
+        for model in MODELS_ORDER:
+            if rows := change_set.inserts.get(model):
+                await self.session.execute(insert(model), rows)
+        for model in MODELS_ORDER:
+            if rows := change_set.updates.get(model):
+                await self.session.execute(update(model), rows)
+        for model in reversed(MODELS_ORDER):
+            if ids := change_set.deletes.get(model):
+                stmt = delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+                await self.session.execute(stmt)
 
     async def delete(self, project_id: UUID) -> None:
         stmt = delete(ProjectModel).where(ProjectModel.id == project_id)
         result = await self.session.execute(stmt)
         if result.rowcount == 0:
             raise DomainError("Проект с указанным ID отсутствует")
+        self.tracker.forget(project_id)
 
 
 class ProjectReadRepository:
+    """Списки читаются из проекций (project_summary, subproject_summary, stage_card), карточки - из таблиц записи"""
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @count_queries
+    async def projects_count(self) -> int:
+        stmt = select(func.count()).select_from(ProjectSummaryModel)
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
     @count_queries
     async def subprojects_count(self, **filters) -> int:
-        stmt = select(func.count()).select_from(SubprojectModel)
+        stmt = select(func.count()).select_from(SubprojectSummaryModel)
         if project_id := filters.get("project_id", False):
-            stmt = stmt.where(SubprojectModel.project_id == project_id)
+            stmt = stmt.where(SubprojectSummaryModel.project_id == project_id)
         result = await self.session.execute(stmt)
         return result.scalar()
 
     @count_queries
-    async def get_subprojects(self, limit: int, offset: int, **filters) -> list[SubprojectRead]:
+    async def get_subprojects(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[SubprojectSummaryRead], int | None]:
         stmt = (
-            select(SubprojectModel)
+            self._subprojects_query(**filters)
+            .order_by(desc(SubprojectSummaryModel.updated_at), desc(SubprojectSummaryModel.id))
             .limit(limit)
             .offset(offset)
-            .order_by(desc(SubprojectModel.updated_at))
-            .options(
-                noload(SubprojectModel.stages),
-                noload(SubprojectModel.project),
-                noload(SubprojectModel.files),
-            )
         )
-        if project_id := filters.get("project_id", False):
-            stmt = stmt.where(SubprojectModel.project_id == project_id)
+        return await fetch_page(self.session, stmt, with_total, SubprojectSummaryRead)
+
+    @count_queries
+    async def get_subprojects_after(
+        self, limit: int, after: Keyset | None, **filters
+    ) -> list[SubprojectSummaryRead]:
+        stmt = seek(
+            self._subprojects_query(**filters),
+            SubprojectSummaryModel.updated_at,
+            SubprojectSummaryModel.id,
+            after,
+            limit,
+        )
         result = await self.session.execute(stmt)
-        orm_subprojects = result.scalars().all()
-        return [SubprojectRead.model_validate(orm_subproject) for orm_subproject in orm_subprojects]
+        return [SubprojectSummaryRead(*row) for row in result]
+
+    @staticmethod
+    def _subprojects_query(**filters):
+        stmt = select(*columns_for(SubprojectSummaryModel, SubprojectSummaryRead))
+        if project_id := filters.get("project_id", False):
+            stmt = stmt.where(SubprojectSummaryModel.project_id == project_id)
+        return stmt
 
     @count_queries
     async def get_subproject(self, subproject_id: UUID) -> SubprojectRead:
-        stmt = (
-            select(SubprojectModel)
-            .where(SubprojectModel.id == subproject_id)
-            .options(
-                selectinload(SubprojectModel.files),
-                noload(SubprojectModel.stages),
-                noload(SubprojectModel.project),
-            )
-        )
+        stmt = select(*columns_for(SubprojectModel, SubprojectRead)).where(SubprojectModel.id == subproject_id)
         result = await self.session.execute(stmt)
-        try:
-            orm_subproject = result.scalar_one()
-        except NoResultFound:
+        row = result.one_or_none()
+        if row is None:
             raise InfrastructureError(f"Подпроект с ID {subproject_id} не найден")
-        return SubprojectRead.model_validate(orm_subproject)
+        return SubprojectRead(*row)
 
     @count_queries
     async def stages_count(self, **filters) -> int:
-        stmt = select(func.count()).select_from(StageModel)
+        stmt = select(func.count()).select_from(StageCardModel)
         if subproject_id := filters.get("subproject_id", False):
-            stmt = stmt.where(StageModel.subproject_id == subproject_id)
+            stmt = stmt.where(StageCardModel.subproject_id == subproject_id)
         result = await self.session.execute(stmt)
         return result.scalar()
 
     @count_queries
-    async def get_stages(self, limit: int, offset: int, **filters) -> list[Stage]:
+    async def get_stages(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[StageCardRead], int | None]:
         stmt = (
-            select(StageModel)
-            .order_by(desc(StageModel.updated_at))
+            self._stages_query(**filters)
+            .order_by(desc(StageCardModel.updated_at), desc(StageCardModel.id))
             .limit(limit)
             .offset(offset)
-            .options(
-                noload(StageModel.files),
-                selectinload(StageModel.messages),
-            )
         )
-        if subproject_id := filters.get("subproject_id", False):
-            stmt = stmt.where(StageModel.subproject_id == subproject_id)
+        return await fetch_page(self.session, stmt, with_total, StageCardRead)
+
+    @count_queries
+    async def get_stages_after(self, limit: int, after: Keyset | None, **filters) -> list[StageCardRead]:
+        stmt = seek(self._stages_query(**filters), StageCardModel.updated_at, StageCardModel.id, after, limit)
         result = await self.session.execute(stmt)
-        orm_stages = result.unique().scalars().all()
-        return [stage_to_domain(stage) for stage in orm_stages]
+        return [StageCardRead(*row) for row in result]
+
+    @staticmethod
+    def _stages_query(**filters):
+        stmt = select(*columns_for(StageCardModel, StageCardRead))
+        if subproject_id := filters.get("subproject_id", False):
+            stmt = stmt.where(StageCardModel.subproject_id == subproject_id)
+        return stmt
+
+    @count_queries
+    async def get_messages_after(self, limit: int, after: Keyset | None, **filters) -> list[StageMessageRead]:
+        stmt = select(*columns_for(MessageModel, StageMessageRead))
+        if stage_id := filters.get("stage_id", False):
+            stmt = stmt.where(MessageModel.stage_id == stage_id)
+        result = await self.session.execute(seek(stmt, MessageModel.created_at, MessageModel.id, after, limit))
+        return [StageMessageRead(*row) for row in result]
 
     @count_queries
     async def get_stage(self, stage_id: UUID) -> Stage:
@@ -268,39 +389,143 @@ class ProjectReadRepository:
         return stage_to_domain(orm_stage)
 
     @count_queries
-    async def get_projects(self, limit: int, offset: int, **filters) -> list[Project]:
+    async def get_projects(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[ProjectSummaryRead], int | None]:
         stmt = (
-            select(ProjectModel)
+            self._projects_query()
+            .order_by(desc(ProjectSummaryModel.created_at), desc(ProjectSummaryModel.id))
             .limit(limit)
             .offset(offset)
-            .order_by(desc(ProjectModel.created_at))
-            .options(
-                noload(ProjectModel.template),
-                noload(ProjectModel.subprojects),
-                noload(ProjectModel.files),
-            )
         )
+        return await fetch_page(self.session, stmt, with_total, ProjectSummaryRead)
+
+    @count_queries
+    async def get_projects_after(self, limit: int, after: Keyset | None, **filters) -> list[ProjectSummaryRead]:
+        stmt = seek(self._projects_query(), ProjectSummaryModel.created_at, ProjectSummaryModel.id, after, limit)
         result = await self.session.execute(stmt)
-        orm_projects = result.scalars().all()
-        # return [ProjectRead.model_validate(orm_project) for orm_project in orm_projects]
-        return [project_to_domain(orm_project) for orm_project in orm_projects]
+        return [ProjectSummaryRead(*row) for row in result]
+
+    @staticmethod
+    def _projects_query():
+        return select(*columns_for(ProjectSummaryModel, ProjectSummaryRead))
 
     @count_queries
-    async def get_project(self, project_id: UUID) -> Project:
+    async def get_project(self, project_id: UUID) -> ProjectRead:
         stmt = (
-            select(ProjectModel)
+            select(
+                ProjectModel.id,
+                ProjectModel.name,
+                ProjectModel.description,
+                ProjectModel.created_at,
+                ProjectModel.updated_at,
+                ProjectModel.status,
+                ProjectModel.progress,
+                SubprojectTemplateModel.id.label("template_id"),
+                StageTemplateModel.id.label("stage_template_id"),
+                StageTemplateModel.name.label("stage_template_name"),
+                StageTemplateModel.description.label("stage_template_description"),
+            )
+            .outerjoin(SubprojectTemplateModel, SubprojectTemplateModel.project_id == ProjectModel.id)
+            .outerjoin(StageTemplateModel, StageTemplateModel.subproject_template_id == SubprojectTemplateModel.id)
             .where(ProjectModel.id == project_id)
-            .order_by(desc(ProjectModel.created_at))
-            .options(
-                joinedload(ProjectModel.template)
-                .joinedload(SubprojectTemplateModel.stages),
-                selectinload(ProjectModel.files),
-                noload(ProjectModel.subprojects),
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            raise InfrastructureError(f"Проект с ID {project_id} не найден")
+        project = ProjectRead(*rows[0][:7])
+        if rows[0].template_id is not None:
+            project.template = SubprojectTemplateRead(
+                id=rows[0].template_id,
+                stages=[
+                    StageTemplateRead(row.stage_template_id, row.stage_template_name, row.stage_template_description)
+                    for row in rows
+                    if row.stage_template_id is not None
+                ],
             )
+
+        files_stmt = select(*columns_for(ProjectFileAttachmentModel, FileAttachmentRead)).where(
+            ProjectFileAttachmentModel.project_id == project_id
         )
-        result = await self.session.execute(stmt)
-        try:
-            orm_project = result.unique().scalar_one()
-        except NoResultFound:
+        project.files = [FileAttachmentRead(*row) for row in await self.session.execute(files_stmt)]
+        return project
+
+    @count_queries
+    async def get_project_tree_json(self, project_id: UUID) -> bytes:
+        """Проект со всеми подпроектами, этапами, сообщениями и файлами одним JSON-документом, собранным в Postgres"""
+        stmt = select(cast(self._project_tree_document(), Text)).where(ProjectModel.id == project_id)
+        document = (await self.session.execute(stmt)).scalar_one_or_none()
+        if document is None:
             raise InfrastructureError(f"Проект с ID {project_id} не найден")
-        return project_to_domain(orm_project)
+        return document.encode()
+
+    @staticmethod
+    def _project_tree_document():
+        def files(model, owner_id, owner):
+            return json_list(
+                json_object(*columns_for(model, FileAttachmentRead)), owner_id == owner, order_by=model.uploaded_at
+            )
+
+        messages = json_list(
+            json_object(MessageModel.id, MessageModel.created_at, MessageModel.author_id, MessageModel.text),
+            MessageModel.stage_id == StageModel.id,
+            order_by=MessageModel.created_at,
+        )
+        stages = json_list(
+            json_object(
+                StageModel.id,
+                StageModel.name,
+                StageModel.description,
+                StageModel.created_at,
+                StageModel.updated_at,
+                StageModel.status,
+                files=files(StageFileAttachmentModel, StageFileAttachmentModel.stage_id, StageModel.id),
+                messages=messages,
+            ),
+            StageModel.subproject_id == SubprojectModel.id,
+            order_by=StageModel.created_at,
+        )
+        subprojects = json_list(
+            json_object(
+                SubprojectModel.id,
+                SubprojectModel.name,
+                SubprojectModel.description,
+                SubprojectModel.created_at,
+                SubprojectModel.updated_at,
+                SubprojectModel.status,
+                SubprojectModel.progress,
+                files=files(
+                    SubprojectFileAttachmentModel, SubprojectFileAttachmentModel.subproject_id, SubprojectModel.id
+                ),
+                stages=stages,
+            ),
+            SubprojectModel.project_id == ProjectModel.id,
+            order_by=SubprojectModel.created_at,
+        )
+        template = (
+            select(
+                json_object(
+                    SubprojectTemplateModel.id,
+                    stages=json_list(
+                        json_object(*columns_for(StageTemplateModel, StageTemplateRead)),
+                        StageTemplateModel.subproject_template_id == SubprojectTemplateModel.id,
+                        order_by=StageTemplateModel.name,
+                    ),
+                )
+            )
+            .where(SubprojectTemplateModel.project_id == ProjectModel.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        return json_object(
+            ProjectModel.id,
+            ProjectModel.name,
+            ProjectModel.description,
+            ProjectModel.created_at,
+            ProjectModel.updated_at,
+            ProjectModel.status,
+            ProjectModel.progress,
+            files=files(ProjectFileAttachmentModel, ProjectFileAttachmentModel.project_id, ProjectModel.id),
+            template=template,
+            subprojects=subprojects,
+        )
@@ -0,0 +1,231 @@
+from uuid import UUID
+
+from sqlalchemy import select, func, delete, update, desc, true, case, Select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.db.base_models import IdBase
+from src.common.db.counter import count_queries
+from src.project_service.domain.value_objects.enums import SubprojectStatus, StageStatus
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    ProjectFileAttachmentModel,
+    SubprojectModel,
+    SubprojectFileAttachmentModel,
+    StageModel,
+    StageFileAttachmentModel,
+    MessageModel,
+    ProjectSummaryModel,
+    SubprojectSummaryModel,
+    StageCardModel,
+)
+
+
+class ProjectionRepository:
+    """
+    Поддерживает проекции для чтения (project_summary, subproject_summary, stage_card).
+
+    Строки проекций не изменяются инкрементально, а пересчитываются по текущему состоянию таблиц записи
+    одним INSERT ... SELECT ... ON CONFLICT на таблицу, поэтому повторная или запоздавшая обработка
+    события не портит данные.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @count_queries
+    async def refresh_project(self, project_id: UUID) -> None:
+        await self._upsert(ProjectSummaryModel, self._project_rows().where(ProjectModel.id == project_id))
+
+    @count_queries
+    async def refresh_subprojects(self, subproject_id: UUID | None = None, project_id: UUID | None = None) -> None:
+        stmt = self._subproject_rows()
+        if subproject_id is not None:
+            stmt = stmt.where(SubprojectModel.id == subproject_id)
+        if project_id is not None:
+            stmt = stmt.where(SubprojectModel.project_id == project_id)
+        await self._upsert(SubprojectSummaryModel, stmt)
+
+    @count_queries
+    async def refresh_stages(
+        self,
+        stage_id: UUID | None = None,
+        subproject_id: UUID | None = None,
+        project_id: UUID | None = None,
+        stage_ids: list[UUID] | None = None,
+    ) -> None:
+        stmt = self._stage_rows()
+        if stage_id is not None:
+            stmt = stmt.where(StageModel.id == stage_id)
+        if stage_ids is not None:
+            stmt = stmt.where(StageModel.id.in_(stage_ids))
+        if subproject_id is not None:
+            stmt = stmt.where(StageModel.subproject_id == subproject_id)
+        if project_id is not None:
+            stmt = stmt.where(SubprojectModel.project_id == project_id)
+        await self._upsert(StageCardModel, stmt)
+
+    async def refresh_project_tree(self, project_id: UUID) -> None:
+        await self.refresh_project(project_id)
+        await self.refresh_subprojects(project_id=project_id)
+        await self.refresh_stages(project_id=project_id)
+
+    async def refresh_subproject_tree(self, subproject_id: UUID, project_id: UUID) -> None:
+        await self.refresh_subprojects(subproject_id=subproject_id)
+        await self.refresh_stages(subproject_id=subproject_id)
+        await self.refresh_project(project_id)
+
+    async def refresh_stage_lineage(self, stage_id: UUID) -> None:
+        """Этап, его подпроект и проект: статус и прогресс родителей зависят от этапа"""
+        subproject_id = select(StageModel.subproject_id).where(StageModel.id == stage_id).scalar_subquery()
+        project_id = select(SubprojectModel.project_id).where(SubprojectModel.id == subproject_id).scalar_subquery()
+        await self.refresh_stages(stage_id=stage_id)
+        await self.refresh_subprojects(subproject_id=subproject_id)
+        await self.refresh_project(project_id)
+
+    async def refresh_stages_lineage(self, stage_ids: list[UUID], project_id: UUID) -> None:
+        """Этапы пакета, их подпроекты и проект; остальные строки проекта не пересчитываются"""
+        subproject_ids = select(StageModel.subproject_id).where(StageModel.id.in_(stage_ids))
+        await self.refresh_stages(stage_ids=stage_ids)
+        stmt = self._subproject_rows().where(SubprojectModel.id.in_(subproject_ids))
+        await self._upsert(SubprojectSummaryModel, stmt)
+        await self.refresh_project(project_id)
+
+    @count_queries
+    async def remove_project(self, project_id: UUID) -> None:
+        await self.session.execute(delete(StageCardModel).where(StageCardModel.project_id == project_id))
+        await self.session.execute(
+            delete(SubprojectSummaryModel).where(SubprojectSummaryModel.project_id == project_id)
+        )
+        await self.session.execute(delete(ProjectSummaryModel).where(ProjectSummaryModel.id == project_id))
+
+    @count_queries
+    async def remove_subproject(self, subproject_id: UUID) -> None:
+        await self.session.execute(delete(StageCardModel).where(StageCardModel.subproject_id == subproject_id))
+        await self.session.execute(
+            delete(SubprojectSummaryModel).where(SubprojectSummaryModel.id == subproject_id)
+        )
+
+    @count_queries
+    async def remove_stage(self, stage_id: UUID) -> None:
+        await self.session.execute(delete(StageCardModel).where(StageCardModel.id == stage_id))
+
+    @count_queries
+    async def set_author_name(self, author_id: UUID, name: str) -> None:
+        stmt = (
+            update(StageCardModel)
+            .where(StageCardModel.last_message_author_id == author_id)
+            .values(last_message_author_name=name)
+        )
+        await self.session.execute(stmt)
+
+    async def _upsert(self, model: type[IdBase], rows: Select) -> None:
+        columns = [column.name for column in rows.selected_columns]
+        stmt = insert(model).from_select(columns, rows)
+        values = {column: stmt.excluded[column] for column in columns if column != "id"}
+        if model is StageCardModel:
+            # Имя автора приходит из сервиса пользователей отдельно; сохраняем его, пока автор не сменился
+            values["last_message_author_name"] = case(
+                (
+                    StageCardModel.last_message_author_id.is_not_distinct_from(
+                        stmt.excluded.last_message_author_id
+                    ),
+                    StageCardModel.last_message_author_name,
+                ),
+                else_=None,
+            )
+        await self.session.execute(stmt.on_conflict_do_update(index_elements=[model.id], set_=values))
+
+    @staticmethod
+    def _project_rows() -> Select:
+        subprojects = (
+            select(
+                func.count().label("total"),
+                func.count().filter(SubprojectModel.status == SubprojectStatus.COMPLETED).label("completed"),
+            )
+            .where(SubprojectModel.project_id == ProjectModel.id)
+            .lateral()
+        )
+        files = (
+            select(func.count().label("total"))
+            .where(ProjectFileAttachmentModel.project_id == ProjectModel.id)
+            .lateral()
+        )
+        return select(
+            ProjectModel.id,
+            ProjectModel.name,
+            ProjectModel.description,
+            ProjectModel.created_at,
+            ProjectModel.updated_at,
+            ProjectModel.status,
+            ProjectModel.progress,
+            subprojects.c.total.label("subprojects_count"),
+            subprojects.c.completed.label("completed_subprojects_count"),
+            files.c.total.label("files_count"),
+        ).select_from(ProjectModel.__table__.join(subprojects, true()).join(files, true()))
+
+    @staticmethod
+    def _subproject_rows() -> Select:
+        stages = (
+            select(
+                func.count().label("total"),
+                func.count().filter(StageModel.status == StageStatus.COMPLETED).label("completed"),
+            )
+            .where(StageModel.subproject_id == SubprojectModel.id)
+            .lateral()
+        )
+        files = (
+            select(func.count().label("total"))
+            .where(SubprojectFileAttachmentModel.subproject_id == SubprojectModel.id)
+            .lateral()
+        )
+        return select(
+            SubprojectModel.id,
+            SubprojectModel.project_id,
+            SubprojectModel.name,
+            SubprojectModel.description,
+            SubprojectModel.created_at,
+            SubprojectModel.updated_at,
+            SubprojectModel.status,
+            SubprojectModel.progress,
+            stages.c.total.label("stages_count"),
+            stages.c.completed.label("completed_stages_count"),
+            files.c.total.label("files_count"),
+        ).select_from(SubprojectModel.__table__.join(stages, true()).join(files, true()))
+
+    @staticmethod
+    def _stage_rows() -> Select:
+        files = (
+            select(func.count().label("total"))
+            .where(StageFileAttachmentModel.stage_id == StageModel.id)
+            .lateral()
+        )
+        messages = select(func.count().label("total")).where(MessageModel.stage_id == StageModel.id).lateral()
+        last_message = (
+            select(MessageModel.text, MessageModel.created_at, MessageModel.author_id)
+            .where(MessageModel.stage_id == StageModel.id)
+            .order_by(desc(MessageModel.created_at))
+            .limit(1)
+            .lateral()
+        )
+        return select(
+            StageModel.id,
+            SubprojectModel.project_id,
+            StageModel.subproject_id,
+            StageModel.name,
+            StageModel.description,
+            StageModel.created_at,
+            StageModel.updated_at,
+            StageModel.status,
+            files.c.total.label("files_count"),
+            messages.c.total.label("messages_count"),
+            last_message.c.text.label("last_message_text"),
+            last_message.c.created_at.label("last_message_at"),
+            last_message.c.author_id.label("last_message_author_id"),
+        ).select_from(
+            StageModel.__table__
+            .join(SubprojectModel.__table__, SubprojectModel.id == StageModel.subproject_id)
+            .join(files, true())
+            .join(messages, true())
+            .outerjoin(last_message, true())
+        )
@@ -0,0 +1,21 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.db.counter import count_queries
+from src.common.exceptions.infrastructure import InfrastructureError
+from src.project_service.domain.aggregates.stage_message import StageMessage
+from src.project_service.infrastructure.mappers.message import message_to_orm
+
+
+class StageMessageRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @count_queries
+    async def add(self, message: StageMessage) -> None:
+        # Один INSERT; существование этапа проверяет внешний ключ messages.stage_id
+        self.session.add(message_to_orm(message))
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            raise InfrastructureError(f"Этап с ID {message.stage_id} не найден")
@@ -2,6 +2,8 @@ from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.db.counter import count_queries
+from src.common.db.keyset import Keyset, seek
+from src.common.db.page import fetch_page
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.infrastructure.db.postgres.models import StageStatusHistoryModel
 from src.project_service.infrastructure.mappers.stage_status_history import (
@@ -27,15 +29,29 @@ class StageStatusHistoryRepository:
         return result.scalar()
 
     @count_queries
-    async def get_many(self, limit: int, offset: int, **filters) -> list[StageStatusHistory]:
-        stmt = (
-            select(StageStatusHistoryModel)
-            .order_by(desc(StageStatusHistoryModel.changed_at))
-            .limit(limit)
-            .offset(offset)
+    async def get_many(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[StageStatusHistory], int | None]:
+        stmt = self._query(**filters).order_by(desc(StageStatusHistoryModel.changed_at)).limit(limit).offset(offset)
+        orm_objs, total = await fetch_page(self.session, stmt, with_total)
+        return [stage_status_history_to_domain(orm_obj) for orm_obj in orm_objs], total
+
+    @count_queries
+    async def get_many_after(self, limit: int, after: Keyset | None, **filters) -> list[StageStatusHistory]:
+        stmt = seek(
+            self._query(**filters),
+            StageStatusHistoryModel.changed_at,
+            StageStatusHistoryModel.id,
+            after,
+            limit,
         )
+        result = await self.session.execute(stmt)
+        orm_objs = result.scalars().all()
+        return [stage_status_history_to_domain(orm_obj) for orm_obj in orm_objs]
+
+    @staticmethod
+    def _query(**filters):
+        stmt = select(StageStatusHistoryModel)
         if stage_id := filters.get("stage_id", False):
             stmt = stmt.where(StageStatusHistoryModel.stage_id == stage_id)
-        result = await self.session.execute(stmt)
-        orn_objs = result.unique().scalars().all()
-        return [stage_status_history_to_domain(orn_obj) for orn_obj in orn_objs]
+        return stmt
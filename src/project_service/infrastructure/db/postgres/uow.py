@@ -2,9 +2,12 @@ from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.db.count import CountProvider
 from src.project_service.application.protocols import IProjectRepository, IProjectReadRepository
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.infrastructure.db.postgres.repositories.project import ProjectRepository, ProjectReadRepository
+from src.project_service.infrastructure.db.postgres.repositories.projection import ProjectionRepository
+from src.project_service.infrastructure.db.postgres.repositories.stage_message import StageMessageRepository
 from src.project_service.infrastructure.db.postgres.repositories.stage_status_history import (
     StageStatusHistoryRepository,
 )
@@ -22,6 +25,9 @@ class ProjectServiceUoW:
         self.projects = ProjectRepository(self.session)
         self.projects_read = ProjectReadRepository(self.session)
         self.stage_status_history = StageStatusHistoryRepository(self.session)
+        self.stage_messages = StageMessageRepository(self.session)
+        self.projections = ProjectionRepository(self.session)
+        self.totals = CountProvider(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -1,5 +1,6 @@
 from functools import singledispatch
 
+from src.project_service.domain.aggregates.stage_message import StageMessage
 from src.project_service.domain.entities.message import Message
 from src.project_service.domain.value_objects.message_text import MessageText
 from src.project_service.infrastructure.db.postgres.models import MessageModel
@@ -15,6 +16,17 @@ def _(obj: Message) -> MessageModel:
     return MessageModel(id=obj.id, created_at=obj.created_at, author_id=obj.author_id, text=obj.text)
 
 
+@message_to_orm.register
+def _(obj: StageMessage) -> MessageModel:
+    return MessageModel(
+        id=obj.id,
+        stage_id=obj.stage_id,
+        created_at=obj.created_at,
+        author_id=obj.author_id,
+        text=obj.text,
+    )
+
+
 @singledispatch
 def message_to_domain(obj) -> Message:
     raise NotImplementedError(f"No domain mapper for {type(obj)}")
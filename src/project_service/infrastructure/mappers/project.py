@@ -3,7 +3,8 @@ from functools import singledispatch
 from src.project_service.domain.aggregates.project import Project, ProjectStatus
 from src.project_service.domain.value_objects.project_description import ProjectDescription
 from src.project_service.domain.value_objects.project_name import ProjectName
-from src.project_service.infrastructure.db.postgres.models import ProjectModel
+from src.project_service.domain.value_objects.subprojects_rollup import SubprojectsRollup
+from src.project_service.infrastructure.db.postgres.models import ProjectModel, SubprojectModel
 from src.project_service.infrastructure.mappers.project_files import project_file_to_orm, project_file_to_domain
 from src.project_service.infrastructure.mappers.subproject import subproject_to_orm, subproject_to_domain
 from src.project_service.infrastructure.mappers.template import (
@@ -52,3 +53,25 @@ def _(obj: ProjectModel) -> Project:
         subprojects=[subproject_to_domain(subproject) for subproject in obj.subprojects],
         template=subproject_template_to_domain(obj.template) if obj.template else None,
     )
+
+
+@singledispatch
+def project_slice_to_domain(obj, subprojects: list[SubprojectModel], unloaded_subprojects: SubprojectsRollup) -> Project:
+    raise NotImplementedError(f"No domain mapper for {type(obj)}")
+
+
+@project_slice_to_domain.register
+def _(obj: ProjectModel, subprojects: list[SubprojectModel], unloaded_subprojects: SubprojectsRollup) -> Project:
+    return Project(
+        id=obj.id,
+        name=ProjectName(obj.name),
+        description=ProjectDescription(obj.description) if obj.description else None,
+        created_at=obj.created_at,
+        updated_at=obj.updated_at,
+        status=ProjectStatus(obj.status),
+        progress=obj.progress,
+        files=[],
+        subprojects=[subproject_to_domain(subproject) for subproject in subprojects],
+        template=None,
+        unloaded_subprojects=unloaded_subprojects,
+    )
@@ -1,13 +1,13 @@
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
 
-
-class FileAttachmentRead(BaseModel):
+@dataclass(slots=True)
+class FileAttachmentRead:
     id: UUID
     filename: str
     content_type: str
     size: int
     uploaded_at: datetime
-    path: str
\ No newline at end of file
+    path: str
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
@@ -9,3 +10,11 @@ class MessageRead(BaseModel):
     created_at: datetime
     author: dict
     text: str
+
+
+@dataclass(slots=True)
+class StageMessageRead:
+    id: UUID
+    created_at: datetime
+    author_id: UUID
+    text: str
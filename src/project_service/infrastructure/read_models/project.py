@@ -1,12 +1,13 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
-
+from src.project_service.infrastructure.read_models.file_attachment import FileAttachmentRead
 from src.project_service.infrastructure.read_models.template import SubprojectTemplateRead
 
 
-class ProjectRead(BaseModel):
+@dataclass(slots=True)
+class ProjectRead:
     id: UUID
     name: str
     description: str | None
@@ -14,7 +15,19 @@ class ProjectRead(BaseModel):
     updated_at: datetime
     status: str
     progress: float
-    # subprojects: list[SubprojectRead]
-    template: SubprojectTemplateRead | None
+    files: list[FileAttachmentRead] = field(default_factory=list)
+    template: SubprojectTemplateRead | None = None
+
 
-    model_config = ConfigDict(from_attributes=True)
+@dataclass(slots=True)
+class ProjectSummaryRead:
+    id: UUID
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+    status: str
+    progress: float
+    subprojects_count: int
+    completed_subprojects_count: int
+    files_count: int
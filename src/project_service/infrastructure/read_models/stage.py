@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
@@ -16,3 +17,21 @@ class StageRead(BaseModel):
     status: str
     files: list[FileAttachmentRead]
     messages: list[MessageRead]
+
+
+@dataclass(slots=True)
+class StageCardRead:
+    id: UUID
+    project_id: UUID
+    subproject_id: UUID
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+    status: str
+    files_count: int
+    messages_count: int
+    last_message_text: str | None
+    last_message_at: datetime | None
+    last_message_author_id: UUID | None
+    last_message_author_name: str | None
@@ -1,10 +1,10 @@
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
 
-
-class SubprojectRead(BaseModel):
+@dataclass(slots=True)
+class SubprojectRead:
     id: UUID
     name: str
     description: str | None
@@ -14,4 +14,17 @@ class SubprojectRead(BaseModel):
     status: str
     project_id: UUID
 
-    model_config = ConfigDict(from_attributes=True)
+
+@dataclass(slots=True)
+class SubprojectSummaryRead:
+    id: UUID
+    project_id: UUID
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+    status: str
+    progress: float
+    stages_count: int
+    completed_stages_count: int
+    files_count: int
@@ -1,14 +1,15 @@
-from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass
+from uuid import UUID
 
 
-class StageTemplateRead(BaseModel):
+@dataclass(slots=True)
+class StageTemplateRead:
+    id: UUID
     name: str
-    description: str
+    description: str | None
 
-    model_config = ConfigDict(from_attributes=True)
 
-
-class SubprojectTemplateRead(BaseModel):
+@dataclass(slots=True)
+class SubprojectTemplateRead:
+    id: UUID
     stages: list[StageTemplateRead]
-
-    model_config = ConfigDict(from_attributes=True)
@@ -3,7 +3,7 @@ from typing import Annotated, List, AsyncIterator
 from uuid import UUID
 
 from dishka import FromDishka
-from litestar import Controller, post, get, delete, put
+from litestar import Controller, post, get, delete, put, MediaType
 from litestar.datastructures import UploadFile
 from litestar.dto import DTOData
 from litestar.enums import RequestEncodingType
@@ -12,19 +12,34 @@ from loguru import logger
 from minio import Minio
 from types_aiobotocore_s3.client import S3Client
 
-from src.common.litestar_.di.filters import get_limit_offset_filters, LimitOffsetFilterRequest
+from src.common.litestar_.di.filters import (
+    get_limit_offset_filters,
+    LimitOffsetFilterRequest,
+    get_cursor_filters,
+    CursorFilterRequest,
+)
 from src.common.litestar_.guards.permission import PermissionGuard
+from src.common.litestar_.pagination import OffsetPage
 from src.common.message_bus.interfaces import IMessageBus
+from src.project_service.application.events.project import ProjectUpdatedEvent
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.application.services.store import generate_unique_object_key
-from src.project_service.application.use_cases.read.project import GetProjectUseCase, GetProjectsUseCase
+from src.project_service.application.use_cases.read.project import (
+    GetProjectUseCase,
+    GetProjectTreeUseCase,
+    GetProjectsUseCase,
+    GetProjectsByCursorUseCase,
+)
 from src.project_service.application.use_cases.write.project import (
     CreateProjectUseCase,
     DeleteProjectUseCase,
     UpdateProjectUseCase,
     CreateTemplateForProjectUseCase,
 )
+from src.project_service.application.use_cases.write.subproject import ApplyTemplateUseCase
 from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.infrastructure.read_models.project import ProjectRead, ProjectSummaryRead
 from src.project_service.presentation.dto.project import (
     ProjectCreateRequestDTO,
     ProjectCreateResponseDTO,
@@ -32,13 +47,16 @@ from src.project_service.presentation.dto.project import (
     ProjectResponseDTO,
     ProjectUpdateRequestDTO,
     CreateTemplateRequestDTO,
+    ApplyTemplateRequestDTO,
 )
+from src.project_service.presentation.dto.subproject import SubprojectShortResponseDTO
 from src.project_service.presentation.schemas.project import (
     ProjectCreateSchema,
     ProjectUpdateRequestSchema,
     CreateTemplateRequestSchema,
+    ApplyTemplateRequestSchema,
 )
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 
 
 class ProjectsController(Controller):
@@ -65,7 +83,6 @@ class ProjectsController(Controller):
 
     @get(
         path="",
-        return_dto=ProjectShortResponseDTO,
         dependencies={"pagination": get_limit_offset_filters},
         guards=[PermissionGuard("projects:read")],
         summary="Получить проекты",
@@ -74,18 +91,46 @@ class ProjectsController(Controller):
         self,
         uow: FromDishka[IProjectServiceUoW],
         pagination: LimitOffsetFilterRequest,
-    ) -> OffsetPagination[Project]:
+    ) -> OffsetPage[ProjectSummaryRead]:
         use_case = GetProjectsUseCase(uow)
-        result = await use_case.execute(limit=pagination.limit, offset=pagination.offset)
+        result = await use_case.execute(
+            limit=pagination.limit, offset=pagination.offset, with_total=pagination.with_total
+        )
+        return result
+
+    @get(
+        path="/cursor",
+        dependencies={"pagination": get_cursor_filters},
+        guards=[PermissionGuard("projects:read")],
+        summary="Получить проекты по курсору",
+    )
+    async def list_by_cursor(
+        self,
+        uow: FromDishka[IProjectServiceUoW],
+        pagination: CursorFilterRequest,
+    ) -> CursorPagination[str, ProjectSummaryRead]:
+        use_case = GetProjectsByCursorUseCase(uow)
+        result = await use_case.execute(limit=pagination.limit, cursor=pagination.cursor)
+        return result
+
+    @get(
+        path="/{project_id: uuid}/tree",
+        media_type=MediaType.JSON,
+        guards=[PermissionGuard("projects:read")],
+        summary="Получение проекта со всеми подпроектами, этапами, сообщениями и файлами",
+    )
+    async def get_tree(self, project_id: UUID, uow: FromDishka[IProjectServiceUoW]) -> bytes:
+        # Документ целиком собирается в Postgres и отдаётся без декодирования и повторной сериализации
+        use_case = GetProjectTreeUseCase(uow)
+        result = await use_case.execute(project_id)
         return result
 
     @get(
         path="/{project_id: uuid}",
-        return_dto=ProjectResponseDTO,
         guards=[PermissionGuard("projects:read")],
         summary="Получение проекта по ID",
     )
-    async def get(self, project_id: UUID, uow: FromDishka[IProjectServiceUoW]) -> Project:
+    async def get(self, project_id: UUID, uow: FromDishka[IProjectServiceUoW]) -> ProjectRead:
         use_case = GetProjectUseCase(uow)
         result = await use_case.execute(project_id)
         return result
@@ -109,6 +154,25 @@ class ProjectsController(Controller):
         result = await use_case.execute(project_id, data_instance.subproject_id)
         return result
 
+    @post(
+        path="/{project_id: uuid}/template/apply",
+        dto=ApplyTemplateRequestDTO,
+        return_dto=SubprojectShortResponseDTO,
+        guards=[PermissionGuard("subprojects:write")],
+        summary="Создание подпроектов по шаблону проекта",
+    )
+    async def apply_template(
+        self,
+        project_id: UUID,
+        data: DTOData[ApplyTemplateRequestSchema],
+        uow: FromDishka[IProjectServiceUoW],
+        mb: FromDishka[IMessageBus],
+    ) -> List[Subproject]:
+        data_instance = data.create_instance()
+        use_case = ApplyTemplateUseCase(uow, mb)
+        result = await use_case.execute(project_id, data_instance.names)
+        return result
+
     @delete(
         path="/{project_id: uuid}",
         guards=[PermissionGuard("projects:write")],
@@ -152,6 +216,7 @@ class ProjectsController(Controller):
         data: Annotated[List[UploadFile], Body(media_type=RequestEncodingType.MULTI_PART)],
         s3_client: FromDishka[S3Client],
         uow: FromDishka[IProjectServiceUoW],
+        mb: FromDishka[IMessageBus],
     ) -> None:
         async with uow:
             project = await uow.projects.get(project_id)
@@ -177,3 +242,4 @@ class ProjectsController(Controller):
                     path=object_key,
                 )
             await uow.projects.update(project)
+        await mb.publish(ProjectUpdatedEvent(id=project_id))
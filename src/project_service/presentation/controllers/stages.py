@@ -8,31 +8,43 @@ from litestar import Controller, post, get, patch, delete, Request, put
 from litestar.datastructures import UploadFile
 from litestar.dto import DTOData
 from litestar.enums import RequestEncodingType
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 from litestar.params import Parameter, Body
 from types_aiobotocore_s3 import S3Client
 
-from src.common.litestar_.di.filters import get_limit_offset_filters, LimitOffsetFilterRequest
+from src.common.litestar_.di.filters import (
+    get_limit_offset_filters,
+    LimitOffsetFilterRequest,
+    get_cursor_filters,
+    CursorFilterRequest,
+)
 from src.common.litestar_.guards.permission import PermissionGuard
+from src.common.litestar_.pagination import OffsetPage
 from src.common.message_bus.interfaces import IMessageBus
+from src.project_service.application.events.stage import StageUpdatedEvent
 from src.project_service.application.protocols import IProjectServiceUoW
 from src.project_service.application.services.store import generate_unique_object_key
 from src.project_service.application.use_cases.read.stage import (
     GetStageUseCase,
     GetStagesUseCase,
     GetStageStatusHistoryUseCase,
+    GetStagesByCursorUseCase,
+    GetStageStatusHistoryByCursorUseCase,
+    GetStageMessagesByCursorUseCase,
 )
 from src.project_service.application.use_cases.write.stage import (
     CreateStageUseCase,
     UpdateStageUseCase,
     DeleteStageUseCase,
     ChangeStageStatusUseCase,
+    ChangeStageStatusesUseCase,
     AddMessageToStageUseCase,
 )
 from src.project_service.domain.entities.stage import Stage
 from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.domain.value_objects.enums import StageStatus
-from src.project_service.infrastructure.read_models.stage import StageRead
+from src.project_service.infrastructure.read_models.message import MessageRead
+from src.project_service.infrastructure.read_models.stage import StageRead, StageCardRead
 from src.project_service.presentation.di.filters import get_stage_filters
 from src.project_service.presentation.dto.stage import (
     StageCreateRequestDTO,
@@ -40,6 +52,7 @@ from src.project_service.presentation.dto.stage import (
     StageShortResponseDTO,
     StageUpdateRequestDTO,
     ChangeStageStatusRequestDTO,
+    ChangeStageStatusesRequestDTO,
     StageReadResponseDTO,
     AddMessageToStageRequestDTO,
 )
@@ -48,6 +61,7 @@ from src.project_service.presentation.schemas.stage import (
     FilterStageRequestSchema,
     StageUpdateRequestSchema,
     ChangeStageStatusRequestSchema,
+    ChangeStageStatusesRequestSchema,
     AddMessageToStageRequestSchema,
 )
 
@@ -76,7 +90,6 @@ class StagesController(Controller):
 
     @get(
         path="",
-        return_dto=StageReadResponseDTO,
         dependencies={"filters": get_stage_filters, "pagination": get_limit_offset_filters},
         guards=[PermissionGuard("stages:read")],
         summary="Получение этапов",
@@ -86,10 +99,27 @@ class StagesController(Controller):
         pagination: LimitOffsetFilterRequest,
         filters: FilterStageRequestSchema,
         uow: FromDishka[IProjectServiceUoW],
-        mb: FromDishka[IMessageBus],
-    ) -> OffsetPagination[StageRead]:
-        use_case = GetStagesUseCase(uow, mb)
-        result = await use_case.execute(limit=pagination.limit, offset=pagination.offset, **asdict(filters))
+    ) -> OffsetPage[StageCardRead]:
+        use_case = GetStagesUseCase(uow)
+        result = await use_case.execute(
+            limit=pagination.limit, offset=pagination.offset, with_total=pagination.with_total, **asdict(filters)
+        )
+        return result
+
+    @get(
+        path="/cursor",
+        dependencies={"filters": get_stage_filters, "pagination": get_cursor_filters},
+        guards=[PermissionGuard("stages:read")],
+        summary="Получение этапов по курсору",
+    )
+    async def list_by_cursor(
+        self,
+        pagination: CursorFilterRequest,
+        filters: FilterStageRequestSchema,
+        uow: FromDishka[IProjectServiceUoW],
+    ) -> CursorPagination[str, StageCardRead]:
+        use_case = GetStagesByCursorUseCase(uow)
+        result = await use_case.execute(limit=pagination.limit, cursor=pagination.cursor, **asdict(filters))
         return result
 
     @get(
@@ -103,9 +133,71 @@ class StagesController(Controller):
         pagination: LimitOffsetFilterRequest,
         uow: FromDishka[IProjectServiceUoW],
         mb: FromDishka[IMessageBus],
-    ) -> OffsetPagination[StageStatusHistory]:
+    ) -> OffsetPage[StageStatusHistory]:
         use_case = GetStageStatusHistoryUseCase(uow, mb)
-        result = await use_case.execute(stage_id, pagination.limit, pagination.offset)
+        result = await use_case.execute(stage_id, pagination.limit, pagination.offset, pagination.with_total)
+        return result
+
+    @get(
+        path="/{stage_id: uuid}/status-history/cursor",
+        dependencies={"pagination": get_cursor_filters},
+        summary="Получение истории статусов этапа по курсору",
+    )
+    async def stage_status_history_by_cursor(
+        self,
+        stage_id: UUID,
+        pagination: CursorFilterRequest,
+        uow: FromDishka[IProjectServiceUoW],
+    ) -> CursorPagination[str, StageStatusHistory]:
+        use_case = GetStageStatusHistoryByCursorUseCase(uow)
+        result = await use_case.execute(stage_id, pagination.limit, pagination.cursor)
+        return result
+
+    @get(
+        path="/{stage_id: uuid}/messages",
+        dependencies={"pagination": get_cursor_filters},
+        guards=[PermissionGuard("stages:read")],
+        summary="Получение сообщений этапа по курсору, от новых к старым",
+    )
+    async def messages_by_cursor(
+        self,
+        stage_id: UUID,
+        pagination: CursorFilterRequest,
+        uow: FromDishka[IProjectServiceUoW],
+        mb: FromDishka[IMessageBus],
+    ) -> CursorPagination[str, MessageRead]:
+        use_case = GetStageMessagesByCursorUseCase(uow, mb)
+        result = await use_case.execute(stage_id, pagination.limit, pagination.cursor)
+        return result
+
+    @patch(
+        path="/status",
+        dto=ChangeStageStatusesRequestDTO,
+        return_dto=StageShortResponseDTO,
+        guards=[
+            PermissionGuard(
+                [
+                    "stages:change_status_to_completed",
+                    "stages:change_status_to_confirmed",
+                ]
+            )
+        ],
+        summary="Пакетное обновление статусов этапов одного проекта",
+    )
+    async def change_statuses(
+        self,
+        request: Request,
+        data: DTOData[ChangeStageStatusesRequestSchema],
+        uow: FromDishka[IProjectServiceUoW],
+        mb: FromDishka[IMessageBus],
+    ) -> List[Stage]:
+        data_instance = data.create_instance()
+        use_case = ChangeStageStatusesUseCase(uow, mb)
+        result = await use_case.execute(
+            [(item.stage_id, item.status, item.message) for item in data_instance.items],
+            UUID(request.auth.sub),
+            request.auth.permissions,
+        )
         return result
 
     @get(
@@ -199,7 +291,7 @@ class StagesController(Controller):
         data: DTOData[AddMessageToStageRequestSchema],
         uow: FromDishka[IProjectServiceUoW],
         mb: FromDishka[IMessageBus],
-    ) -> StageRead:
+    ) -> MessageRead:
         data_instance = data.create_instance()
         use_case = AddMessageToStageUseCase(uow, mb)
         result = await use_case.execute(stage_id, UUID(request.auth.sub), data_instance.message)
@@ -215,9 +307,10 @@ class StagesController(Controller):
         data: Annotated[List[UploadFile], Body(media_type=RequestEncodingType.MULTI_PART)],
         s3_client: FromDishka[S3Client],
         uow: FromDishka[IProjectServiceUoW],
+        mb: FromDishka[IMessageBus],
     ) -> None:
         async with uow:
-            project = await uow.projects.get_by_stage(stage_id)
+            project = await uow.projects.get_slice_by_stage(stage_id)
             for file in data:
                 content = await file.read()
                 object_key = await generate_unique_object_key(
@@ -240,4 +333,5 @@ class StagesController(Controller):
                     size=len(content),
                     path=object_key,
                 )
-            await uow.projects.update(project)
\ No newline at end of file
+            await uow.projects.update(project)
+        await mb.publish(StageUpdatedEvent(id=stage_id))
@@ -4,26 +4,36 @@ from uuid import UUID
 from dishka import FromDishka
 from litestar import Controller, post, get, delete, put
 from litestar.dto import DTOData
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination
 
-from src.common.litestar_.di.filters import get_limit_offset_filters, LimitOffsetFilterRequest
+from src.common.litestar_.di.filters import (
+    get_limit_offset_filters,
+    LimitOffsetFilterRequest,
+    get_cursor_filters,
+    CursorFilterRequest,
+)
 from src.common.litestar_.guards.permission import PermissionGuard
+from src.common.litestar_.pagination import OffsetPage
 from src.common.message_bus.interfaces import IMessageBus
 from src.project_service.application.protocols import IProjectServiceUoW
-from src.project_service.application.use_cases.read.subproject import GetSubprojectUseCase, GetSubprojectsUseCase
+from src.project_service.application.use_cases.read.subproject import (
+    GetSubprojectUseCase,
+    GetSubprojectsUseCase,
+    GetSubprojectsByCursorUseCase,
+)
 from src.project_service.application.use_cases.write.subproject import (
     CreateSubprojectUseCase,
     DeleteSubprojectUseCase,
     UpdateSubprojectUseCase,
 )
 from src.project_service.domain.entities.subproject import Subproject
-from src.project_service.infrastructure.read_models.subproject import SubprojectRead
+from src.project_service.infrastructure.read_models.subproject import SubprojectRead, SubprojectSummaryRead
 from src.project_service.presentation.di.filters import get_subproject_filters
 from src.project_service.presentation.dto.subproject import (
     SubprojectCreateRequestDTO,
     SubprojectCreateResponseDTO,
     SubprojectShortResponseDTO,
-    SubprojectUpdateRequestDTO, SubprojectReadDTO,
+    SubprojectUpdateRequestDTO,
 )
 from src.project_service.presentation.schemas.subproject import (
     SubprojectCreateRequestSchema,
@@ -58,7 +68,6 @@ class SubProjectsController(Controller):
 
     @get(
         path="",
-        return_dto=SubprojectReadDTO,
         dependencies={"filters": get_subproject_filters, "pagination": get_limit_offset_filters},
         guards=[PermissionGuard("subprojects:read")],
         summary="Получение подпроектов",
@@ -68,14 +77,31 @@ class SubProjectsController(Controller):
         pagination: LimitOffsetFilterRequest,
         filters: FilterSubprojectsRequestSchema,
         uow: FromDishka[IProjectServiceUoW],
-    ) -> OffsetPagination[SubprojectRead]:
+    ) -> OffsetPage[SubprojectSummaryRead]:
         use_case = GetSubprojectsUseCase(uow)
-        result = await use_case.execute(limit=pagination.limit, offset=pagination.offset, **asdict(filters))
+        result = await use_case.execute(
+            limit=pagination.limit, offset=pagination.offset, with_total=pagination.with_total, **asdict(filters)
+        )
+        return result
+
+    @get(
+        path="/cursor",
+        dependencies={"filters": get_subproject_filters, "pagination": get_cursor_filters},
+        guards=[PermissionGuard("subprojects:read")],
+        summary="Получение подпроектов по курсору",
+    )
+    async def list_by_cursor(
+        self,
+        pagination: CursorFilterRequest,
+        filters: FilterSubprojectsRequestSchema,
+        uow: FromDishka[IProjectServiceUoW],
+    ) -> CursorPagination[str, SubprojectSummaryRead]:
+        use_case = GetSubprojectsByCursorUseCase(uow)
+        result = await use_case.execute(limit=pagination.limit, cursor=pagination.cursor, **asdict(filters))
         return result
 
     @get(
         path="/{subproject_id: uuid}",
-        return_dto=SubprojectReadDTO,
         guards=[PermissionGuard("subprojects:read")],
         summary="Получение подпроекта по ID",
     )
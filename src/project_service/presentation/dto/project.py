@@ -1,12 +1,11 @@
 from litestar.dto import DataclassDTO, DTOConfig
-from litestar.plugins.pydantic import PydanticDTO
 
 from src.project_service.domain.aggregates.project import Project
-from src.project_service.infrastructure.read_models.project import ProjectRead
 from src.project_service.presentation.schemas.project import (
     ProjectCreateSchema,
     ProjectUpdateRequestSchema,
     CreateTemplateRequestSchema,
+    ApplyTemplateRequestSchema,
 )
 
 
@@ -14,7 +13,7 @@ class ProjectCreateRequestDTO(DataclassDTO[ProjectCreateSchema]): ...
 
 
 class ProjectCreateResponseDTO(DataclassDTO[Project]):
-    config = DTOConfig(max_nested_depth=0)
+    config = DTOConfig(max_nested_depth=0, exclude={"unloaded_subprojects"})
 
 
 class ProjectShortResponseDTO(DataclassDTO[Project]):
@@ -23,26 +22,15 @@ class ProjectShortResponseDTO(DataclassDTO[Project]):
         exclude={
             "subprojects",
             "template",
+            "unloaded_subprojects",
         },
     )
 
 
-class ProjectReadResponseDTO(PydanticDTO[ProjectRead]):
-    config = DTOConfig(
-        max_nested_depth=3,
-    )
-
-
-class ProjectReadShortResponseDTO(PydanticDTO[ProjectRead]):
-    config = DTOConfig(
-        max_nested_depth=0,
-    )
-
-
 class ProjectResponseDTO(DataclassDTO[Project]):
     config = DTOConfig(
         max_nested_depth=2,
-        exclude={"subprojects"},
+        exclude={"subprojects", "unloaded_subprojects"},
     )
 
 
@@ -51,3 +39,6 @@ class ProjectUpdateRequestDTO(DataclassDTO[ProjectUpdateRequestSchema]):
 
 
 class CreateTemplateRequestDTO(DataclassDTO[CreateTemplateRequestSchema]): ...
+
+
+class ApplyTemplateRequestDTO(DataclassDTO[ApplyTemplateRequestSchema]): ...
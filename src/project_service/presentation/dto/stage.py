@@ -7,6 +7,7 @@ from src.project_service.presentation.schemas.stage import (
     StageCreateRequestSchema,
     StageUpdateRequestSchema,
     ChangeStageStatusRequestSchema,
+    ChangeStageStatusesRequestSchema,
     AddMessageToStageRequestSchema,
 )
 
@@ -34,6 +35,9 @@ class ChangeStageStatusRequestDTO(DataclassDTO[ChangeStageStatusRequestSchema]):
     config = DTOConfig(partial=True)
 
 
+class ChangeStageStatusesRequestDTO(DataclassDTO[ChangeStageStatusesRequestSchema]): ...
+
+
 class AddMessageToStageRequestDTO(DataclassDTO[AddMessageToStageRequestSchema]): ...
 
 
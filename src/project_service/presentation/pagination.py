@@ -1,102 +1,144 @@
 from typing import TypeVar
 from uuid import UUID
 
-from litestar.pagination import OffsetPagination
-
+from src.common.db.keyset import Keyset
 from src.common.message_bus.interfaces import IMessageBus
 from src.common.message_bus.schemas import GetUserInfoListQuery, GetUserInfoListResponse, GetUserInfoResponse
-from src.common.litestar_.pagination import FilteredAbstractAsyncOffsetPaginator
+from src.common.litestar_.pagination import FilteredAbstractAsyncOffsetPaginator, FilteredAbstractAsyncCursorPaginator
 from src.project_service.application.protocols import IProjectServiceUoW
-from src.project_service.domain.entities.file_attachment import FileAttachment
-from src.project_service.infrastructure.read_models.file_attachment import FileAttachmentRead
+from src.project_service.domain.entities.stage_status_history import StageStatusHistory
 from src.project_service.infrastructure.read_models.message import MessageRead
-from src.project_service.infrastructure.read_models.stage import StageRead
-from src.project_service.infrastructure.read_models.subproject import SubprojectRead
+from src.project_service.infrastructure.read_models.project import ProjectSummaryRead
+from src.project_service.infrastructure.read_models.stage import StageCardRead
+from src.project_service.infrastructure.read_models.subproject import SubprojectSummaryRead
 
 T = TypeVar("T")
 
 
 class ProjectOffsetPagination(FilteredAbstractAsyncOffsetPaginator):
+    table = "project_summary"
+
     def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
+        self.totals = uow.totals
 
     async def get_total(self, **filters) -> int:
-        return await self.uow.projects.count()
+        return await self.uow.projects_read.projects_count()
 
-    async def get_items(self, limit: int, offset: int, **filters) -> list[T]:
-        return await self.uow.projects_read.get_projects(limit, offset)
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[T], int | None]:
+        return await self.uow.projects_read.get_projects(limit, offset, with_total)
 
 
 class SubprojectOffsetPagination(FilteredAbstractAsyncOffsetPaginator):
+    table = "subproject_summary"
+
     def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
+        self.totals = uow.totals
 
     async def get_total(self, **filters) -> int:
         return await self.uow.projects_read.subprojects_count(**filters)
 
-    async def get_items(self, limit: int, offset: int, **filters) -> list[T]:
-        return await self.uow.projects_read.get_subprojects(limit, offset, **filters)
-
-    @staticmethod
-    def create(subprojects: list[SubprojectRead], total: int, limit: int, offset: int) -> OffsetPagination[SubprojectRead]:
-        return OffsetPagination(
-            items=subprojects,
-            total=total,
-            limit=limit,
-            offset=offset,
-        )
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[T], int | None]:
+        return await self.uow.projects_read.get_subprojects(limit, offset, with_total, **filters)
 
 
 class StageOffsetPagination(FilteredAbstractAsyncOffsetPaginator):
-    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+    table = "stage_card"
+
+    def __init__(self, uow: IProjectServiceUoW):
         self.uow = uow
-        self.mb = mb
+        self.totals = uow.totals
 
     async def get_total(self, **filters) -> int:
         return await self.uow.projects_read.stages_count(**filters)
 
-    async def get_items(self, limit: int, offset: int, **filters) -> list[T]:
-        stages = await self.uow.projects_read.get_stages(limit, offset, **filters)
-
-        author_ids = {msg.author_id for stage in stages for msg in stage.messages}
-        user_map: dict[UUID, GetUserInfoResponse] = {}
-        query_result = await self.mb.query(
-            GetUserInfoListQuery(ids=list(author_ids)),
-            response_model=GetUserInfoListResponse,
-        )
-        for user in query_result.users:
-            user_map[user.id] = user
-        return [
-            StageRead(
-                id=stage.id,
-                name=stage.name,
-                description=stage.description,
-                created_at=stage.created_at,
-                updated_at=stage.updated_at,
-                status=stage.status,
-                messages=[
-                    MessageRead(
-                        id=msg.id,
-                        created_at=msg.created_at,
-                        text=msg.text,
-                        author=user_map.get(msg.author_id, None).model_dump(),
-                    )
-                    for msg in stage.messages
-                ],
-                files=[FileAttachmentRead.model_validate(file) for file in stage.files],
-            )
-            for stage in stages
-        ]
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[T], int | None]:
+        return await self.uow.projects_read.get_stages(limit, offset, with_total, **filters)
 
 
 class StageStatusHistoryOffsetPagination(FilteredAbstractAsyncOffsetPaginator):
+    table = "stage_status_history"
+
     def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
         self.uow = uow
+        self.totals = uow.totals
         self.mb = mb
 
     async def get_total(self, **filters) -> int:
         return await self.uow.stage_status_history.count(**filters)
 
-    async def get_items(self, limit: int, offset: int, **filters) -> list[T]:
-        objs = await self.uow.stage_status_history.get_many(limit, offset, **filters)
-        return objs
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[T], int | None]:
+        return await self.uow.stage_status_history.get_many(limit, offset, with_total, **filters)
+
+
+class ProjectCursorPagination(FilteredAbstractAsyncCursorPaginator[ProjectSummaryRead]):
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[ProjectSummaryRead]:
+        return await self.uow.projects_read.get_projects_after(results_per_page, cursor, **filters)
+
+    def get_keyset(self, item: ProjectSummaryRead) -> Keyset:
+        return Keyset(item.created_at, item.id)
+
+
+class SubprojectCursorPagination(FilteredAbstractAsyncCursorPaginator[SubprojectSummaryRead]):
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[SubprojectSummaryRead]:
+        return await self.uow.projects_read.get_subprojects_after(results_per_page, cursor, **filters)
+
+    def get_keyset(self, item: SubprojectSummaryRead) -> Keyset:
+        return Keyset(item.updated_at, item.id)
+
+
+class StageCursorPagination(FilteredAbstractAsyncCursorPaginator[StageCardRead]):
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[StageCardRead]:
+        return await self.uow.projects_read.get_stages_after(results_per_page, cursor, **filters)
+
+    def get_keyset(self, item: StageCardRead) -> Keyset:
+        return Keyset(item.updated_at, item.id)
+
+
+class StageStatusHistoryCursorPagination(FilteredAbstractAsyncCursorPaginator[StageStatusHistory]):
+    def __init__(self, uow: IProjectServiceUoW):
+        self.uow = uow
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[StageStatusHistory]:
+        return await self.uow.stage_status_history.get_many_after(results_per_page, cursor, **filters)
+
+    def get_keyset(self, item: StageStatusHistory) -> Keyset:
+        return Keyset(item.changed_at, item.id)
+
+
+class StageMessageCursorPagination(FilteredAbstractAsyncCursorPaginator[MessageRead]):
+    def __init__(self, uow: IProjectServiceUoW, mb: IMessageBus):
+        self.uow = uow
+        self.mb = mb
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[MessageRead]:
+        rows = await self.uow.projects_read.get_messages_after(results_per_page, cursor, **filters)
+        if not rows:
+            return []
+        # Авторы запрашиваются одним запросом на страницу, а не на всю переписку этапа
+        query_result = await self.mb.query(
+            GetUserInfoListQuery(ids=list({row.author_id for row in rows})), response_model=GetUserInfoListResponse
+        )
+        user_map: dict[UUID, GetUserInfoResponse] = {user.id: user for user in query_result.users}
+        return [
+            MessageRead(
+                id=row.id,
+                created_at=row.created_at,
+                text=row.text,
+                author=user.model_dump() if (user := user_map.get(row.author_id)) else {"id": row.author_id},
+            )
+            for row in rows
+        ]
+
+    def get_keyset(self, item: MessageRead) -> Keyset:
+        return Keyset(item.created_at, item.id)
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from typing import Annotated
 from uuid import UUID
 
+from litestar.params import KwargDefinition
+
+# Все подпроекты с этапами шаблона создаются в одной транзакции, поэтому размер пакета ограничен
+MAX_TEMPLATE_SUBPROJECTS = 100
+
 
 @dataclass
 class ProjectCreateSchema:
@@ -17,3 +23,8 @@ class ProjectUpdateRequestSchema:
 @dataclass
 class CreateTemplateRequestSchema:
     subproject_id: UUID
+
+
+@dataclass
+class ApplyTemplateRequestSchema:
+    names: Annotated[list[str], KwargDefinition(max_length=MAX_TEMPLATE_SUBPROJECTS)]
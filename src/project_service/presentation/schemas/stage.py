@@ -1,8 +1,14 @@
 from dataclasses import dataclass
+from typing import Annotated
 from uuid import UUID
 
+from litestar.params import KwargDefinition
+
 from src.project_service.domain.entities.stage import StageStatus
 
+# Изменения пакета применяются в одной транзакции, поэтому число блокируемых строк ограничено
+MAX_STAGE_STATUS_CHANGES = 100
+
 
 @dataclass
 class StageCreateRequestSchema:
@@ -28,6 +34,18 @@ class ChangeStageStatusRequestSchema:
     message: str | None = None
 
 
+@dataclass
+class StageStatusChangeSchema:
+    stage_id: UUID
+    status: StageStatus
+    message: str | None = None
+
+
+@dataclass
+class ChangeStageStatusesRequestSchema:
+    items: Annotated[list[StageStatusChangeSchema], KwargDefinition(max_length=MAX_STAGE_STATUS_CHANGES)]
+
+
 @dataclass
 class AddMessageToStageRequestSchema:
     message: str
@@ -0,0 +1,231 @@
+"""
+Наполнение БД синтетическими данными для нагрузочных тестов.
+
+Строки генерируются сразу кортежами в порядке колонок и загружаются через COPY (asyncpg
+copy_records_to_table), минуя ORM и доменные объекты. Проекции для чтения заполняются тем же проходом,
+поэтому после загрузки списки сразу готовы к работе. Пример:
+
+    python -m src.seed --projects 1000 --subprojects 20 --stages 20 --messages 10 --users 500
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+from uuid import UUID, uuid4
+
+import asyncpg
+
+from src.project_service.domain.value_objects.enums import ProjectStatus, SubprojectStatus, StageStatus
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    SubprojectModel,
+    StageModel,
+    MessageModel,
+    StageFileAttachmentModel,
+    StageStatusHistoryModel,
+    ProjectSummaryModel,
+    SubprojectSummaryModel,
+    StageCardModel,
+)
+from src.user_service.config import settings
+from src.user_service.infrastructure.hasher import argon2_hasher
+from src.user_service.infrastructure.db.postgres.models import UserModel
+
+# Порядок колонок, в котором генерируются кортежи; порядок таблиц соответствует внешним ключам
+COLUMNS: dict[type, tuple[str, ...]] = {
+    UserModel: ("id", "username", "email", "hashed_password", "created_at", "updated_at"),
+    ProjectModel: ("id", "name", "description", "created_at", "updated_at", "status", "progress"),
+    SubprojectModel: ("id", "name", "description", "created_at", "updated_at", "status", "progress", "project_id"),
+    StageModel: ("id", "name", "description", "created_at", "updated_at", "status", "end_date", "subproject_id"),
+    MessageModel: ("id", "created_at", "author_id", "text", "stage_id"),
+    StageFileAttachmentModel: ("id", "stage_id", "filename", "content_type", "size", "uploaded_at", "path"),
+    StageStatusHistoryModel: ("id", "stage_id", "to_status", "changed_by", "changed_at"),
+    ProjectSummaryModel: (
+        "id", "name", "description", "created_at", "updated_at", "status", "progress",
+        "subprojects_count", "completed_subprojects_count", "files_count",
+    ),
+    SubprojectSummaryModel: (
+        "id", "project_id", "name", "description", "created_at", "updated_at", "status", "progress",
+        "stages_count", "completed_stages_count", "files_count",
+    ),
+    StageCardModel: (
+        "id", "project_id", "subproject_id", "name", "description", "created_at", "updated_at", "status",
+        "files_count", "messages_count", "last_message_text", "last_message_at", "last_message_author_id",
+        "last_message_author_name",
+    ),
+}
+
+STAGE_STATUSES = [StageStatus.CREATED, StageStatus.IN_PROGRESS, StageStatus.CONFIRMED, StageStatus.COMPLETED]
+STARTED_AT = datetime(2025, 1, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class SeedShape:
+    projects: int = 50
+    subprojects: int = 50
+    stages: int = 50
+    messages: int = 5
+    files: int = 1
+    users: int = 100
+    history: int = 2
+
+
+Rows = dict[type, list[tuple[Any, ...]]]
+
+
+def generate_users(count: int, hashed_password: str) -> list[tuple[Any, ...]]:
+    users = []
+    for i in range(count):
+        user_id = uuid4()
+        # Почта уникальна, а повторный запуск не должен конфликтовать с уже загруженными пользователями
+        email = f"user-{i}-{user_id.hex[:8]}@example.com"
+        users.append((user_id, f"user-{i}", email, hashed_password, STARTED_AT, STARTED_AT))
+    return users
+
+
+def generate_projects(
+    shape: SeedShape,
+    authors: list[tuple[UUID, str]],
+    first_index: int,
+    count: int,
+    rnd: random.Random,
+) -> Rows:
+    """Строки проектов first_index..first_index + count со всем деревом и проекциями"""
+    rows: Rows = {model: [] for model in COLUMNS if model is not UserModel}
+    for project_index in range(first_index, first_index + count):
+        project_id = uuid4()
+        project_at = STARTED_AT + timedelta(minutes=project_index)
+        completed_subprojects = 0
+        for subproject_index in range(shape.subprojects):
+            subproject_id = uuid4()
+            completed_stages = 0
+            for stage_index in range(shape.stages):
+                stage_id = uuid4()
+                stage_at = project_at + timedelta(seconds=stage_index)
+                status = rnd.choice(STAGE_STATUSES)
+                completed_stages += status == StageStatus.COMPLETED
+                rows[StageModel].append(
+                    (stage_id, f"stage-{stage_index}", None, stage_at, stage_at, status, None, subproject_id)
+                )
+
+                last_message = None
+                for message_index in range(shape.messages):
+                    author_id, author_name = authors[rnd.randrange(len(authors))]
+                    message_at = stage_at + timedelta(seconds=message_index)
+                    text = f"message-{message_index}"
+                    rows[MessageModel].append((uuid4(), message_at, author_id, text, stage_id))
+                    last_message = (text, message_at, author_id, author_name)
+                for file_index in range(shape.files):
+                    path = f"stages/{stage_id}/file-{file_index}.txt"
+                    rows[StageFileAttachmentModel].append(
+                        (uuid4(), stage_id, f"file-{file_index}.txt", "text/plain", 1024, stage_at, path)
+                    )
+                for history_index in range(shape.history):
+                    author_id, _ = authors[rnd.randrange(len(authors))]
+                    rows[StageStatusHistoryModel].append(
+                        (
+                            uuid4(),
+                            stage_id,
+                            rnd.choice(STAGE_STATUSES[1:]),
+                            author_id,
+                            stage_at + timedelta(hours=history_index),
+                        )
+                    )
+                rows[StageCardModel].append(
+                    (
+                        stage_id, project_id, subproject_id, f"stage-{stage_index}", None, stage_at, stage_at, status,
+                        shape.files, shape.messages, *(last_message or (None, None, None, None)),
+                    )
+                )
+
+            subproject_status, subproject_progress = _rollup(completed_stages, shape.stages, SubprojectStatus)
+            completed_subprojects += subproject_status == SubprojectStatus.COMPLETED
+            subproject = (
+                subproject_id, f"subproject-{subproject_index}", None, project_at, project_at,
+                subproject_status, subproject_progress,
+            )
+            rows[SubprojectModel].append((*subproject, project_id))
+            rows[SubprojectSummaryModel].append(
+                (subproject_id, project_id, *subproject[1:], shape.stages, completed_stages, 0)
+            )
+
+        project_status, project_progress = _rollup(completed_subprojects, shape.subprojects, ProjectStatus)
+        project = (
+            project_id, f"project-{project_index}", None, project_at, project_at, project_status, project_progress
+        )
+        rows[ProjectModel].append(project)
+        rows[ProjectSummaryModel].append((*project, shape.subprojects, completed_subprojects, 0))
+    return rows
+
+
+def _rollup(completed: int, total: int, statuses) -> tuple[str, float]:
+    # То же правило, что в Subproject._update_status и Project._update_status
+    progress = completed / total if total else 0.0
+    return (statuses.COMPLETED if completed == total else statuses.IN_PROGRESS), progress
+
+
+def chunks(total: int, size: int) -> Iterator[tuple[int, int]]:
+    for first in range(0, total, size):
+        yield first, min(size, total - first)
+
+
+async def copy_rows(conn: asyncpg.Connection, rows: Rows, counts: dict[str, int]) -> None:
+    for model, records in rows.items():
+        if records:
+            await conn.copy_records_to_table(model.__tablename__, records=records, columns=COLUMNS[model])
+            counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(records)
+
+
+async def seed(dsn: str, shape: SeedShape, chunk_size: int, password: str, random_seed: int) -> dict[str, int]:
+    rnd = random.Random(random_seed)
+    counts: dict[str, int] = {}
+    # Хэш считается один раз: argon2 на каждого пользователя занял бы больше времени, чем вся загрузка
+    users = generate_users(shape.users, argon2_hasher().hash(password))
+    authors = [(user[0], user[1]) for user in users]
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            await copy_rows(conn, {UserModel: users}, counts)
+        for first, count in chunks(shape.projects, chunk_size):
+            rows = generate_projects(shape, authors, first, count, rnd)
+            async with conn.transaction():
+                await copy_rows(conn, rows, counts)
+    finally:
+        await conn.close()
+    return counts
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Наполнение БД синтетическими данными через COPY")
+    for field in SeedShape.__dataclass_fields__.values():
+        parser.add_argument(f"--{field.name}", type=int, default=field.default)
+    parser.add_argument("--chunk", type=int, default=100, help="проектов на одну транзакцию COPY")
+    parser.add_argument("--password", default="string123", help="пароль всех созданных пользователей")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора случайных чисел")
+    parser.add_argument("--dsn", default=settings.DB_STRING.replace("postgresql+asyncpg://", "postgresql://"))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    shape = SeedShape(**{name: getattr(args, name) for name in SeedShape.__dataclass_fields__})
+    if not shape.users and shape.messages + shape.history:
+        raise SystemExit("Для сообщений и истории статусов нужен хотя бы один пользователь")
+
+    started = time.perf_counter()
+    counts = asyncio.run(seed(args.dsn, shape, args.chunk, args.password, args.seed))
+    seconds = time.perf_counter() - started
+
+    total = sum(counts.values())
+    for table, count in counts.items():
+        print(f"{table:<22} {count:>12,}")
+    print(f"{'total':<22} {total:>12,} rows in {seconds:.1f}s ({total / seconds:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
 from src.user_service.application.handlers.user import *
+from src.user_service.application.handlers.auth import *
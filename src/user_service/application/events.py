@@ -11,3 +11,11 @@ class UserCreatedEvent(Event):
     email: str
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserChangedEvent(Event):
+    id: UUID
+
+
+class TokenBlacklistedEvent(Event):
+    digest: str
@@ -0,0 +1,17 @@
+from uuid import uuid4
+
+from faststream.rabbit import RabbitQueue
+
+from src.common.message_bus.broker import broker
+from src.common.message_bus.message_bus import fanout_exchange
+from src.user_service.application.events import TokenBlacklistedEvent
+from src.user_service.infrastructure.blacklist_filter import blacklist_filter
+
+
+# Своя временная очередь у каждого процесса: событие должен получить bloom-фильтр каждого из них
+@broker.subscriber(
+    RabbitQueue(f"tokenblacklistedevent.{uuid4().hex}", exclusive=True, auto_delete=True),
+    fanout_exchange("tokenblacklistedevent"),
+)
+async def on_token_blacklisted(event: TokenBlacklistedEvent):
+    blacklist_filter.add(bytes.fromhex(event.digest))
@@ -1,20 +1,23 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from aiocache import cached, SimpleMemoryCache
 from dishka import FromDishka
 from dishka.integrations.faststream import inject
+from faststream.rabbit import RabbitQueue
 from loguru import logger
 
+from src.common.exceptions.infrastructure import InfrastructureError
 from src.common.message_bus.broker import broker
+from src.common.message_bus.message_bus import fanout_exchange
 from src.common.message_bus.schemas import (
     GetUserInfoQuery,
     GetUserInfoResponse,
     GetUserInfoListQuery,
     GetUserInfoListResponse,
 )
-from src.user_service.application.events import UserCreatedEvent
+from src.user_service.application.events import UserCreatedEvent, UserChangedEvent
 from src.user_service.application.protocols import IUserServiceUoW
 from src.user_service.application.use_cases.queries import GetInfoQuery, GetInfoResponse
+from src.user_service.infrastructure.user_directory import user_directory
 
 
 @broker.subscriber("usercreatedevent")
@@ -22,18 +25,27 @@ async def on_user_created(event: UserCreatedEvent):
     logger.info(event)
 
 
+@broker.subscriber(
+    RabbitQueue(f"userchangedevent.{uuid4().hex}", exclusive=True, auto_delete=True),
+    fanout_exchange("userchangedevent"),
+)
+async def on_user_changed(event: UserChangedEvent):
+    user_directory.invalidate(event.id)
+
+
 @broker.subscriber("getuserinfoquery")
 @inject
-@cached(ttl=60, cache=SimpleMemoryCache)
 async def on_get_user_info(event: GetUserInfoQuery, uow: FromDishka[IUserServiceUoW]) -> GetUserInfoResponse:
-    async with uow:
-        user = await uow.users_read.get(event.id)
-    return GetUserInfoResponse(id=user.id, username=user.username)
+    usernames = await user_directory.get_many([event.id], uow)
+    if event.id not in usernames:
+        raise InfrastructureError(f"Пользователь с ID {event.id} не найден")
+    return GetUserInfoResponse(id=event.id, username=usernames[event.id])
 
 
 @broker.subscriber("getuserinfolistquery")
 @inject
 async def on_get_user_info_list(event: GetUserInfoListQuery, uow: FromDishka[IUserServiceUoW]):
-    async with uow:
-        users = await uow.users_read.get_many(event.ids)
-    return GetUserInfoListResponse(users=[GetUserInfoResponse(id=user.id, username=user.username) for user in users])
+    usernames = await user_directory.get_many(event.ids, uow)
+    return GetUserInfoListResponse(
+        users=[GetUserInfoResponse(id=user_id, username=username) for user_id, username in usernames.items()]
+    )
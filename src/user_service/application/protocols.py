@@ -1,8 +1,10 @@
-from typing import Protocol, Self
+from datetime import datetime
+from typing import Protocol, Self, AsyncIterator
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.db.interfaces import ICountProvider
 from src.user_service.domain.aggregates.blacklist import BlacklistedToken
 from src.user_service.domain.enities.permission import Permission
 from src.user_service.domain.aggregates.role import Role
@@ -20,6 +22,7 @@ class IUserRepository(Protocol):
     async def get_all(self) -> list[User]: ...
     async def add(self, user: User) -> None: ...
     async def update(self, user: User) -> User: ...
+    async def update_password_hash(self, user_id: UUID, old_hash: str, new_hash: str) -> bool: ...
 
 
 class IUserReadRepository(Protocol):
@@ -28,6 +31,7 @@ class IUserReadRepository(Protocol):
     async def get(self, user_id: UUID) -> UserRead: ...
     async def get_by_email(self, email: str) -> UserRead: ...
     async def get_many(self, user_ids: list[UUID] = None) -> list[UserRead]: ...
+    async def get_usernames(self, user_ids: list[UUID] | None = None, limit: int | None = None) -> dict[UUID, str]: ...
 
 
 class IRoleRepository(Protocol):
@@ -54,13 +58,27 @@ class IPermissionRepository(Protocol):
 
 
 class IPermissionReadRepository(Protocol):
+    async def get_codes(self) -> list[str]: ...
     async def count(self, **filters) -> int: ...
-    async def get_many(self, limit: int, offset: int, **filters) -> list[PermissionRead]: ...
+    async def get_many(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[PermissionRead], int | None]: ...
 
 
 class IBlacklistRepository(Protocol):
     async def add(self, blacklisted_token: BlacklistedToken) -> None: ...
     async def exists(self, blacklisted_token: str) -> bool: ...
+    async def count_active(self) -> int: ...
+    def iter_active_digests(self) -> AsyncIterator[bytes]: ...
+    async def delete_expired(self, now: datetime, limit: int) -> int: ...
+
+
+class IPasswordHasher(Protocol):
+    """Интерфейс для хеширования паролей вне event loop."""
+
+    async def hash(self, password: str) -> str: ...
+    async def verify(self, plain: str, hashed: str) -> bool: ...
+    async def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]: ...
 
 
 class IUserServiceUoW(Protocol):
@@ -74,6 +92,7 @@ class IUserServiceUoW(Protocol):
     permissions: IPermissionRepository
     permissions_read: IPermissionReadRepository
     blacklist: IBlacklistRepository
+    totals: ICountProvider
 
     async def __aenter__(self) -> Self: ...
     async def __aexit__(self, exc_type, exc_val, exc_tb): ...
@@ -1,9 +1,13 @@
+from datetime import datetime, UTC
 from uuid import UUID
 
 from litestar import Response, status_codes
+from loguru import logger
 
 from src.common.exceptions.application import ApplicationError
-from src.user_service.application.protocols import IUserServiceUoW
+from src.common.message_bus.interfaces import IMessageBus
+from src.user_service.application.events import TokenBlacklistedEvent
+from src.user_service.application.protocols import IUserServiceUoW, IPasswordHasher
 from src.user_service.config import settings
 from src.user_service.domain.aggregates.blacklist import BlacklistedToken
 from src.user_service.domain.aggregates.user import User
@@ -38,16 +42,25 @@ def generate_token_response(user: UserRead) -> Response[TokenResponseSchema]:
 
 
 class LoginUserUseCase:
-    def __init__(self, uow: IUserServiceUoW):
+    def __init__(self, uow: IUserServiceUoW, hasher: IPasswordHasher):
         self.uow = uow
+        self.hasher = hasher
 
     async def execute(self, email: str, password: str) -> Response:
         async with self.uow:
             user = await self.uow.users.get_by_email(email)
-            if user is None or not user.hashed_password.verify(password):
-                raise ApplicationError("Неверный email или пароль")
-            user = await self.uow.users_read.get_by_email(email)
-            return generate_token_response(user)
+            user_read = await self.uow.users_read.get_by_email(email)
+        # Пароль проверяется после закрытия сессии: соединение с БД не удерживается, пока запрос ждет пул
+        if user is None:
+            raise ApplicationError("Неверный email или пароль")
+        is_valid, new_hash = await self.hasher.verify_and_update(password, user.hashed_password)
+        if not is_valid:
+            raise ApplicationError("Неверный email или пароль")
+        if new_hash is not None:
+            # Хэш посчитан с прежними параметрами Argon2: пароль известен только сейчас, поэтому пересчет здесь
+            async with self.uow:
+                await self.uow.users.update_password_hash(user.id, user.hashed_password, new_hash)
+        return generate_token_response(user_read)
 
 
 class UpdateAccessAndRefreshTokensUseCase:
@@ -65,16 +78,41 @@ class UpdateAccessAndRefreshTokensUseCase:
 
 
 class LogoutUserUseCase:
-    def __init__(self, uow: IUserServiceUoW):
+    def __init__(self, uow: IUserServiceUoW, mb: IMessageBus):
         self.uow = uow
+        self.mb = mb
 
     async def execute(self, token: str, decoded_token: RefreshToken) -> Response:
         async with self.uow:
             blacklisted_token = BlacklistedToken.create(token=token, expires_at=decoded_token.exp)
             await self.uow.blacklist.add(blacklisted_token)
-            response = Response(
-                content="",
-                status_code=status_codes.HTTP_200_OK,
-            )
-            response.delete_cookie("refresh_token")
-            return response
+        # Bloom-фильтры остальных процессов не видят эту запись, пока не получат событие. Запись уже сохранена,
+        # поэтому сбой публикации не отменяет выход: фильтры подхватят токен при периодическом перестроении
+        try:
+            await self.mb.broadcast(TokenBlacklistedEvent(digest=BlacklistedToken.digest(token)))
+        except Exception:
+            logger.exception("Не удалось разослать событие о блокировке refresh токена")
+        response = Response(
+            content="",
+            status_code=status_codes.HTTP_200_OK,
+        )
+        response.delete_cookie("refresh_token")
+        return response
+
+
+class SweepExpiredTokensUseCase:
+    """Удаляет истекшие записи черного списка пачками, каждая пачка - отдельная короткая транзакция"""
+
+    def __init__(self, uow: IUserServiceUoW, batch_size: int = settings.BLACKLIST_SWEEP_BATCH):
+        self.uow = uow
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        total = 0
+        while True:
+            async with self.uow:
+                deleted = await self.uow.blacklist.delete_expired(now, self.batch_size)
+            total += deleted
+            if deleted < self.batch_size:
+                return total
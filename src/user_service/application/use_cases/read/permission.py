@@ -1,5 +1,4 @@
-from litestar.pagination import OffsetPagination
-
+from src.common.litestar_.pagination import OffsetPage
 from src.user_service.application.protocols import IUserServiceUoW
 from src.user_service.domain.enities.permission import Permission
 from src.user_service.presentation.pagination import PermissionOffsetPagination
@@ -9,6 +8,6 @@ class GetPermissionsUseCase:
     def __init__(self, uow: IUserServiceUoW):
         self.uow = uow
 
-    async def execute(self, limit: int, offset: int, **filters) -> OffsetPagination[Permission]:
+    async def execute(self, limit: int, offset: int, with_total: bool = True, **filters) -> OffsetPage[Permission]:
         async with self.uow:
-            return await PermissionOffsetPagination(self.uow)(limit, offset, **filters)
+            return await PermissionOffsetPagination(self.uow)(limit, offset, with_total, **filters)
@@ -5,21 +5,25 @@ from loguru import logger
 from src.common.exceptions.application import ApplicationPermissionDeniedError
 from src.common.message_bus.interfaces import IMessageBus
 from src.common.exceptions.application import ApplicationError
-from src.user_service.application.protocols import IUserServiceUoW
-from src.user_service.application.events import UserCreatedEvent
+from src.user_service.application.protocols import IUserServiceUoW, IPasswordHasher
+from src.user_service.application.events import UserCreatedEvent, UserChangedEvent
 from src.user_service.application.use_cases.role import GetOrCreateDefaultRoleUseCase
 from src.user_service.domain.aggregates.user import User
 from src.user_service.domain.enities.user_role_assignment import UserRoleAssignment
+from src.user_service.domain.value_objects.hashed_password import HashedPassword
 from src.common.exceptions.infrastructure import InfrastructureError
 from src.user_service.infrastructure.read_models.user import UserRead
 
 
 class RegisterUserUseCase:
-    def __init__(self, uow: IUserServiceUoW, mb: IMessageBus):
+    def __init__(self, uow: IUserServiceUoW, mb: IMessageBus, hasher: IPasswordHasher):
         self.uow = uow
         self.mb = mb
+        self.hasher = hasher
 
     async def execute(self, username: str, email: str, password: str, repeat_password: str) -> User:
+        # Дешевые проверки выполняются до хеширования, чтобы отклоненные запросы не занимали пул
+        User.validate_password(password, repeat_password)
         async with self.uow:
             try:
                 existing_user = await self.uow.users.get_by_email(email)
@@ -27,6 +31,9 @@ class RegisterUserUseCase:
                     raise ApplicationError(f"Пользователь с email {email} уже существует")
             except InfrastructureError:
                 ...
+        # Хеш считается при закрытой сессии, чтобы не держать соединение с БД в очереди пула
+        hashed_password = HashedPassword(await self.hasher.hash(password))
+        async with self.uow:
             role = await GetOrCreateDefaultRoleUseCase(self.uow).execute()
             user = User.create(
                 username=username,
@@ -34,10 +41,15 @@ class RegisterUserUseCase:
                 password=password,
                 repeat_password=repeat_password,
                 role_assignment=UserRoleAssignment.create(role_id=role.id),
+                hashed_password=hashed_password,
             )
-            await self.uow.users.add(user)
+            try:
+                await self.uow.users.add(user)
+            except InfrastructureError:
+                raise ApplicationError(f"Пользователь с email {email} уже существует")
             await self.mb.publish(UserCreatedEvent.model_validate(user))
-            return user
+        await self.mb.broadcast(UserChangedEvent(id=user.id))
+        return user
 
 
 class AssignRoleUseCase:
@@ -72,18 +84,28 @@ class UnsignRoleUseCase:
 
 
 class ChangePasswordUseCase:
-    def __init__(self, uow: IUserServiceUoW):
+    def __init__(self, uow: IUserServiceUoW, hasher: IPasswordHasher):
         self.uow = uow
+        self.hasher = hasher
 
     async def execute(
         self, user_id: UUID, current_user_id: UUID, old_password: str, new_password: str, repeat_password: str
     ) -> None:
         logger.info(f"{user_id} {current_user_id} {old_password} {new_password} {repeat_password}")
+        if user_id != current_user_id:
+            raise ApplicationPermissionDeniedError(
+                f"У вас недостаточно прав для изменения пароля другому пользователю"
+            )
         async with self.uow:
-            if user_id != current_user_id:
-                raise ApplicationPermissionDeniedError(
-                    f"У вас недостаточно прав для изменения пароля другому пользователю"
-                )
             user = await self.uow.users.get(user_id)
-            user.change_password(old_password, new_password, repeat_password)
-            await self.uow.users.update(user)
+        # Проверка и хеширование выполняются при закрытой сессии, как при входе
+        User.validate_new_password(old_password, new_password, repeat_password)
+        old_hash = user.hashed_password
+        old_password_valid = await self.hasher.verify(old_password, old_hash)
+        new_hashed_password = None
+        if old_password_valid:
+            new_hashed_password = HashedPassword(await self.hasher.hash(new_password))
+        user.change_password(old_password, new_password, repeat_password, old_password_valid, new_hashed_password)
+        async with self.uow:
+            if not await self.uow.users.update_password_hash(user.id, old_hash, user.hashed_password):
+                raise ApplicationError("Пароль был изменен другим запросом, повторите попытку")
@@ -0,0 +1,96 @@
+"""
+Подбор параметров Argon2 под целевое время проверки пароля на текущем хосте.
+
+Команда замеряет verify на этой машине и печатает значения ARGON2_* для .env. Хэши, посчитанные с прежними
+параметрами, пересчитываются при следующем успешном входе пользователя. Пример:
+
+    python -m src.user_service.calibrate --target-ms 100
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.user_service.domain.services.hasher import Argon2PasswordHasher
+
+PASSWORD = "calibration-password"
+# Нижняя граница памяти из рекомендаций OWASP для argon2id (19 МиБ)
+MIN_MEMORY_COST = 19 * 1024
+MAX_TIME_COST = 50
+
+
+@dataclass(frozen=True, slots=True)
+class Argon2Cost:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    seconds: float
+
+
+def measure_verify(time_cost: int, memory_cost: int, parallelism: int, repeats: int = 5) -> float:
+    """Медианное время verify в секундах"""
+    hasher = Argon2PasswordHasher(time_cost, memory_cost, parallelism)
+    hashed = hasher.hash(PASSWORD)
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        hasher.verify(PASSWORD, hashed)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def calibrate(
+    target: float,
+    memory_cost: int,
+    parallelism: int,
+    min_memory_cost: int = MIN_MEMORY_COST,
+    measure: Callable[[int, int, int], float] = measure_verify,
+) -> Argon2Cost:
+    """
+    Наибольший time_cost, при котором verify укладывается в target секунд.
+
+    Память уменьшается вдвое (не ниже min_memory_cost), пока даже один проход не укладывается в target.
+    """
+    seconds = measure(1, memory_cost, parallelism)
+    while seconds > target and memory_cost // 2 >= min_memory_cost:
+        memory_cost //= 2
+        seconds = measure(1, memory_cost, parallelism)
+
+    best = Argon2Cost(1, memory_cost, parallelism, seconds)
+    for time_cost in range(2, MAX_TIME_COST + 1):
+        seconds = measure(time_cost, memory_cost, parallelism)
+        if seconds > target:
+            break
+        best = Argon2Cost(time_cost, memory_cost, parallelism, seconds)
+    return best
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Подбор параметров Argon2 под целевое время проверки пароля")
+    parser.add_argument("--target-ms", type=float, default=100, help="целевое время verify, мс")
+    parser.add_argument("--memory-kib", type=int, default=64 * 1024, help="начальный объем памяти, КиБ")
+    parser.add_argument("--parallelism", type=int, default=4, help="число потоков argon2")
+    parser.add_argument("--repeats", type=int, default=5, help="замеров на каждый вариант параметров")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    cost = calibrate(
+        args.target_ms / 1000,
+        args.memory_kib,
+        args.parallelism,
+        measure=lambda t, m, p: measure_verify(t, m, p, args.repeats),
+    )
+    print(f"# verify {cost.seconds * 1000:.1f} ms при цели {args.target_ms:.0f} ms")
+    if cost.seconds * 1000 > args.target_ms:
+        print("# цель недостижима даже при минимальных параметрах")
+    print(f"ARGON2_TIME_COST={cost.time_cost}")
+    print(f"ARGON2_MEMORY_COST={cost.memory_cost}")
+    print(f"ARGON2_PARALLELISM={cost.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
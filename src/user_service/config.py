@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +22,24 @@ class Settings(BaseSettings):
     # ACCESS_TOKEN_EXPIRE_SECONDS: int = 60 * 30
     ACCESS_TOKEN_EXPIRE_SECONDS: int = 60 * 30 * 24 * 30
     REFRESH_TOKEN_EXPIRE_SECONDS: int = 60 * 60 * 24 * 30
+    TOKEN_CACHE_SIZE: int = 10_000
+
+    """Password hashing"""
+    PASSWORD_HASHER_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHER_WORKERS: int = 2
+    # Подбираются командой python -m src.user_service.calibrate; None - значения passlib по умолчанию
+    ARGON2_TIME_COST: int | None = None
+    ARGON2_MEMORY_COST: int | None = None
+    ARGON2_PARALLELISM: int | None = None
+
+    """Refresh token blacklist"""
+    BLACKLIST_FILTER_CAPACITY: int = 100_000
+    BLACKLIST_FILTER_ERROR_RATE: float = 0.01
+    BLACKLIST_SWEEP_INTERVAL_SECONDS: int = 60 * 10
+    BLACKLIST_SWEEP_BATCH: int = 5_000
+
+    """User directory"""
+    USER_DIRECTORY_SIZE: int = 100_000
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -0,0 +1,15 @@
+from typing import Iterator
+
+from dishka import Provider, Scope, provide
+
+from src.user_service.application.protocols import IPasswordHasher
+from src.user_service.config import settings
+from src.user_service.infrastructure.hasher import ExecutorPasswordHasher, make_executor
+
+
+class PasswordHasherProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_password_hasher(self) -> Iterator[IPasswordHasher]:
+        executor = make_executor(settings.PASSWORD_HASHER_EXECUTOR, settings.PASSWORD_HASHER_WORKERS)
+        yield ExecutorPasswordHasher(executor, max_concurrency=settings.PASSWORD_HASHER_WORKERS)
+        executor.shutdown()
@@ -1,13 +1,12 @@
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Self
-from uuid import UUID, uuid4
 
 
 @dataclass
 class BlacklistedToken:
-    id: UUID
-    token: str
+    token_digest: str
     expires_at: datetime
     created_at: datetime
     reason: str | None
@@ -15,11 +14,14 @@ class BlacklistedToken:
     @classmethod
     def create(cls, token: str, expires_at: datetime, reason: str | None = None) -> Self:
         if isinstance(expires_at, int):
-            expires_at = datetime.fromtimestamp(expires_at)
+            expires_at = datetime.fromtimestamp(expires_at, UTC).replace(tzinfo=None)
         return cls(
-            id=uuid4(),
-            token=token,
+            token_digest=cls.digest(token),
             expires_at=expires_at,
             created_at=datetime.now(UTC).replace(tzinfo=None),
             reason=reason,
         )
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
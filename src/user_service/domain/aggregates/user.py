@@ -28,17 +28,33 @@ class User:
         password: str,
         repeat_password: str,
         role_assignment: UserRoleAssignment,
+        hashed_password: HashedPassword | None = None,
     ) -> Self:
-        if password != repeat_password:
-            raise DomainError(f"Пароль и повтор пароля не совпадают")
+        cls.validate_password(password, repeat_password)
         return cls(
             id=uuid4(),
             username=Username(username),
             email=Email(email),
-            hashed_password=HashedPassword.create(password),
+            hashed_password=hashed_password or HashedPassword.create(password),
             role_assignments=[role_assignment],
         )
 
+    @staticmethod
+    def validate_password(password: str, repeat_password: str) -> None:
+        """Проверки пароля при регистрации, не требующие хеширования"""
+        if password != repeat_password:
+            raise DomainError(f"Пароль и повтор пароля не совпадают")
+        HashedPassword.validate(password)
+
+    @staticmethod
+    def validate_new_password(old_password: str, new_password: str, repeat_password: str) -> None:
+        """Проверки нового пароля, не требующие хеширования"""
+        if new_password != repeat_password:
+            raise DomainError(f"Пароли не совпадают")
+        if old_password == new_password:
+            raise DomainError(f"Введены одинаковые старый и новый пароли")
+        HashedPassword.validate(new_password)
+
     def assign_role(self, role_id: UUID, days: int | None = None):
         now = datetime.now(UTC).replace(tzinfo=None, microsecond=0)
         expires_at = now + timedelta(days=days) if days else None
@@ -70,11 +86,19 @@ class User:
         if len(self.role_assignments) == initial_count:
             raise DomainError(f"Роль {role_id} не найдена у пользователя {self.id}")
 
-    def change_password(self, old_password: str, new_password: str, repeat_password: str) -> Self:
-        if not self.hashed_password.verify(old_password):
+    def change_password(
+        self,
+        old_password: str,
+        new_password: str,
+        repeat_password: str,
+        old_password_valid: bool | None = None,
+        new_hashed_password: HashedPassword | None = None,
+    ) -> Self:
+        """old_password_valid и new_hashed_password передаются, если хеширование уже выполнено вне агрегата"""
+        if old_password_valid is None:
+            old_password_valid = self.hashed_password.verify(old_password)
+        if not old_password_valid:
             raise DomainError(f"Указан неверный старый пароль")
-        if new_password != repeat_password:
-            raise DomainError(f"Пароли не совпадают")
-        if old_password == new_password:
-            raise DomainError(f"Введены одинаковые старый и новый пароли")
-        self.hashed_password = HashedPassword.create(new_password)
+        self.validate_new_password(old_password, new_password, repeat_password)
+        self.hashed_password = new_hashed_password or HashedPassword.create(new_password)
+
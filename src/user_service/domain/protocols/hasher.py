@@ -6,3 +6,4 @@ class PasswordHasherProtocol(Protocol):
 
     def hash(self, password: str) -> str: ...
     def verify(self, plain: str, hashed: str) -> bool: ...
+    def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]: ...
@@ -2,11 +2,21 @@ from passlib.context import CryptContext
 
 
 class Argon2PasswordHasher:
-    def __init__(self):
-        self._context = CryptContext(schemes=["argon2"], deprecated="auto")
+    def __init__(self, time_cost: int | None = None, memory_cost: int | None = None, parallelism: int | None = None):
+        """Параметры, равные None, берутся по умолчанию из passlib; memory_cost задается в КиБ"""
+        costs = {"rounds": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+        self._context = CryptContext(
+            schemes=["argon2"],
+            deprecated="auto",
+            **{f"argon2__{name}": value for name, value in costs.items() if value is not None},
+        )
 
     def hash(self, password: str) -> str:
         return self._context.hash(password)
 
     def verify(self, plain: str, hashed: str) -> bool:
         return self._context.verify(plain, hashed)
+
+    def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        """Проверяет пароль и, если хэш посчитан с устаревшими параметрами, возвращает новый хэш"""
+        return self._context.verify_and_update(plain, hashed)
@@ -14,11 +14,16 @@ class HashedPassword(str):
         plain_password: str,
         hasher: PasswordHasherProtocol = Argon2PasswordHasher(),
     ) -> Self:
-        if len(plain_password) < cls.MIN_LENGTH:
-            raise DomainError(f"Пароль должен содержать не менее {cls.MIN_LENGTH} символов")
+        cls.validate(plain_password)
         hashed_password = hasher.hash(plain_password)
         return cls(hashed_password)
 
+    @classmethod
+    def validate(cls, plain_password: str) -> None:
+        """Проверяет пароль до хеширования"""
+        if len(plain_password) < cls.MIN_LENGTH:
+            raise DomainError(f"Пароль должен содержать не менее {cls.MIN_LENGTH} символов")
+
     def verify(
         self,
         plain_password: str,
@@ -0,0 +1,110 @@
+import math
+from typing import AsyncIterable
+
+from prometheus_client import Counter, Gauge
+
+from src.user_service.config import settings
+
+blacklist_filter_checks = Counter(
+    "blacklist_filter_checks",
+    "Проверки refresh токенов по bloom-фильтру черного списка",
+    ["result"],
+)
+blacklist_filter_false_positive_rate = Gauge(
+    "blacklist_filter_false_positive_rate",
+    "Оценка вероятности ложного срабатывания по заполненности фильтра",
+)
+blacklist_filter_bytes = Gauge(
+    "blacklist_filter_bytes",
+    "Размер битового массива bloom-фильтра",
+)
+
+
+class BloomFilter:
+    """Битовый массив с k позициями на ключ; ключ - sha256, позиции получаются двойным хешированием"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._set_bits = 0
+
+    def _positions(self, digest: bytes):
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:16], "little") | 1
+        return ((first + i * step) % self.size for i in range(self.hashes))
+
+    def add(self, digest: bytes) -> None:
+        for position in self._positions(digest):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                self._set_bits += 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self._bits[position // 8] & (1 << position % 8) for position in self._positions(digest))
+
+    @property
+    def false_positive_rate(self) -> float:
+        return (self._set_bits / self.size) ** self.hashes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class TokenBlacklistFilter:
+    """
+    Bloom-фильтр по дайджестам refresh токенов из blacklisted_tokens.
+
+    Отрицательный ответ точен, и БД не запрашивается. Пока фильтр не построен, любой токен считается
+    возможно заблокированным. Токены, добавленные во время перестроения, попадают и в старый, и в новый фильтр.
+    Фильтр перестраивается по таблице периодически: так из него уходят истекшие токены и появляются токены,
+    событие о которых до процесса не дошло.
+    """
+
+    def __init__(
+        self,
+        capacity: int = settings.BLACKLIST_FILTER_CAPACITY,
+        error_rate: float = settings.BLACKLIST_FILTER_ERROR_RATE,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom: BloomFilter | None = None
+        self._building: BloomFilter | None = None
+
+    async def rebuild(self, digests: AsyncIterable[bytes], count: int) -> None:
+        # Запас вдвое: фильтр пополняется до следующего перестроения
+        bloom = BloomFilter(max(self.capacity, 2 * count), self.error_rate)
+        self._building = bloom
+        try:
+            async for digest in digests:
+                bloom.add(digest)
+        finally:
+            self._building = None
+        self._bloom = bloom
+        self._report()
+
+    def add(self, digest: bytes) -> None:
+        for bloom in (self._bloom, self._building):
+            if bloom is not None:
+                bloom.add(digest)
+        self._report()
+
+    def might_contain(self, digest: bytes) -> bool:
+        if self._bloom is not None and digest not in self._bloom:
+            blacklist_filter_checks.labels("negative").inc()
+            return False
+        blacklist_filter_checks.labels("probable").inc()
+        return True
+
+    def record_false_positive(self) -> None:
+        blacklist_filter_checks.labels("false_positive").inc()
+
+    def _report(self) -> None:
+        if self._bloom is not None:
+            blacklist_filter_false_positive_rate.set(self._bloom.false_positive_rate)
+            blacklist_filter_bytes.set(self._bloom.nbytes)
+
+
+blacklist_filter = TokenBlacklistFilter()
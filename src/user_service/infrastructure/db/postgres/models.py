@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import UUID as DBUUID, func, DateTime, String, ForeignKey
+from sqlalchemy import UUID as DBUUID, func, DateTime, String, ForeignKey, Index, LargeBinary
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -74,10 +74,14 @@ class RoleModel(IdBase):
     )
 
 
-class BlacklistedTokenModel(IdBase):
+class BlacklistedTokenModel(Base):
     __tablename__ = "blacklisted_tokens"
+    __table_args__ = (
+        Index("ix_blacklisted_tokens_expires_at", "expires_at"),
+    )
 
-    token: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    # sha256 токена: ключ фиксированной ширины вместо полного JWT
+    token_digest: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     reason: Mapped[Optional[str]] = mapped_column(String, nullable=True)
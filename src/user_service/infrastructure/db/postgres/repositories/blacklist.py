@@ -1,20 +1,53 @@
-from sqlalchemy import select, exists
+from datetime import datetime, UTC
+from typing import AsyncIterator
+
+from sqlalchemy import select, func, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.user_service.domain.aggregates.blacklist import BlacklistedToken
+from src.user_service.infrastructure.blacklist_filter import blacklist_filter, TokenBlacklistFilter
 from src.user_service.infrastructure.db.postgres.models import BlacklistedTokenModel
 from src.user_service.infrastructure.mappers.blacklist import blacklisted_token_to_orm
 
 
 class BlacklistRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, bloom: TokenBlacklistFilter = blacklist_filter):
         self.session = session
+        self.bloom = bloom
 
     async def add(self, blacklisted_token: BlacklistedToken) -> None:
         blacklisted_token_orm = blacklisted_token_to_orm(blacklisted_token)
         self.session.add(blacklisted_token_orm)
+        self.bloom.add(blacklisted_token_orm.token_digest)
 
     async def exists(self, blacklisted_token: str) -> bool:
-        stmt = select(1).where(BlacklistedTokenModel.token == blacklisted_token).limit(1)
+        digest = bytes.fromhex(BlacklistedToken.digest(blacklisted_token))
+        if not self.bloom.might_contain(digest):
+            return False
+        stmt = select(1).where(BlacklistedTokenModel.token_digest == digest)
         result = await self.session.execute(stmt)
-        return result.scalar() is not None
+        found = result.scalar() is not None
+        if not found:
+            self.bloom.record_false_positive()
+        return found
+
+    async def count_active(self) -> int:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = select(func.count()).select_from(BlacklistedTokenModel).where(BlacklistedTokenModel.expires_at > now)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def iter_active_digests(self) -> AsyncIterator[bytes]:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = select(BlacklistedTokenModel.token_digest).where(BlacklistedTokenModel.expires_at > now)
+        async for digest in await self.session.stream_scalars(stmt.execution_options(yield_per=10_000)):
+            yield digest
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        """Удаляет не больше limit записей, истекших к now; идет по индексу expires_at"""
+        expired = (
+            select(BlacklistedTokenModel.token_digest).where(BlacklistedTokenModel.expires_at <= now).limit(limit)
+        )
+        result = await self.session.execute(
+            delete(BlacklistedTokenModel).where(BlacklistedTokenModel.token_digest.in_(expired))
+        )
+        return result.rowcount
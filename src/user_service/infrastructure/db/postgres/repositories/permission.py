@@ -5,6 +5,7 @@ from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload
 
+from src.common.db.page import fetch_page
 from src.common.exceptions.infrastructure import InfrastructureError
 from src.user_service.domain.enities.permission import Permission
 from src.user_service.infrastructure.db.postgres.models import PermissionModel, RoleModel
@@ -48,6 +49,10 @@ class PermissionReadRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def get_codes(self) -> list[str]:
+        result = await self.session.execute(select(PermissionModel.code).order_by(PermissionModel.code))
+        return list(result.scalars())
+
     async def count(self, **filters) -> int:
         stmt = select(func.count()).select_from(PermissionModel)
         if role_id := filters.get("role_id", None):
@@ -55,10 +60,11 @@ class PermissionReadRepository:
         result = await self.session.execute(stmt)
         return result.scalar()
 
-    async def get_many(self, limit: int, offset: int, **filters) -> list[PermissionRead]:
+    async def get_many(
+        self, limit: int, offset: int, with_total: bool = False, **filters
+    ) -> tuple[list[PermissionRead], int | None]:
         stmt = select(PermissionModel).limit(limit).offset(offset).options(noload(PermissionModel.roles))
         if role_id := filters.get("role_id", False):
             stmt = stmt.join(PermissionModel.roles).where(RoleModel.id == role_id)
-        result = await self.session.execute(stmt)
-        orm_permissions = result.scalars().all()
-        return [PermissionRead.model_validate(permission) for permission in orm_permissions]
+        orm_permissions, total = await fetch_page(self.session, stmt, with_total)
+        return [PermissionRead.model_validate(permission) for permission in orm_permissions], total
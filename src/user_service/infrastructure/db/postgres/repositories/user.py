@@ -1,8 +1,8 @@
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import select, update
+from sqlalchemy.exc import NoResultFound, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload, selectinload, joinedload
 
@@ -65,6 +65,12 @@ class UserRepository:
     async def add(self, user: User) -> None:
         orm_user = user_to_orm(user)
         self.session.add(orm_user)
+        # Уникальность email окончательно проверяет индекс users.email: параллельная регистрация могла
+        # пройти проверку get_by_email одновременно с этой
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            raise InfrastructureError(f"Пользователь с email {user.email} уже существует")
 
     @count_queries
     async def update(self, user: User) -> User:
@@ -72,6 +78,17 @@ class UserRepository:
         new_user = await self.session.merge(orm_user)
         return user_to_domain(new_user)
 
+    @count_queries
+    async def update_password_hash(self, user_id: UUID, old_hash: str, new_hash: str) -> bool:
+        """Заменяет хэш, только если пароль не сменили с момента проверки"""
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount == 1
+
 
 class UserReadRepository:
     def __init__(self, session: AsyncSession):
@@ -104,6 +121,14 @@ class UserReadRepository:
         orm_users = result.scalars().all()
         return [UserRead.model_validate(orm_user) for orm_user in orm_users]
 
+    @count_queries
+    async def get_usernames(self, user_ids: list[UUID] | None = None, limit: int | None = None) -> dict[UUID, str]:
+        stmt = select(UserModel.id, UserModel.username).limit(limit)
+        if user_ids is not None:
+            stmt = stmt.where(UserModel.id.in_(user_ids))
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
     @count_queries
     async def get_by_email(self, email: str) -> UserRead:
         stmt = (
@@ -3,6 +3,7 @@ from typing import Self
 from loguru import logger
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
+from src.common.db.count import CountProvider
 from src.user_service.application.protocols import (
     IUserRepository,
     IRoleRepository,
@@ -30,6 +31,7 @@ class UserServiceUoW:
     permissions: IPermissionRepository
     permissions_read: IPermissionReadRepository
     blacklist: IBlacklistRepository
+    totals: CountProvider
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -42,6 +44,7 @@ class UserServiceUoW:
         self.permissions = PermissionRepository(self.session)
         self.permissions_read = PermissionReadRepository(self.session)
         self.blacklist = BlacklistRepository(self.session)
+        self.totals = CountProvider(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+from typing import Callable, Literal, TypeVar
+
+from prometheus_client import Gauge, Histogram
+
+from src.user_service.config import settings
+from src.user_service.domain.services.hasher import Argon2PasswordHasher
+
+T = TypeVar("T")
+
+password_hash_queue = Gauge(
+    "password_hasher_queue_depth",
+    "Операции хеширования паролей, ожидающие свободного исполнителя",
+)
+password_hash_wait_seconds = Histogram(
+    "password_hasher_wait_seconds",
+    "Время ожидания свободного исполнителя",
+    ["operation"],
+)
+password_hash_seconds = Histogram(
+    "password_hasher_seconds",
+    "Время хеширования или проверки пароля в пуле",
+    ["operation"],
+)
+
+
+@cache
+def argon2_hasher() -> Argon2PasswordHasher:
+    # Отдельный экземпляр в каждом процессе пула; функции модуля сериализуются для ProcessPoolExecutor
+    return Argon2PasswordHasher(settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST, settings.ARGON2_PARALLELISM)
+
+
+def _hash(password: str) -> str:
+    return argon2_hasher().hash(password)
+
+
+def _verify(plain: str, hashed: str) -> bool:
+    return argon2_hasher().verify(plain, hashed)
+
+
+def _verify_and_update(plain: str, hashed: str) -> tuple[bool, str | None]:
+    return argon2_hasher().verify_and_update(plain, hashed)
+
+
+def make_executor(kind: Literal["thread", "process"], workers: int) -> Executor:
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+
+
+class ExecutorPasswordHasher:
+    """
+    Argon2 в пуле потоков или процессов, чтобы хеширование не блокировало event loop.
+
+    Одновременно выполняется не больше max_concurrency операций, остальные ждут на семафоре и видны в
+    password_hasher_queue_depth, а не копятся в очереди пула.
+    """
+
+    def __init__(self, executor: Executor, max_concurrency: int):
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run("verify", _verify, plain, hashed)
+
+    async def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        return await self._run("verify", _verify_and_update, plain, hashed)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args) -> T:
+        queued_at = time.perf_counter()
+        password_hash_queue.inc()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            password_hash_queue.dec()
+        started_at = time.perf_counter()
+        password_hash_wait_seconds.labels(operation).observe(started_at - queued_at)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._semaphore.release()
+            password_hash_seconds.labels(operation).observe(time.perf_counter() - started_at)
@@ -12,5 +12,8 @@ def blacklisted_token_to_orm(obj):
 @blacklisted_token_to_orm.register
 def _(obj: BlacklistedToken) -> BlacklistedTokenModel:
     return BlacklistedTokenModel(
-        id=obj.id, token=obj.token, expires_at=obj.expires_at, reason=obj.reason, created_at=obj.created_at
+        token_digest=bytes.fromhex(obj.token_digest),
+        expires_at=obj.expires_at,
+        reason=obj.reason,
+        created_at=obj.created_at,
     )
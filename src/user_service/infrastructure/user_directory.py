@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Iterable
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+
+from src.user_service.application.protocols import IUserServiceUoW
+from src.user_service.config import settings
+
+user_directory_lookups = Counter(
+    "user_directory_lookups",
+    "Поиск имен пользователей в справочнике (hit - из памяти, miss - из БД)",
+    ["result"],
+)
+user_directory_size = Gauge(
+    "user_directory_size",
+    "Пользователей в справочнике",
+)
+
+
+class UserDirectory:
+    """
+    Справочник id -> username для ответов на GetUserInfo запросы.
+
+    Промахи догружаются одним запросом на всю пачку, отсутствующие пользователи не кэшируются. Записи
+    сбрасываются по UserChangedEvent; результат загрузки, начатой до сброса, в справочник не попадает.
+    """
+
+    def __init__(self, maxsize: int = settings.USER_DIRECTORY_SIZE):
+        self.maxsize = maxsize
+        self._usernames: OrderedDict[UUID, str] = OrderedDict()
+        self._generation = 0
+
+    async def get_many(self, user_ids: Iterable[UUID], uow: IUserServiceUoW) -> dict[UUID, str]:
+        usernames, missing = {}, []
+        for user_id in dict.fromkeys(user_ids):
+            username = self._usernames.get(user_id)
+            if username is None:
+                missing.append(user_id)
+            else:
+                self._usernames.move_to_end(user_id)
+                usernames[user_id] = username
+        user_directory_lookups.labels("hit").inc(len(usernames))
+        if missing:
+            user_directory_lookups.labels("miss").inc(len(missing))
+            generation = self._generation
+            async with uow:
+                loaded = await uow.users_read.get_usernames(missing)
+            if generation == self._generation:
+                self.put_many(loaded)
+            usernames.update(loaded)
+        return usernames
+
+    async def warm(self, uow: IUserServiceUoW) -> None:
+        generation = self._generation
+        async with uow:
+            loaded = await uow.users_read.get_usernames(limit=self.maxsize)
+        if generation == self._generation:
+            self.put_many(loaded)
+
+    def put_many(self, usernames: dict[UUID, str]) -> None:
+        self._usernames.update(usernames)
+        for user_id in usernames:
+            self._usernames.move_to_end(user_id)
+        while len(self._usernames) > self.maxsize:
+            self._usernames.popitem(last=False)
+        user_directory_size.set(len(self._usernames))
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._generation += 1
+        self._usernames.pop(user_id, None)
+        user_directory_size.set(len(self._usernames))
+
+
+user_directory = UserDirectory()
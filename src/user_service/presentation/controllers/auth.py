@@ -10,7 +10,8 @@ from loguru import logger
 
 from src.common.exceptions.application import ApplicationError
 from src.common.exceptions.infrastructure import InfrastructureError
-from src.user_service.application.protocols import IUserServiceUoW
+from src.common.message_bus.interfaces import IMessageBus
+from src.user_service.application.protocols import IUserServiceUoW, IPasswordHasher
 from src.user_service.application.use_cases.auth import (
     LoginUserUseCase,
     UpdateAccessAndRefreshTokensUseCase,
@@ -31,9 +32,10 @@ class AuthController(Controller):
     async def login(
         self,
         uow: FromDishka[IUserServiceUoW],
+        hasher: FromDishka[IPasswordHasher],
         data: Annotated[LoginRequestSchema, Body(media_type=RequestEncodingType.URL_ENCODED)],
     ) -> Response[TokenResponseSchema]:
-        use_case = LoginUserUseCase(uow)
+        use_case = LoginUserUseCase(uow, hasher)
         response = await use_case.execute(email=data.email, password=data.password)
         return response
 
@@ -46,7 +48,9 @@ class AuthController(Controller):
         return result
 
     @get("/logout", summary="Выход (удаление refresh token)")
-    async def logout(self, request: Request, uow: FromDishka[IUserServiceUoW]) -> Response:
-        use_case = LogoutUserUseCase(uow)
+    async def logout(
+        self, request: Request, uow: FromDishka[IUserServiceUoW], mb: FromDishka[IMessageBus]
+    ) -> Response:
+        use_case = LogoutUserUseCase(uow, mb)
         result = await use_case.execute(request.user, request.auth)
         return result
@@ -2,9 +2,9 @@ from dataclasses import asdict
 
 from dishka import FromDishka
 from litestar import Controller, get
-from litestar.pagination import OffsetPagination
 
 from src.common.litestar_.di.filters import get_limit_offset_filters, LimitOffsetFilterRequest
+from src.common.litestar_.pagination import OffsetPage
 from src.user_service.application.protocols import IUserServiceUoW
 from src.user_service.application.use_cases.read.permission import GetPermissionsUseCase
 from src.user_service.domain.enities.permission import Permission
@@ -28,9 +28,11 @@ class PermissionController(Controller):
         pagination: LimitOffsetFilterRequest,
         filters: FilterPermissionsRequestSchema,
         uow: FromDishka[IUserServiceUoW],
-    ) -> OffsetPagination[Permission]:
+    ) -> OffsetPage[Permission]:
         use_case = GetPermissionsUseCase(uow)
-        result = await use_case.execute(limit=pagination.limit, offset=pagination.offset, **asdict(filters))
+        result = await use_case.execute(
+            limit=pagination.limit, offset=pagination.offset, with_total=pagination.with_total, **asdict(filters)
+        )
         return result
 
     # @post(path="", dto=CreatePermissionRequestDTO, summary="Создание нового разрешения")
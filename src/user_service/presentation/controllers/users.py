@@ -8,7 +8,7 @@ from litestar.enums import RequestEncodingType
 from litestar.params import Body
 
 from src.common.message_bus.interfaces import IMessageBus
-from src.user_service.application.protocols import IUserServiceUoW
+from src.user_service.application.protocols import IUserServiceUoW, IPasswordHasher
 from src.user_service.application.use_cases.write.user import (
     RegisterUserUseCase,
     AssignRoleUseCase,
@@ -84,10 +84,11 @@ class UserController(Controller):
         self,
         uow: FromDishka[IUserServiceUoW],
         mb: FromDishka[IMessageBus],
+        hasher: FromDishka[IPasswordHasher],
         data: DTOData[CreateUserRequestSchema],
     ) -> User:
         data_instance = data.create_instance()
-        use_case = RegisterUserUseCase(uow, mb)
+        use_case = RegisterUserUseCase(uow, mb, hasher)
         result = await use_case.execute(
             data_instance.username,
             data_instance.email,
@@ -136,8 +137,9 @@ class UserController(Controller):
         user_id: UUID,
         data: Annotated[ChangePasswordRequestSchema, Body(media_type=RequestEncodingType.URL_ENCODED)],
         uow: FromDishka[IUserServiceUoW],
+        hasher: FromDishka[IPasswordHasher],
     ) -> None:
-        use_case = ChangePasswordUseCase(uow)
+        use_case = ChangePasswordUseCase(uow, hasher)
         result = await use_case.execute(
             user_id,
             UUID(request.auth.sub),
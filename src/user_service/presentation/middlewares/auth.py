@@ -10,6 +10,7 @@ from loguru import logger
 from src.user_service.application.protocols import IUserServiceUoW
 from src.user_service.infrastructure.read_models.user import UserRead
 from src.user_service.presentation.services.jwt import jwt_handler
+from src.user_service.presentation.services.token_cache import token_cache
 
 
 class AuthMiddleware(AbstractAuthenticationMiddleware):
@@ -48,6 +49,6 @@ class AuthMiddleware(AbstractAuthenticationMiddleware):
         auth_header = connection.headers.get("authorization")
         if auth_header and auth_header.lower().startswith("bearer "):
             token = auth_header.split(" ")[1]
-            decoded_token = jwt_handler.decode_token(token)
+            decoded_token = token_cache.decode_token(token)
             return AuthenticationResult(user=None, auth=decoded_token)
         raise NotAuthorizedException("Необходима авторизация")
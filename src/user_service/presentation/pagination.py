@@ -4,11 +4,16 @@ from src.user_service.infrastructure.read_models.role import PermissionRead
 
 
 class PermissionOffsetPagination(FilteredAbstractAsyncOffsetPaginator):
+    table = "permissions"
+
     def __init__(self, uow: IUserServiceUoW):
         self.uow = uow
+        self.totals = uow.totals
 
     async def get_total(self, **filters) -> int:
         return await self.uow.permissions_read.count(**filters)
 
-    async def get_items(self, limit: int, offset: int, **filters) -> list[PermissionRead]:
-        return await self.uow.permissions_read.get_many(limit, offset, **filters)
+    async def get_items(
+        self, limit: int, offset: int, with_total: bool, **filters
+    ) -> tuple[list[PermissionRead], int | None]:
+        return await self.uow.permissions_read.get_many(limit, offset, with_total, **filters)
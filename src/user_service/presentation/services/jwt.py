@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import timedelta, datetime, UTC
 from typing import Literal
 from uuid import UUID
@@ -9,6 +9,7 @@ from litestar.exceptions import HTTPException
 
 from src.user_service.config import settings
 from src.user_service.infrastructure.read_models.user import UserRead
+from src.user_service.presentation.services.permission_registry import permission_registry
 
 
 @dataclass
@@ -18,7 +19,13 @@ class AccessToken:
     exp: datetime
     iat: datetime
     roles: list[str]
-    permissions: list[str]
+    # Битовая маска разрешений (hex) и версия реестра, по которому она построена
+    perms: str
+    pv: str
+    permissions: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.permissions = permission_registry.decode(self.perms, self.pv)
 
 
 @dataclass
@@ -40,12 +47,15 @@ class JWTHandler:
             sub=str(user.id),
             exp=datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=settings.ACCESS_TOKEN_EXPIRE_SECONDS),
             iat=datetime.now(UTC).replace(tzinfo=None),
-            roles=[assignment.role.name for assignment in user.role_assignments],
-            permissions=[
+            roles=list(dict.fromkeys(assignment.role.name for assignment in user.role_assignments)),
+            perms=permission_registry.encode(
                 permission.code for assignment in user.role_assignments for permission in assignment.role.permissions
-            ],
+            ),
+            pv=permission_registry.version,
         )
-        return jwt.encode(asdict(payload), self.secret_key, algorithm=self.algorithm)
+        claims = asdict(payload)
+        del claims["permissions"]
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
 
     def create_refresh_token(self, user: UserRead) -> str:
         payload = RefreshToken(
@@ -69,7 +79,7 @@ class JWTHandler:
                 return RefreshToken(**payload)
             else:
                 raise exc
-        except (JWTError, TypeError):
+        except (JWTError, TypeError, ValueError):
             raise exc
 
 
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Iterable
+
+from loguru import logger
+
+from src.user_service.domain.default_objects.permissions import default_permissions
+
+
+class PermissionRegistry:
+    """
+    Порядковые номера кодов разрешений для битовой маски в access токене.
+
+    Встроенные коды идут первыми в порядке default_permissions, коды из БД - после них по алфавиту, поэтому
+    при одинаковом наборе кодов версия совпадает во всех воркерах. Токен с другой версией реестра невалиден.
+    """
+
+    def __init__(self, codes: Iterable[str]):
+        self._base = tuple(dict.fromkeys(codes))
+        self._build(self._base)
+
+    def _build(self, codes: tuple[str, ...]) -> None:
+        self.codes = codes
+        self.version = hashlib.sha256("\n".join(codes).encode()).hexdigest()[:8]
+        self._bits = {code: 1 << index for index, code in enumerate(codes)}
+
+    def load(self, codes: Iterable[str]) -> None:
+        """Добавляет к встроенным кодам разрешения из БД"""
+        extra = sorted(set(codes).difference(self._base))
+        self._build(self._base + tuple(extra))
+
+    def encode(self, codes: Iterable[str]) -> str:
+        mask = 0
+        for code in codes:
+            if code not in self._bits:
+                logger.warning(f"Разрешение {code} отсутствует в реестре и не попадет в токен")
+                continue
+            mask |= self._bits[code]
+        return format(mask, "x")
+
+    def decode(self, mask: str, version: str) -> frozenset[str]:
+        if version != self.version:
+            raise ValueError(f"Версия реестра разрешений {version} не совпадает с {self.version}")
+        value = int(mask, 16)
+        if value >> len(self.codes):
+            raise ValueError("Маска разрешений содержит неизвестные биты")
+        return frozenset(code for code, bit in self._bits.items() if value & bit)
+
+
+permission_registry = PermissionRegistry(permission.code for permission in default_permissions)
@@ -0,0 +1,71 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from prometheus_client import Counter
+
+from src.user_service.config import settings
+from src.user_service.presentation.services.jwt import AccessToken, jwt_handler, JWTHandler
+
+token_cache_lookups = Counter(
+    "auth_token_cache_lookups",
+    "Обращения к кэшу проверенных access токенов",
+    ["result"],
+)
+token_cache_evictions = Counter(
+    "auth_token_cache_evictions",
+    "Вытеснения из кэша проверенных access токенов по размеру",
+)
+
+
+class VerifiedTokenCache:
+    """
+    LRU проверенных access токенов, ключ - sha256 токена, запись живет до exp токена.
+
+    Методы не содержат await, поэтому в пределах одного event loop обращения корутин не перемежаются и
+    блокировка не нужна. Возвращаемые AccessToken общие для всех запросов и не должны изменяться.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.TOKEN_CACHE_SIZE,
+        handler: JWTHandler = jwt_handler,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.maxsize = maxsize
+        self.handler = handler
+        self.clock = clock
+        self._entries: OrderedDict[bytes, AccessToken] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def decode_token(self, token: str):
+        """То же, что JWTHandler.decode_token, но access токены проверяются один раз за время жизни"""
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._entries.get(key)
+        if cached is not None:
+            # exp в payload - секунды UTC, как их записывает jose
+            if cached.exp > self.clock():
+                self._entries.move_to_end(key)
+                token_cache_lookups.labels("hit").inc()
+                return cached
+            del self._entries[key]
+            token_cache_lookups.labels("expired").inc()
+        else:
+            token_cache_lookups.labels("miss").inc()
+
+        decoded_token = self.handler.decode_token(token)
+        if isinstance(decoded_token, AccessToken) and self.maxsize > 0:
+            self._entries[key] = decoded_token
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                token_cache_evictions.inc()
+        return decoded_token
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+token_cache = VerifiedTokenCache()
@@ -0,0 +1,17 @@
+import asyncio
+from uuid import uuid4
+
+from src.common.db.count import CountProvider, TotalCount
+
+
+def test_remembered_total_is_served_from_cache():
+    # для отфильтрованных списков оценка по статистике не используется, поэтому сессия не нужна
+    provider = CountProvider(session=None)
+    project_id = uuid4()
+
+    async def scenario():
+        assert await provider.get("subprojects", project_id=project_id) is None
+        await provider.remember("subprojects", 42, project_id=project_id)
+        return await provider.get("subprojects", project_id=project_id)
+
+    assert asyncio.run(scenario()) == TotalCount(42)
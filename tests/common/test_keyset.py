@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4, UUID
+
+import pytest
+from litestar import get
+from litestar.di import Provide
+from litestar.testing import create_test_client
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.common.db.keyset import Keyset, seek
+from src.common.exceptions.application import ApplicationError
+from src.common.litestar_.di.filters import CursorFilterRequest, get_cursor_filters
+from src.common.litestar_.exception_handlers import log_exception
+from src.common.litestar_.pagination import FilteredAbstractAsyncCursorPaginator
+from src.project_service.infrastructure.db.postgres.models import StageModel
+
+
+def test_keyset_round_trip():
+    keyset = Keyset(datetime(2025, 1, 2, 3, 4, 5, 678901), uuid4())
+
+    assert Keyset.decode(keyset.encode()) == keyset
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ApplicationError):
+        Keyset.decode("not-a-cursor")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "%%%", Keyset(datetime(2025, 1, 1), uuid4()).encode()[:-4]])
+def test_garbage_cursor_is_bad_request(cursor):
+    @get("/items", dependencies={"pagination": Provide(get_cursor_filters)})
+    async def items(pagination: CursorFilterRequest) -> None: ...
+
+    with create_test_client([items], exception_handlers={ApplicationError: log_exception}) as client:
+        response = client.get("/items", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert "Некорректный курсор" in response.json()["detail"]
+
+
+def test_seek_compares_row_values_and_fetches_extra_row():
+    keyset = Keyset(datetime(2025, 1, 1), uuid4())
+
+    stmt = seek(select(StageModel), StageModel.updated_at, StageModel.id, keyset, 10)
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "(stages.updated_at, stages.id) < (" in sql
+    assert "ORDER BY stages.updated_at DESC, stages.id DESC" in sql
+    assert "LIMIT 11" in sql
+
+
+class ListPaginator(FilteredAbstractAsyncCursorPaginator[Keyset]):
+    def __init__(self, items: list[Keyset]):
+        self.items = sorted(items, key=lambda item: (item.timestamp, item.id), reverse=True)
+
+    async def get_items(self, cursor: Keyset | None, results_per_page: int, **filters) -> list[Keyset]:
+        items = [
+            item for item in self.items if cursor is None or (item.timestamp, item.id) < (cursor.timestamp, cursor.id)
+        ]
+        return items[: results_per_page + 1]
+
+    def get_keyset(self, item: Keyset) -> Keyset:
+        return item
+
+
+def test_cursor_pages_cover_all_items_once():
+    now = datetime(2025, 1, 1)
+    # одинаковые временные метки различаются по id
+    items = [Keyset(now - timedelta(seconds=i // 3), UUID(int=i)) for i in range(10)]
+    paginator = ListPaginator(items)
+
+    seen, cursor = [], None
+    while True:
+        page = asyncio.run(paginator(Keyset.decode(cursor) if cursor else None, 4))
+        seen.extend(page.items)
+        cursor = page.cursor
+        if cursor is None:
+            break
+
+    assert seen == paginator.items
@@ -0,0 +1,78 @@
+import asyncio
+
+from src.common.db.count import TotalCount
+from src.common.litestar_.pagination import FilteredAbstractAsyncOffsetPaginator
+
+
+class ListPaginator(FilteredAbstractAsyncOffsetPaginator[int]):
+    def __init__(self, items: list[int]):
+        self.items = items
+        self.count_calls = 0
+
+    async def get_total(self, **filters) -> int:
+        self.count_calls += 1
+        return len(self.items)
+
+    async def get_items(self, limit: int, offset: int, with_total: bool, **filters) -> tuple[list[int], int | None]:
+        page = self.items[offset : offset + limit]
+        return page, len(self.items) if with_total and page else None
+
+
+def test_total_comes_from_items_query():
+    paginator = ListPaginator(list(range(10)))
+
+    page = asyncio.run(paginator(limit=3, offset=3))
+
+    assert page.items == [3, 4, 5]
+    assert page.total == 10
+    assert paginator.count_calls == 0
+
+
+def test_total_is_skipped_on_request():
+    paginator = ListPaginator(list(range(10)))
+
+    page = asyncio.run(paginator(limit=3, offset=0, with_total=False))
+
+    assert page.total is None
+    assert paginator.count_calls == 0
+
+
+def test_empty_page_falls_back_to_count():
+    paginator = ListPaginator(list(range(10)))
+
+    assert asyncio.run(paginator(limit=3, offset=30)).total == 10
+    assert paginator.count_calls == 1
+    assert asyncio.run(ListPaginator([])(limit=3, offset=0)).total == 0
+
+
+class FakeTotals:
+    def __init__(self, known=None):
+        self.known = known
+        self.remembered = []
+
+    async def get(self, table: str, **filters):
+        return self.known
+
+    async def remember(self, table: str, value: int, **filters):
+        self.remembered.append((table, value))
+        return TotalCount(value)
+
+
+def test_known_total_skips_counting_with_page():
+    paginator = ListPaginator(list(range(10)))
+    paginator.table, paginator.totals = "items", FakeTotals(TotalCount(1_000_000, is_approximate=True))
+
+    page = asyncio.run(paginator(limit=3, offset=0))
+
+    assert page.total == 1_000_000
+    assert page.total_is_approximate
+
+
+def test_exact_total_is_remembered():
+    paginator = ListPaginator(list(range(10)))
+    paginator.table, paginator.totals = "items", FakeTotals()
+
+    page = asyncio.run(paginator(limit=3, offset=0))
+
+    assert (page.total, page.total_is_approximate) == (10, False)
+    assert paginator.totals.remembered == [("items", 10)]
@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+import pytest
+
+from src.common.exceptions.domain import DomainError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import ProjectStatus, StageStatus, SubprojectStatus
+
+
+def make_project() -> Project:
+    return Project.create(
+        "proj",
+        subprojects=[
+            Subproject.create("sub-1", stages=[Stage.create("a"), Stage.create("b")]),
+            Subproject.create("sub-2", stages=[Stage.create("c")]),
+        ],
+    )
+
+
+def test_batch_updates_subproject_and_project_rollups():
+    batch = make_project()
+    stage_ids = [stage.id for sub in batch.subprojects for stage in sub.stages]
+
+    stages = batch.change_stage_statuses([(stage_id, StageStatus.COMPLETED, None) for stage_id in stage_ids[:2]])
+
+    assert [stage.id for stage in stages] == stage_ids[:2]
+    assert batch.subprojects[0].status == SubprojectStatus.COMPLETED
+    assert batch.progress == 0.5
+    assert batch.status == ProjectStatus.IN_PROGRESS
+
+    batch.change_stage_statuses([(stage_ids[2], StageStatus.COMPLETED, None)])
+
+    assert batch.progress == 1.0
+    assert batch.status == ProjectStatus.COMPLETED
+
+
+def test_batch_keeps_messages_per_stage():
+    project = make_project()
+    stage = project.subprojects[1].stages[0]
+    message = Message.create(uuid4(), "проверено")
+
+    project.change_stage_statuses([(stage.id, StageStatus.CONFIRMED, message)])
+
+    assert stage.status == StageStatus.CONFIRMED
+    assert stage.messages == [message]
+
+
+def test_batch_rejects_duplicate_and_foreign_stages():
+    project = make_project()
+    stage_id = project.subprojects[0].stages[0].id
+
+    with pytest.raises(DomainError):
+        project.change_stage_statuses([(stage_id, StageStatus.COMPLETED, None)] * 2)
+    with pytest.raises(DomainError):
+        project.change_stage_statuses([(uuid4(), StageStatus.COMPLETED, None)])
@@ -0,0 +1,53 @@
+import pytest
+
+from src.common.exceptions.domain import DomainError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+
+
+def test_add_stage_through_project_indexes_stage():
+    subproject = Subproject.create("sub")
+    project = Project.create("proj", subprojects=[subproject])
+    stage = Stage.create("stage")
+
+    project.add_stage(subproject.id, stage)
+
+    assert project.get_stage_by_id(stage.id) is stage
+    assert project.get_subproject_by_stage_id(stage.id) is subproject
+    with pytest.raises(DomainError):
+        project.add_stage(subproject.id, Stage.create("stage"))
+
+
+def test_renamed_stage_frees_its_name():
+    stage = Stage.create("old")
+    subproject = Subproject.create("sub", stages=[stage])
+
+    subproject.update_stage(stage.id, "new")
+    subproject.add_stage(Stage.create("old"))
+
+    with pytest.raises(DomainError):
+        subproject.add_stage(Stage.create("new"))
+
+
+def test_stage_added_bypassing_project_is_found():
+    subproject = Subproject.create("sub")
+    project = Project.create("proj", subprojects=[subproject])
+    stage = Stage.create("stage")
+
+    subproject.add_stage(stage)
+
+    assert project.get_subproject_by_stage_id(stage.id) is subproject
+
+
+def test_removed_subproject_is_not_found():
+    stage = Stage.create("stage")
+    subproject = Subproject.create("sub", stages=[stage])
+    project = Project.create("proj", subprojects=[subproject])
+
+    project.remove_subproject(subproject.id)
+
+    assert project.get_subproject_by_stage_id(stage.id) is None
+    with pytest.raises(DomainError):
+        project.get_subproject_by_id(subproject.id)
+    project.add_subproject(Subproject.create("sub"))
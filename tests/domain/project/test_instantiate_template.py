@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+import pytest
+
+from src.common.exceptions.application import ApplicationError
+from src.common.exceptions.domain import DomainError
+from src.project_service.application.use_cases.write.subproject import ApplyTemplateUseCase
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import ProjectStatus, StageStatus
+from src.project_service.domain.value_objects.subprojects_rollup import SubprojectsRollup
+
+
+def make_project_with_template() -> Project:
+    source = Subproject.create("source", stages=[Stage.create("a"), Stage.create("b", "описание")])
+    project = Project.create("proj", subprojects=[source])
+    project.make_template_from_subproject(source.id)
+    return project
+
+
+def test_instantiated_subprojects_match_stage_by_stage_creation():
+    project = make_project_with_template()
+    expected = Subproject.create("expected")
+    for stage in project.template.stages:
+        expected.add_stage(Stage.create(stage.name, stage.description))
+
+    created = project.instantiate_template(["sub-1", "sub-2"])
+
+    assert [subproject.name for subproject in created] == ["sub-1", "sub-2"]
+    for subproject in created:
+        assert [(stage.name, stage.description) for stage in subproject.stages] == [
+            (stage.name, stage.description) for stage in expected.stages
+        ]
+        assert (subproject.status, subproject.progress) == (expected.status, expected.progress)
+        assert project.get_subproject_by_stage_id(subproject.stages[0].id) is subproject
+    assert len(project.subprojects) == 3
+
+
+def test_instantiate_template_recomputes_rollup_with_unloaded_subprojects():
+    project = make_project_with_template()
+    for stage in project.subprojects[0].stages:
+        project.change_stage_status(stage.id, StageStatus.COMPLETED)
+    project.unloaded_subprojects = SubprojectsRollup.create(total=1, completed=1)
+
+    project.instantiate_template(["new"])
+
+    assert project.progress == 2 / 3
+    assert project.status == ProjectStatus.IN_PROGRESS
+
+
+def test_instantiate_template_rejects_duplicate_names_and_missing_template():
+    project = make_project_with_template()
+
+    with pytest.raises(DomainError):
+        project.instantiate_template(["source"])
+    with pytest.raises(DomainError):
+        project.instantiate_template(["twin", "twin"])
+    with pytest.raises(DomainError):
+        project.instantiate_template(["fresh", "source"])
+    # Отклонённый пакет не меняет агрегат
+    assert [subproject.name for subproject in project.subprojects] == ["source"]
+    project.instantiate_template(["fresh", "twin"])
+    with pytest.raises(DomainError):
+        Project.create("empty").instantiate_template(["sub"])
+
+
+class NoLoadUoW:
+    async def __aenter__(self):
+        raise AssertionError("Проект не должен загружаться")
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb): ...
+
+
+@pytest.mark.asyncio
+async def test_apply_template_rejects_repeated_names_before_loading():
+    with pytest.raises(ApplicationError):
+        await ApplyTemplateUseCase(NoLoadUoW(), None).execute(uuid4(), ["twin", "other", "twin"])
@@ -0,0 +1,49 @@
+import pytest
+
+from src.common.exceptions.domain import DomainError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import ProjectStatus, StageStatus
+from src.project_service.domain.value_objects.subprojects_rollup import SubprojectsRollup
+
+
+def make_partial_project(total: int, completed: int) -> tuple[Project, Stage]:
+    stage = Stage.create("stage")
+    project = Project.create("proj", subprojects=[Subproject.create("sub", stages=[stage])])
+    project.unloaded_subprojects = SubprojectsRollup.create(total=total, completed=completed)
+    return project, stage
+
+
+def test_partial_project_rollup_counts_unloaded_subprojects():
+    project, stage = make_partial_project(total=3, completed=3)
+
+    project.change_stage_status(stage.id, StageStatus.COMPLETED)
+
+    assert project.progress == 1.0
+    assert project.status == ProjectStatus.COMPLETED
+
+
+def test_partial_project_rollup_matches_full_project():
+    project, stage = make_partial_project(total=3, completed=1)
+
+    project.change_stage_status(stage.id, StageStatus.COMPLETED)
+
+    assert project.progress == 0.5
+    assert project.status == ProjectStatus.IN_PROGRESS
+
+
+def test_partial_project_rejects_whole_tree_operations():
+    project, _ = make_partial_project(total=1, completed=0)
+
+    with pytest.raises(DomainError, match="частично загруженного"):
+        project.add_subproject(Subproject.create("other"))
+    with pytest.raises(DomainError, match="частично загруженного"):
+        project.remove_subproject(project.subprojects[0].id)
+    with pytest.raises(DomainError, match="частично загруженного"):
+        project.make_template_from_subproject(project.subprojects[0].id)
+
+
+def test_rollup_rejects_inconsistent_counts():
+    with pytest.raises(DomainError):
+        SubprojectsRollup.create(total=1, completed=2)
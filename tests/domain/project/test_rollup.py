@@ -0,0 +1,51 @@
+import random
+
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+
+
+def assert_counters_match_recount(project: Project) -> None:
+    assert project._subprojects_rollup() == project._recount_subprojects()
+    for subproject in project.subprojects:
+        assert subproject._stages_rollup() == subproject._recount_stages()
+
+
+def test_counters_follow_random_mutations():
+    rng = random.Random(42)
+    project = Project.create("proj", subprojects=[Subproject.create(f"sub-{i}") for i in range(5)])
+
+    for step in range(500):
+        subproject = rng.choice(project.subprojects)
+        stages = subproject.stages
+        action = rng.random()
+        if action < 0.4 or not stages:
+            project.add_stage(subproject.id, Stage.create(f"stage-{step}"))
+        elif action < 0.8:
+            stage = rng.choice(stages)
+            status = StageStatus.IN_PROGRESS if stage.status == StageStatus.COMPLETED else StageStatus.COMPLETED
+            project.change_stage_status(stage.id, status)
+        else:
+            project.remove_stage(rng.choice(stages).id)
+        assert_counters_match_recount(project)
+
+    for subproject in list(project.subprojects):
+        project.remove_subproject(subproject.id)
+        assert_counters_match_recount(project)
+    assert project.progress == 0
+
+
+def test_counters_seeded_from_loaded_statuses():
+    stages = [Stage.create(f"stage-{i}") for i in range(4)]
+    for stage in stages[:3]:
+        stage.status = StageStatus.COMPLETED
+    subproject = Subproject.create("sub", stages=stages)
+    project = Project.create("proj", subprojects=[subproject, Subproject.create("empty")])
+
+    project.change_stage_status(stages[3].id, StageStatus.COMPLETED)
+
+    assert subproject.progress == 1.0
+    # пустой подпроект остаётся в статусе CREATED до первого пересчёта
+    assert project.progress == 0.5
+    assert_counters_match_recount(project)
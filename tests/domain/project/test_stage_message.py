@@ -0,0 +1,21 @@
+from uuid import uuid4
+
+import pytest
+
+from src.common.exceptions.domain import DomainError
+from src.project_service.domain.aggregates.stage_message import StageMessage
+
+
+def test_create_stage_message_sets_initial_values():
+    stage_id, author_id = uuid4(), uuid4()
+
+    message = StageMessage.create(stage_id, author_id, "  готово  ")
+
+    assert message.stage_id == stage_id
+    assert message.author_id == author_id
+    assert message.text == "готово"
+
+
+def test_create_stage_message_rejects_long_text():
+    with pytest.raises(DomainError):
+        StageMessage.create(uuid4(), uuid4(), "x" * 256)
@@ -0,0 +1,35 @@
+from src.user_service.calibrate import calibrate
+from src.user_service.domain.services.hasher import Argon2PasswordHasher
+
+
+def linear_cost(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    # 10 мс на проход по 64 МиБ
+    return time_cost * memory_cost / (64 * 1024) * 0.01
+
+
+def test_picks_largest_time_cost_within_target():
+    cost = calibrate(0.035, 64 * 1024, 4, measure=linear_cost)
+    assert (cost.time_cost, cost.memory_cost) == (3, 64 * 1024)
+    assert cost.seconds <= 0.035
+
+
+def test_reduces_memory_when_single_pass_too_slow():
+    cost = calibrate(0.004, 64 * 1024, 4, min_memory_cost=1024, measure=linear_cost)
+    assert (cost.time_cost, cost.memory_cost) == (1, 16 * 1024)
+
+
+def test_memory_not_below_minimum():
+    cost = calibrate(0.0001, 64 * 1024, 4, min_memory_cost=32 * 1024, measure=linear_cost)
+    assert (cost.time_cost, cost.memory_cost) == (1, 32 * 1024)
+
+
+def test_verify_and_update_rehashes_outdated_hash():
+    old = Argon2PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+    current = Argon2PasswordHasher(time_cost=2, memory_cost=1024, parallelism=1)
+    hashed = old.hash("string123")
+
+    assert current.verify_and_update("wrong", hashed) == (False, None)
+    is_valid, new_hash = current.verify_and_update("string123", hashed)
+    assert is_valid
+    assert "t=2" in new_hash
+    assert current.verify_and_update("string123", new_hash) == (True, None)
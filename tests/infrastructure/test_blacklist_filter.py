@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.user_service.application.use_cases.auth import LogoutUserUseCase
+from src.user_service.domain.aggregates.blacklist import BlacklistedToken
+from src.user_service.infrastructure.blacklist_filter import BloomFilter, TokenBlacklistFilter
+from src.user_service.infrastructure.db.postgres.repositories.blacklist import BlacklistRepository
+from src.user_service.presentation.services.jwt import RefreshToken
+
+
+def digest(value: str) -> bytes:
+    return hashlib.sha256(value.encode()).digest()
+
+
+async def digests(values, started: asyncio.Event | None = None, resume: asyncio.Event | None = None):
+    for index, value in enumerate(values):
+        if index == 1 and started is not None:
+            started.set()
+            await resume.wait()
+        yield digest(value)
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(digest(f"token-{i}"))
+
+    assert all(digest(f"token-{i}") in bloom for i in range(10_000))
+    false_positives = sum(digest(f"other-{i}") in bloom for i in range(10_000))
+    assert false_positives < 200
+    assert bloom.false_positive_rate < 0.02
+    assert bloom.nbytes < 16 * 1024
+
+
+@pytest.mark.asyncio
+async def test_unbuilt_filter_defers_to_database():
+    bloom = TokenBlacklistFilter(capacity=100, error_rate=0.01)
+    assert bloom.might_contain(digest("token"))
+
+    await bloom.rebuild(digests(["blacklisted"]), count=1)
+    assert bloom.might_contain(digest("blacklisted"))
+    assert not bloom.might_contain(digest("token"))
+
+
+@pytest.mark.asyncio
+async def test_tokens_added_during_rebuild_are_kept():
+    bloom = TokenBlacklistFilter(capacity=100, error_rate=0.01)
+    started, resume = asyncio.Event(), asyncio.Event()
+    rebuild = asyncio.create_task(bloom.rebuild(digests(["a", "b"], started, resume), count=2))
+    await started.wait()
+    bloom.add(digest("logged-out-meanwhile"))
+    resume.set()
+    await rebuild
+
+    assert bloom.might_contain(digest("logged-out-meanwhile"))
+
+
+class NoQuerySession:
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("БД не должна запрашиваться")
+
+
+@pytest.mark.asyncio
+async def test_negative_answer_skips_database():
+    bloom = TokenBlacklistFilter(capacity=100, error_rate=0.01)
+    await bloom.rebuild(digests([]), count=0)
+    assert not await BlacklistRepository(NoQuerySession(), bloom).exists("token")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_from_table(engine):
+    token = "refresh-token"
+    now = datetime.now(UTC).replace(tzinfo=None)
+    async with AsyncSession(bind=engine) as session:
+        repository = BlacklistRepository(session, TokenBlacklistFilter(capacity=100, error_rate=0.01))
+        await repository.add(BlacklistedToken.create(token, now + timedelta(days=1)))
+        await repository.add(BlacklistedToken.create("expired", now - timedelta(days=1)))
+        await session.commit()
+
+    bloom = TokenBlacklistFilter(capacity=100, error_rate=0.01)
+    async with AsyncSession(bind=engine) as session:
+        repository = BlacklistRepository(session, bloom)
+        await bloom.rebuild(repository.iter_active_digests(), await repository.count_active())
+        assert await repository.exists(token)
+        assert not await repository.exists("other-token")
+
+
+class FakeBlacklist:
+    def __init__(self):
+        self.tokens = []
+
+    async def add(self, token: BlacklistedToken) -> None:
+        self.tokens.append(token)
+
+
+class FakeUoW:
+    def __init__(self):
+        self.blacklist = FakeBlacklist()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb): ...
+
+
+class FailingMessageBus:
+    async def broadcast(self, event) -> None:
+        raise ConnectionError("broker unavailable")
+
+
+@pytest.mark.asyncio
+async def test_logout_succeeds_when_broadcast_fails():
+    uow = FakeUoW()
+    decoded = RefreshToken(token_type="refresh", sub="user", exp=int(time.time()) + 60, iat=int(time.time()))
+
+    response = await LogoutUserUseCase(uow, FailingMessageBus()).execute("refresh-token", decoded)
+
+    assert response.status_code == 200
+    assert [token.token_digest for token in uow.blacklist.tokens] == [BlacklistedToken.digest("refresh-token")]
@@ -0,0 +1,98 @@
+import time
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.user_service.application.use_cases.auth import SweepExpiredTokensUseCase
+from src.user_service.domain.aggregates.blacklist import BlacklistedToken
+from src.user_service.infrastructure.blacklist_filter import TokenBlacklistFilter
+from src.user_service.infrastructure.db.postgres.models import BlacklistedTokenModel
+from src.user_service.infrastructure.db.postgres.repositories.blacklist import BlacklistRepository
+from src.user_service.infrastructure.db.postgres.uow import UserServiceUoW
+
+
+class FakeBlacklist:
+    def __init__(self, expired: int):
+        self.expired = expired
+        self.batches = []
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        deleted = min(self.expired, limit)
+        self.expired -= deleted
+        self.batches.append(deleted)
+        return deleted
+
+
+class FakeBlacklistRows:
+    def __init__(self, tokens: list[BlacklistedToken]):
+        self.tokens = tokens
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        expired = [token for token in self.tokens if token.expires_at <= now][:limit]
+        self.tokens = [token for token in self.tokens if token not in expired]
+        return len(expired)
+
+
+class FakeUoW:
+    def __init__(self, blacklist: FakeBlacklist):
+        self.blacklist = blacklist
+        self.transactions = 0
+
+    async def __aenter__(self):
+        self.transactions += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb): ...
+
+
+@pytest.mark.asyncio
+async def test_sweeps_in_batches_until_short_batch():
+    uow = FakeUoW(FakeBlacklist(expired=25))
+    assert await SweepExpiredTokensUseCase(uow, batch_size=10).execute() == 25
+    assert uow.blacklist.batches == [10, 10, 5]
+    assert uow.transactions == 3
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    # Западнее UTC: наивное локальное время срока жизни раньше UTC на несколько часов
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.asyncio
+async def test_token_survives_sweep_until_exp_in_local_timezone(local_timezone):
+    exp = int(time.time()) + 3600
+    token = BlacklistedToken.create("refresh-token", exp)
+    assert token.expires_at == datetime.fromtimestamp(exp, UTC).replace(tzinfo=None)
+
+    uow = FakeUoW(FakeBlacklistRows([token]))
+    assert await SweepExpiredTokensUseCase(uow, batch_size=10).execute() == 0
+    assert uow.blacklist.tokens == [token]
+
+
+def test_digest_is_fixed_width():
+    token = BlacklistedToken.create("header.payload.signature" * 20, datetime.now(UTC).replace(tzinfo=None))
+    assert len(bytes.fromhex(token.token_digest)) == 32
+
+
+@pytest.mark.asyncio
+async def test_only_expired_rows_deleted(engine):
+    now = datetime.now(UTC).replace(tzinfo=None)
+    async with AsyncSession(bind=engine) as session:
+        repository = BlacklistRepository(session, TokenBlacklistFilter(capacity=100, error_rate=0.01))
+        for i in range(5):
+            await repository.add(BlacklistedToken.create(f"expired-{i}", now - timedelta(minutes=i + 1)))
+        await repository.add(BlacklistedToken.create("active", now + timedelta(days=1)))
+        await session.commit()
+
+    assert await SweepExpiredTokensUseCase(UserServiceUoW(AsyncSession(bind=engine)), batch_size=2).execute() == 5
+
+    async with AsyncSession(bind=engine) as session:
+        digests = (await session.execute(select(BlacklistedTokenModel.token_digest))).scalars().all()
+    assert digests == [bytes.fromhex(BlacklistedToken.digest("active"))]
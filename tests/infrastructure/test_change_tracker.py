@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+from src.project_service.infrastructure.db.postgres.change_tracker import ProjectChangeTracker
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    SubprojectModel,
+    StageModel,
+    MessageModel,
+)
+
+
+def make_project() -> Project:
+    subprojects = [
+        Subproject.create(f"sub-{i}", stages=[Stage.create(f"stage-{j}") for j in range(5)])
+        for i in range(5)
+    ]
+    return Project.create("proj", subprojects=subprojects)
+
+
+def test_untracked_project_is_inserted_parents_first():
+    project = make_project()
+
+    change_set = ProjectChangeTracker().changes(project)
+
+    assert list(change_set.inserts) == [ProjectModel, SubprojectModel, StageModel]
+    assert len(change_set.inserts[StageModel]) == 25
+    assert not change_set.updates and not change_set.deletes
+
+
+def test_unchanged_project_produces_empty_change_set():
+    project = make_project()
+    tracker = ProjectChangeTracker()
+    tracker.track(project)
+
+    assert tracker.changes(project).is_empty
+
+
+def test_stage_status_change_updates_only_changed_columns():
+    project = make_project()
+    stage = project.subprojects[0].stages[0]
+    tracker = ProjectChangeTracker()
+    tracker.track(project)
+
+    project.change_stage_status(stage.id, StageStatus.CONFIRMED, Message.create(text="ok", author_id=uuid4()))
+    change_set = tracker.changes(project)
+
+    assert change_set.inserts == {MessageModel: [change_set.inserts[MessageModel][0]]}
+    assert [row["id"] for row in change_set.updates[StageModel]] == [stage.id]
+    assert set(change_set.updates[StageModel][0]) == {"id", "status", "updated_at"}
+    assert set(change_set.updates) == {ProjectModel, SubprojectModel, StageModel}
+    assert not change_set.deletes
+
+
+def test_removed_subproject_relies_on_cascade_for_children():
+    project = make_project()
+    subproject = project.subprojects[0]
+    tracker = ProjectChangeTracker()
+    tracker.track(project)
+
+    project.remove_subproject(subproject.id)
+    change_set = tracker.changes(project)
+
+    assert change_set.deletes == {SubprojectModel: [subproject.id]}
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.common.exceptions.domain import DomainError
+from src.common.exceptions.application import ApplicationError
+from src.common.exceptions.infrastructure import InfrastructureError
+from src.user_service.application.use_cases.write.user import ChangePasswordUseCase, RegisterUserUseCase
+from src.user_service.domain.aggregates.role import Role
+from src.user_service.domain.aggregates.user import User
+from src.user_service.domain.enities.user_role_assignment import UserRoleAssignment
+from src.user_service.domain.value_objects.hashed_password import HashedPassword
+from src.user_service.infrastructure import hasher as hasher_module
+from src.user_service.infrastructure.hasher import ExecutorPasswordHasher
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_hash_and_verify_in_pool(executor_type):
+    with executor_type(max_workers=1) as executor:
+        hasher = ExecutorPasswordHasher(executor, max_concurrency=1)
+        hashed = await hasher.hash("string123")
+        assert await hasher.verify("string123", hashed)
+        assert not await hasher.verify("string124", hashed)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_capped(monkeypatch):
+    lock = threading.Lock()
+    running = peak = 0
+
+    def slow_hash(password: str) -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return password
+
+    monkeypatch.setattr(hasher_module, "_hash", slow_hash)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        hasher = ExecutorPasswordHasher(executor, max_concurrency=2)
+        await asyncio.gather(*(hasher.hash(f"password-{i}") for i in range(8)))
+    assert peak == 2
+    assert hasher_module.password_hash_queue._value.get() == 0
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked_during_burst():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hasher = ExecutorPasswordHasher(executor, max_concurrency=2)
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(hasher.hash("string123") for _ in range(4)))
+        task.cancel()
+    # Синхронный argon2 в event loop не дал бы ticker выполниться ни разу до конца всей пачки
+    assert ticks > 4
+
+
+class FakeUsers:
+    def __init__(self, user: User | None = None):
+        self.user = user
+        self.saved_hash = None
+
+    async def get(self, user_id):
+        return self.user
+
+    async def get_by_email(self, email):
+        return self.user
+
+    async def update_password_hash(self, user_id, old_hash, new_hash):
+        self.saved_hash = new_hash
+        return True
+
+
+class RacingUsers(FakeUsers):
+    """Проверку email проходит, но вставку отклоняет: параллельная регистрация успела раньше"""
+
+    async def add(self, user: User) -> None:
+        raise InfrastructureError(f"Пользователь с email {user.email} уже существует")
+
+
+class FakeRoles:
+    async def get_by_name(self, name: str) -> Role:
+        return Role.create(name)
+
+
+class FakeUoW:
+    def __init__(self, users: FakeUsers):
+        self.users = users
+        self.roles = FakeRoles()
+        self.is_open = False
+
+    async def __aenter__(self):
+        self.is_open = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.is_open = False
+
+
+class RecordingHasher:
+    """Запоминает вызовы и проверяет, что сессия в этот момент закрыта"""
+
+    def __init__(self, uow: FakeUoW):
+        self.uow = uow
+        self.calls = []
+
+    async def hash(self, password: str) -> str:
+        assert not self.uow.is_open
+        self.calls.append("hash")
+        return f"hashed-{password}"
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        assert not self.uow.is_open
+        self.calls.append("verify")
+        return hashed == f"hashed-{plain}"
+
+
+def make_user(password: str) -> User:
+    return User.create(
+        username="user",
+        email="user@example.com",
+        password=password,
+        repeat_password=password,
+        role_assignment=UserRoleAssignment.create(role_id=uuid4()),
+        hashed_password=HashedPassword(f"hashed-{password}"),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "existing, repeat_password, error",
+    [(None, "other123", DomainError), (make_user("string123"), "string123", ApplicationError)],
+)
+async def test_register_rejected_without_hashing(existing, repeat_password, error):
+    uow = FakeUoW(FakeUsers(existing))
+    hasher = RecordingHasher(uow)
+    with pytest.raises(error):
+        await RegisterUserUseCase(uow, None, hasher).execute("user", "user@example.com", "string123", repeat_password)
+    assert hasher.calls == []
+
+
+@pytest.mark.asyncio
+async def test_register_race_on_email_reported_as_existing_user():
+    uow = FakeUoW(RacingUsers())
+    with pytest.raises(ApplicationError, match="уже существует"):
+        await RegisterUserUseCase(uow, None, RecordingHasher(uow)).execute(
+            "user", "user@example.com", "string123", "string123"
+        )
+
+
+@pytest.mark.asyncio
+async def test_change_password_mismatch_rejected_without_hashing():
+    user = make_user("old-password")
+    uow = FakeUoW(FakeUsers(user))
+    hasher = RecordingHasher(uow)
+    with pytest.raises(DomainError):
+        await ChangePasswordUseCase(uow, hasher).execute(user.id, user.id, "old-password", "new-password", "other")
+    assert hasher.calls == []
+
+
+@pytest.mark.asyncio
+async def test_change_password_hashed_outside_session():
+    user = make_user("old-password")
+    uow = FakeUoW(FakeUsers(user))
+    hasher = RecordingHasher(uow)
+    await ChangePasswordUseCase(uow, hasher).execute(user.id, user.id, "old-password", "new-password", "new-password")
+    assert hasher.calls == ["verify", "hash"]
+    assert uow.users.saved_hash == "hashed-new-password"
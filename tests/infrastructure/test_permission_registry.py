@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.common.litestar_.guards.permission import PermissionGuard
+from src.user_service.presentation.services.jwt import AccessToken, JWTHandler
+from src.user_service.presentation.services.permission_registry import PermissionRegistry, permission_registry
+
+
+def test_encode_decode_roundtrip():
+    registry = PermissionRegistry(["a:read", "a:write", "b:read"])
+    mask = registry.encode(["b:read", "a:read", "b:read"])
+    assert mask == "5"
+    assert registry.decode(mask, registry.version) == {"a:read", "b:read"}
+
+
+def test_decode_rejects_other_version_and_unknown_bits():
+    registry = PermissionRegistry(["a:read", "a:write"])
+    with pytest.raises(ValueError):
+        registry.decode("1", "00000000")
+    with pytest.raises(ValueError):
+        registry.decode("4", registry.version)
+
+
+def test_load_keeps_builtin_positions():
+    registry = PermissionRegistry(["a:read", "a:write"])
+    builtin_mask = registry.encode(["a:write"])
+    old_version = registry.version
+
+    registry.load(["z:read", "a:write", "c:read"])
+    assert registry.codes == ("a:read", "a:write", "c:read", "z:read")
+    assert registry.encode(["a:write"]) == builtin_mask
+    assert registry.version != old_version
+
+    # Порядок кодов из БД не влияет на версию
+    other = PermissionRegistry(["a:read", "a:write"])
+    other.load(["c:read", "z:read"])
+    assert other.version == registry.version
+
+
+def test_access_token_carries_permission_mask():
+    role = SimpleNamespace(
+        name="admin",
+        permissions=[SimpleNamespace(code=code) for code in permission_registry.codes[:3]],
+    )
+    user = SimpleNamespace(id="user", role_assignments=[SimpleNamespace(role=role), SimpleNamespace(role=role)])
+    handler = JWTHandler("secret", "HS256")
+
+    decoded = handler.decode_token(handler.create_access_token(user))
+    assert isinstance(decoded, AccessToken)
+    assert decoded.roles == ["admin"]
+    assert decoded.permissions == frozenset(permission_registry.codes[:3])
+
+
+def test_guard_checks_any_of_codes():
+    guard = PermissionGuard(["projects:read", "projects:write"])
+    assert guard.has_permission(frozenset({"projects:write"}))
+    assert not guard.has_permission(frozenset({"stages:read"}))
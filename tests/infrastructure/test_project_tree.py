@@ -0,0 +1,56 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.exceptions.infrastructure import InfrastructureError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.infrastructure.db.postgres.models import ProjectModel
+from src.project_service.infrastructure.db.postgres.repositories.project import (
+    ProjectRepository,
+    ProjectReadRepository,
+)
+
+
+def test_tree_document_reads_only_projects_in_outer_query():
+    # Дочерние уровни - коррелированные подзапросы, документ собирается одним запросом по строке проекта
+    stmt = select(ProjectReadRepository._project_tree_document())
+    assert stmt.get_final_froms() == [ProjectModel.__table__]
+
+
+@pytest.mark.asyncio
+async def test_tree_json_matches_aggregate(engine):
+    author_id = uuid4()
+    stages = [Stage.create(f"stage-{i}") for i in range(3)]
+    for stage in stages:
+        stage.add_message(Message.create(author_id, "сообщение"))
+    stages[0].add_file("plan.txt", "text/plain", 10, f"stages/{stages[0].id}/plan.txt")
+    project = Project.create("proj", subprojects=[Subproject.create("sub", stages=stages), Subproject.create("empty")])
+
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+
+    async with AsyncSession(bind=engine) as session:
+        loaded = await ProjectRepository(session).get(project.id)
+        tree = json.loads(await ProjectReadRepository(session).get_project_tree_json(project.id))
+        with pytest.raises(InfrastructureError):
+            await ProjectReadRepository(session).get_project_tree_json(uuid4())
+
+    assert tree["id"] == str(loaded.id)
+    assert tree["template"] is None
+    assert {sub["id"] for sub in tree["subprojects"]} == {str(sub.id) for sub in loaded.subprojects}
+    subprojects = {sub["name"]: sub for sub in tree["subprojects"]}
+    assert subprojects["empty"]["stages"] == []
+    assert [stage["id"] for stage in subprojects["sub"]["stages"]] == [str(stage.id) for stage in stages]
+    first_stage = subprojects["sub"]["stages"][0]
+    assert [file["filename"] for file in first_stage["files"]] == ["plan.txt"]
+    assert [(message["author_id"], message["text"]) for message in first_stage["messages"]] == [
+        (str(author_id), "сообщение")
+    ]
+
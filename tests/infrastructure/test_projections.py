@@ -0,0 +1,137 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.exceptions.domain import DomainError
+from src.common.exceptions.infrastructure import InfrastructureError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus, ProjectStatus
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectSummaryModel,
+    SubprojectSummaryModel,
+    StageCardModel,
+    StageModel,
+)
+from src.project_service.infrastructure.db.postgres.repositories.project import (
+    ProjectRepository,
+    ProjectReadRepository,
+)
+from src.project_service.infrastructure.db.postgres.repositories.projection import ProjectionRepository
+
+
+@pytest.mark.parametrize(
+    "stmt, table",
+    [
+        (ProjectReadRepository._projects_query(), ProjectSummaryModel.__table__),
+        (ProjectReadRepository._subprojects_query(project_id=uuid4()), SubprojectSummaryModel.__table__),
+        (ProjectReadRepository._stages_query(subproject_id=uuid4()), StageCardModel.__table__),
+    ],
+)
+def test_list_queries_read_single_projection_table(stmt, table):
+    assert stmt.get_final_froms() == [table]
+
+
+@pytest.mark.asyncio
+async def test_projections_follow_write_side(engine):
+    stages = [Stage.create(f"stage-{i}") for i in range(2)]
+    project = Project.create("proj", subprojects=[Subproject.create("sub", stages=stages)])
+    author_id = uuid4()
+
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        await ProjectRepository(session).add(project)
+        await ProjectionRepository(session).refresh_project_tree(project.id)
+        await session.commit()
+
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        repository = ProjectRepository(session)
+        projections = ProjectionRepository(session)
+        project = await repository.get_slice_by_stage(stages[0].id)
+        project.change_stage_status(stages[0].id, StageStatus.COMPLETED, Message.create(author_id, "готово"))
+        await repository.update(project)
+        await projections.refresh_stage_lineage(stages[0].id)
+        await projections.set_author_name(author_id, "author")
+        await session.commit()
+
+    async with AsyncSession(bind=engine) as session:
+        summary = await session.get(ProjectSummaryModel, project.id)
+        subproject = await session.get(SubprojectSummaryModel, project.subprojects[0].id)
+        card = await session.get(StageCardModel, stages[0].id)
+
+    assert (summary.subprojects_count, summary.status) == (1, ProjectStatus.IN_PROGRESS)
+    assert (subproject.stages_count, subproject.completed_stages_count, subproject.progress) == (2, 1, 0.5)
+    assert (card.status, card.messages_count, card.last_message_text) == (StageStatus.COMPLETED, 1, "готово")
+    assert card.last_message_author_name == "author"
+
+    async with AsyncSession(bind=engine) as session:
+        projections = ProjectionRepository(session)
+        # Повторная обработка события не должна сбрасывать имя автора
+        await projections.refresh_stage_lineage(stages[0].id)
+        card = await session.get(StageCardModel, stages[0].id)
+        assert card.last_message_author_name == "author"
+
+        await projections.remove_project(project.id)
+        assert (await session.execute(select(StageCardModel))).scalars().all() == []
+        assert (await session.execute(select(SubprojectSummaryModel))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_slice_by_stages_loads_only_touched_subprojects(engine):
+    subprojects = [
+        Subproject.create(f"sub-{i}", stages=[Stage.create(f"stage-{j}") for j in range(2)]) for i in range(4)
+    ]
+    project = Project.create("proj", subprojects=subprojects)
+    other = Project.create("other", subprojects=[Subproject.create("sub", stages=[Stage.create("stage")])])
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        await ProjectRepository(session).add(project)
+        await ProjectRepository(session).add(other)
+        await session.commit()
+
+    first, second = subprojects[0].stages[0], subprojects[2].stages[1]
+    async with AsyncSession(bind=engine) as session:
+        repository = ProjectRepository(session)
+        loaded = await repository.get_slice_by_stages([first.id, second.id])
+        assert {subproject.id for subproject in loaded.subprojects} == {subprojects[0].id, subprojects[2].id}
+        assert loaded.unloaded_subprojects.total == 2
+
+        loaded.change_stage_statuses([(stage.id, StageStatus.IN_PROGRESS, None) for stage in (first, second)])
+        await repository.update(loaded)
+        await session.commit()
+
+    async with AsyncSession(bind=engine) as session:
+        repository = ProjectRepository(session)
+        with pytest.raises(DomainError):
+            await repository.get_slice_by_stages([first.id, other.subprojects[0].stages[0].id])
+        with pytest.raises(InfrastructureError):
+            await repository.get_slice_by_stages([uuid4()])
+
+@pytest.mark.asyncio
+async def test_batch_refresh_touches_only_batch_lineage(engine):
+    subprojects = [Subproject.create(f"sub-{i}", stages=[Stage.create("stage")]) for i in range(2)]
+    project = Project.create("proj", subprojects=subprojects)
+    changed, untouched = subprojects[0].stages[0], subprojects[1].stages[0]
+
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        await ProjectRepository(session).add(project)
+        await ProjectionRepository(session).refresh_project_tree(project.id)
+        await session.commit()
+
+    async with AsyncSession(bind=engine) as session:
+        repository = ProjectRepository(session)
+        loaded = await repository.get_slice_by_stages([changed.id])
+        loaded.change_stage_statuses([(changed.id, StageStatus.COMPLETED, None)])
+        await repository.update(loaded)
+        # Строка этапа вне пакета меняется в обход проекций: пересчет пакета не должен ее подхватить
+        await session.execute(update(StageModel).where(StageModel.id == untouched.id).values(name="renamed"))
+        await ProjectionRepository(session).refresh_stages_lineage([changed.id], project.id)
+        await session.commit()
+
+    async with AsyncSession(bind=engine) as session:
+        assert (await session.get(StageCardModel, changed.id)).status == StageStatus.COMPLETED
+        assert (await session.get(StageCardModel, untouched.id)).name == "stage"
+        assert (await session.get(SubprojectSummaryModel, subprojects[0].id)).completed_stages_count == 1
+        assert (await session.get(ProjectSummaryModel, project.id)).completed_subprojects_count == 1
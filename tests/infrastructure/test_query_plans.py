@@ -0,0 +1,151 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.db.keyset import Keyset
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.message import Message
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.stage_status_history import StageStatusHistory
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+from src.project_service.infrastructure.db.postgres.repositories.project import (
+    ProjectRepository,
+    ProjectReadRepository,
+)
+from src.project_service.infrastructure.db.postgres.repositories.projection import ProjectionRepository
+from src.project_service.infrastructure.db.postgres.repositories.stage_status_history import (
+    StageStatusHistoryRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_project(index: int) -> Project:
+    subprojects = [
+        Subproject.create(
+            f"sub-{index}-{i}",
+            stages=[Stage.create(f"stage-{index}-{i}-{j}") for j in range(5)],
+        )
+        for i in range(5)
+    ]
+    return Project.create(f"proj-{index}", subprojects=subprojects)
+
+
+@pytest_asyncio.fixture
+async def seeded(engine):
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        repository = ProjectRepository(session)
+        projections = ProjectionRepository(session)
+        history = StageStatusHistoryRepository(session)
+        projects = [make_project(i) for i in range(20)]
+        started = datetime(2025, 1, 1)
+        for project in projects:
+            for subproject in project.subprojects:
+                for stage in subproject.stages:
+                    stage.add_message(Message.create(author_id=project.id, text="message"))
+                    for minutes in range(3):
+                        await history.add(
+                            StageStatusHistory.create(
+                                stage_id=stage.id,
+                                changed_by=project.id,
+                                to_status=StageStatus.IN_PROGRESS,
+                                changed_at=started + timedelta(minutes=minutes),
+                            )
+                        )
+            await repository.add(project)
+            await projections.refresh_project_tree(project.id)
+        await session.commit()
+
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE"))
+        await conn.commit()
+
+    return engine, projects
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = [plan.get("Relation Name", "?")] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def assert_no_seq_scan(engine, call):
+    """Выполняет вызов репозитория и проверяет планы всех отправленных им запросов"""
+    statements: list[tuple[str, object]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    async with AsyncSession(bind=engine) as session:
+        # Без этого на маленькой выборке планировщик честно предпочтёт seq scan даже при наличии индекса
+        await session.execute(text("SET enable_seqscan = off"))
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            await call(session)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert statements
+        conn = await session.connection()
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            assert not seq_scans(plan[0]["Plan"]), f"Seq Scan в плане запроса:\n{statement}"
+
+
+async def test_project_lists_use_indexes(seeded):
+    engine, projects = seeded
+    after = Keyset(timestamp=projects[10].created_at, id=projects[10].id)
+
+    await assert_no_seq_scan(engine, lambda s: ProjectReadRepository(s).get_projects(10, 0))
+    await assert_no_seq_scan(engine, lambda s: ProjectReadRepository(s).get_projects_after(10, after))
+
+
+async def test_subproject_and_stage_lists_use_indexes(seeded):
+    engine, projects = seeded
+    subproject = projects[0].subprojects[0]
+    subproject_after = Keyset(timestamp=subproject.updated_at, id=subproject.id)
+    stage = subproject.stages[0]
+    stage_after = Keyset(timestamp=stage.updated_at, id=stage.id)
+
+    await assert_no_seq_scan(
+        engine, lambda s: ProjectReadRepository(s).get_subprojects(10, 0, project_id=projects[0].id)
+    )
+    await assert_no_seq_scan(engine, lambda s: ProjectReadRepository(s).get_subprojects_after(10, subproject_after))
+    await assert_no_seq_scan(
+        engine, lambda s: ProjectReadRepository(s).get_stages(10, 0, subproject_id=subproject.id)
+    )
+    await assert_no_seq_scan(engine, lambda s: ProjectReadRepository(s).get_stages_after(10, stage_after))
+    await assert_no_seq_scan(engine, lambda s: ProjectReadRepository(s).get_stage(stage.id))
+    await assert_no_seq_scan(
+        engine, lambda s: ProjectReadRepository(s).get_messages_after(10, None, stage_id=stage.id)
+    )
+
+
+async def test_status_history_uses_index(seeded):
+    engine, projects = seeded
+    stage_id = projects[0].subprojects[0].stages[0].id
+
+    await assert_no_seq_scan(engine, lambda s: StageStatusHistoryRepository(s).get_many(10, 0, stage_id=stage_id))
+    await assert_no_seq_scan(
+        engine, lambda s: StageStatusHistoryRepository(s).get_many_after(10, None, stage_id=stage_id)
+    )
+
+
+async def test_aggregate_loading_uses_indexes(seeded):
+    engine, projects = seeded
+    stage_id = projects[0].subprojects[0].stages[0].id
+
+    await assert_no_seq_scan(engine, lambda s: ProjectRepository(s).get_by_stage(stage_id))
+    await assert_no_seq_scan(engine, lambda s: ProjectRepository(s).get_slice_by_stage(stage_id))
+    await assert_no_seq_scan(engine, lambda s: ProjectRepository(s).get_slice_by_stages([stage_id]))
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy.orm import ColumnProperty
+
+from src.common.db.page import columns_for
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectSummaryModel,
+    SubprojectModel,
+    SubprojectSummaryModel,
+    StageCardModel,
+    ProjectFileAttachmentModel,
+)
+from src.project_service.infrastructure.read_models.file_attachment import FileAttachmentRead
+from src.project_service.infrastructure.read_models.project import ProjectSummaryRead
+from src.project_service.infrastructure.read_models.stage import StageCardRead
+from src.project_service.infrastructure.read_models.subproject import SubprojectRead, SubprojectSummaryRead
+
+
+@pytest.mark.parametrize(
+    "model, row_type",
+    [
+        (ProjectSummaryModel, ProjectSummaryRead),
+        (SubprojectSummaryModel, SubprojectSummaryRead),
+        (SubprojectModel, SubprojectRead),
+        (StageCardModel, StageCardRead),
+        (ProjectFileAttachmentModel, FileAttachmentRead),
+    ],
+)
+def test_row_type_fields_are_plain_columns(model, row_type):
+    columns = columns_for(model, row_type)
+
+    assert all(isinstance(column.property, ColumnProperty) for column in columns)
+    assert [column.key for column in columns] == list(row_type.__dataclass_fields__)
@@ -0,0 +1,83 @@
+import random
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.domain.value_objects.enums import StageStatus
+from src.project_service.infrastructure.db.postgres.models import (
+    ProjectModel,
+    SubprojectModel,
+    StageModel,
+    MessageModel,
+    StageCardModel,
+    SubprojectSummaryModel,
+)
+from src.seed import COLUMNS, SeedShape, generate_projects, chunks
+
+
+@pytest.mark.parametrize("model", list(COLUMNS))
+def test_columns_cover_table(model):
+    assert set(COLUMNS[model]) == {column.name for column in model.__table__.columns}
+
+
+def test_generated_rows_follow_shape_and_foreign_keys():
+    shape = SeedShape(projects=2, subprojects=3, stages=4, messages=2, files=1, users=2, history=1)
+    authors = [(uuid4(), "author")]
+
+    rows = generate_projects(shape, authors, 0, shape.projects, random.Random(0))
+
+    assert len(rows[ProjectModel]) == 2
+    assert len(rows[SubprojectModel]) == 2 * 3
+    assert len(rows[StageModel]) == len(rows[StageCardModel]) == 2 * 3 * 4
+    assert len(rows[MessageModel]) == 2 * 3 * 4 * 2
+    for model, records in rows.items():
+        assert all(len(record) == len(COLUMNS[model]) for record in records)
+
+    subproject_ids = {row[0] for row in rows[SubprojectModel]}
+    assert {row[-1] for row in rows[StageModel]} == subproject_ids
+
+    completed = Counter(row[-1] for row in rows[StageModel] if row[5] == StageStatus.COMPLETED)
+    for summary in rows[SubprojectSummaryModel]:
+        assert summary[COLUMNS[SubprojectSummaryModel].index("completed_stages_count")] == completed[summary[0]]
+
+
+def load_project(rows, project_row) -> Project:
+    """Агрегат из сгенерированных строк со статусами, пересчитанными по правилам домена"""
+    subprojects = []
+    for subproject_row in rows[SubprojectModel]:
+        if subproject_row[-1] != project_row[0]:
+            continue
+        stages = []
+        for stage_row in rows[StageModel]:
+            if stage_row[-1] == subproject_row[0]:
+                stage = Stage.create(stage_row[1])
+                stage.status = stage_row[5]
+                stages.append(stage)
+        subproject = Subproject.create(subproject_row[1], stages=stages)
+        subproject._update_status()
+        subprojects.append(subproject)
+    project = Project.create(project_row[1], subprojects=subprojects)
+    project._update_status()
+    return project
+
+
+@pytest.mark.parametrize("subprojects, stages", [(3, 2), (2, 0), (0, 0)])
+def test_seeded_statuses_match_domain_rules(subprojects, stages):
+    shape = SeedShape(projects=20, subprojects=subprojects, stages=stages, messages=0, files=0, users=0, history=0)
+    rows = generate_projects(shape, [], 0, shape.projects, random.Random(0))
+
+    for project_row in rows[ProjectModel]:
+        project = load_project(rows, project_row)
+        assert (project_row[5], project_row[6]) == (project.status, project.progress)
+        seeded = [row for row in rows[SubprojectModel] if row[-1] == project_row[0]]
+        assert [(row[5], row[6]) for row in seeded] == [
+            (subproject.status, subproject.progress) for subproject in project.subprojects
+        ]
+
+
+def test_chunks_cover_all_projects():
+    assert list(chunks(250, 100)) == [(0, 100), (100, 100), (200, 50)]
@@ -0,0 +1,49 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.exceptions.infrastructure import InfrastructureError
+from src.project_service.domain.aggregates.project import Project
+from src.project_service.domain.aggregates.stage_message import StageMessage
+from src.project_service.domain.entities.stage import Stage
+from src.project_service.domain.entities.subproject import Subproject
+from src.project_service.infrastructure.db.postgres.models import MessageModel
+from src.project_service.infrastructure.db.postgres.repositories.project import ProjectRepository
+from src.project_service.infrastructure.db.postgres.repositories.stage_message import StageMessageRepository
+
+
+@pytest.mark.asyncio
+async def test_message_is_added_with_single_insert(engine):
+    stage = Stage.create("stage")
+    project = Project.create("proj", subprojects=[Subproject.create("sub", stages=[stage])])
+    async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+        await ProjectRepository(session).add(project)
+        await session.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    message = StageMessage.create(stage.id, uuid4(), "сообщение")
+    async with AsyncSession(bind=engine) as session:
+        await session.connection()
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            await StageMessageRepository(session).add(message)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        await session.commit()
+
+        assert len(statements) == 1 and statements[0].lstrip().upper().startswith("INSERT")
+        stored = (await session.execute(select(MessageModel.stage_id, MessageModel.text))).one()
+        assert tuple(stored) == (stage.id, "сообщение")
+
+
+@pytest.mark.asyncio
+async def test_message_for_missing_stage_is_rejected(engine):
+    async with AsyncSession(bind=engine) as session:
+        with pytest.raises(InfrastructureError):
+            await StageMessageRepository(session).add(StageMessage.create(uuid4(), uuid4(), "сообщение"))
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+from jose import jwt
+from litestar.exceptions import HTTPException
+
+from src.user_service.presentation.services.jwt import AccessToken, RefreshToken, JWTHandler
+from src.user_service.presentation.services.permission_registry import permission_registry
+from src.user_service.presentation.services.token_cache import VerifiedTokenCache
+
+SECRET_KEY = "secret"
+
+
+class CountingHandler(JWTHandler):
+    def __init__(self):
+        super().__init__(SECRET_KEY, "HS256")
+        self.calls = 0
+
+    def decode_token(self, token: str):
+        self.calls += 1
+        return super().decode_token(token)
+
+
+def make_token(token_type: str = "access", sub: str = "user", exp: int | None = None) -> str:
+    now = int(time.time())
+    payload = {"token_type": token_type, "sub": sub, "exp": exp or now + 60, "iat": now}
+    if token_type == "access":
+        payload |= {
+            "roles": ["admin"],
+            "perms": permission_registry.encode(["projects:read"]),
+            "pv": permission_registry.version,
+        }
+    return jwt.encode(payload, SECRET_KEY, algorithm="HS256")
+
+
+def test_access_token_verified_once():
+    handler = CountingHandler()
+    cache = VerifiedTokenCache(maxsize=10, handler=handler)
+    token = make_token()
+
+    first = cache.decode_token(token)
+    assert isinstance(first, AccessToken)
+    assert cache.decode_token(token) is first
+    assert handler.calls == 1
+
+
+def test_refresh_and_invalid_tokens_not_cached():
+    handler = CountingHandler()
+    cache = VerifiedTokenCache(maxsize=10, handler=handler)
+    refresh = make_token("refresh")
+
+    assert isinstance(cache.decode_token(refresh), RefreshToken)
+    cache.decode_token(refresh)
+    with pytest.raises(HTTPException):
+        cache.decode_token(refresh + "x")
+    assert handler.calls == 3
+    assert len(cache) == 0
+
+
+def test_entry_expires_at_token_exp():
+    now = int(time.time())
+    handler = CountingHandler()
+    clock = [float(now)]
+    cache = VerifiedTokenCache(maxsize=10, handler=handler, clock=lambda: clock[0])
+    token = make_token(exp=now + 30)
+
+    cache.decode_token(token)
+    clock[0] = now + 30
+    # Запись устарела: токен проверяется заново (и jose сам отклонит его, когда истечет exp)
+    cache.decode_token(token)
+    assert handler.calls == 2
+
+
+def test_least_recently_used_evicted():
+    handler = CountingHandler()
+    cache = VerifiedTokenCache(maxsize=2, handler=handler)
+    first, second, third = (make_token(sub=f"user-{i}") for i in range(3))
+
+    cache.decode_token(first)
+    cache.decode_token(second)
+    cache.decode_token(first)
+    cache.decode_token(third)
+    assert len(cache) == 2
+
+    cache.decode_token(first)
+    assert handler.calls == 3
+    cache.decode_token(second)
+    assert handler.calls == 4
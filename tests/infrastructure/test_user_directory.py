@@ -0,0 +1,91 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.user_service.infrastructure.user_directory import UserDirectory
+
+
+class FakeUsersRead:
+    def __init__(self, usernames: dict):
+        self.usernames = usernames
+        self.calls = []
+        self.started = asyncio.Event()
+        self.resume: asyncio.Event | None = None
+
+    async def get_usernames(self, user_ids=None, limit=None):
+        self.calls.append(user_ids)
+        if self.resume is not None:
+            self.started.set()
+            await self.resume.wait()
+        ids = list(self.usernames) if user_ids is None else user_ids
+        return {user_id: self.usernames[user_id] for user_id in ids[:limit] if user_id in self.usernames}
+
+
+class FakeUoW:
+    def __init__(self, users_read: FakeUsersRead):
+        self.users_read = users_read
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb): ...
+
+
+@pytest.mark.asyncio
+async def test_misses_loaded_in_one_query_then_served_from_memory():
+    first, second, unknown = uuid4(), uuid4(), uuid4()
+    uow = FakeUoW(FakeUsersRead({first: "first", second: "second"}))
+    directory = UserDirectory(maxsize=10)
+
+    assert await directory.get_many([first, second, unknown, first], uow) == {first: "first", second: "second"}
+    assert await directory.get_many([second, first], uow) == {second: "second", first: "first"}
+    # Неизвестный пользователь не кэшируется и запрашивается снова
+    await directory.get_many([unknown], uow)
+    assert uow.users_read.calls == [[first, second, unknown], [unknown]]
+
+
+@pytest.mark.asyncio
+async def test_warm_and_invalidate():
+    user_id = uuid4()
+    users_read = FakeUsersRead({user_id: "old"})
+    uow = FakeUoW(users_read)
+    directory = UserDirectory(maxsize=10)
+    await directory.warm(uow)
+
+    users_read.usernames[user_id] = "new"
+    assert await directory.get_many([user_id], uow) == {user_id: "old"}
+    directory.invalidate(user_id)
+    assert await directory.get_many([user_id], uow) == {user_id: "new"}
+
+
+@pytest.mark.asyncio
+async def test_load_started_before_invalidation_not_cached():
+    user_id = uuid4()
+    users_read = FakeUsersRead({user_id: "old"})
+    users_read.resume = asyncio.Event()
+    uow = FakeUoW(users_read)
+    directory = UserDirectory(maxsize=10)
+
+    load = asyncio.create_task(directory.get_many([user_id], uow))
+    await users_read.started.wait()
+    directory.invalidate(user_id)
+    users_read.resume.set()
+    assert await load == {user_id: "old"}
+
+    users_read.resume = None
+    users_read.usernames[user_id] = "new"
+    assert await directory.get_many([user_id], uow) == {user_id: "new"}
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_evicted():
+    ids = [uuid4() for _ in range(3)]
+    uow = FakeUoW(FakeUsersRead({user_id: str(i) for i, user_id in enumerate(ids)}))
+    directory = UserDirectory(maxsize=2)
+
+    await directory.get_many(ids[:2], uow)
+    await directory.get_many(ids[:1], uow)
+    await directory.get_many(ids[2:], uow)
+    await directory.get_many(ids[:1], uow)
+    assert uow.users_read.calls[-1] == ids[2:]